@@ -5,7 +5,7 @@ from core_entities.experiment import Experiment
 from repeater.repeater_selector import RepeaterOrchestration
 from repeater.quantity_based import QuantityBasedType as RMQuantityBasedType
 from repeater.acceptable_error_based import AcceptableErrorBasedType
-from stop_condition.stop_condition_selector import launch_stop_condition_threads
+from stop_condition.stop_condition_selector import build_stop_condition_validator
 from stop_condition.bad_configuration_based import BadConfigurationBasedType
 from stop_condition.guaranteed import GuaranteedType
 from stop_condition.time_based import TimeBased
@@ -48,9 +48,9 @@ class TestInput:
         experiment = Experiment(experiment_description, search_space)
         Configuration.set_task_config(experiment.description["Context"]["TaskConfiguration"])
         assert experiment.description["Context"]["TaskConfiguration"]["TaskName"] == expected_experiment
-        # launch_stop_condition_threads without threading
-        activatedSCs = launch_stop_condition_threads(experiment_id=experiment.unique_id,experiment=experiment)
-        assert isinstance(activatedSCs[0], BadConfigurationBasedType)
+        # stop conditions and their validator
+        stop_condition_validator = build_stop_condition_validator(experiment_id=experiment.unique_id,experiment=experiment)
+        assert isinstance(stop_condition_validator.stop_conditions[0], BadConfigurationBasedType)
         # repetition management
         r = RepeaterOrchestration(experiment_id=experiment.unique_id, experiment=experiment)
         assert isinstance(r.get_repeater(), RMQuantityBasedType)
@@ -92,9 +92,9 @@ class TestInput:
         experiment = Experiment(experiment_description, search_space)
         Configuration.set_task_config(experiment.description["Context"]["TaskConfiguration"])
         assert experiment.description["Context"]["TaskConfiguration"]["TaskName"] == expected_experiment
-        # launch_stop_condition_threads without threading
-        activatedSCs = launch_stop_condition_threads(experiment_id=experiment.unique_id,experiment=experiment)
-        assert isinstance(activatedSCs[0], TimeBased)
+        # stop conditions and their validator
+        stop_condition_validator = build_stop_condition_validator(experiment_id=experiment.unique_id,experiment=experiment)
+        assert isinstance(stop_condition_validator.stop_conditions[0], TimeBased)
         # repetition management
         r = RepeaterOrchestration(experiment_id=experiment.unique_id, experiment=experiment)
         assert isinstance(r.get_repeater(), AcceptableErrorBasedType)
@@ -131,9 +131,9 @@ class TestInput:
         experiment = Experiment(experiment_description, search_space)
         Configuration.set_task_config(experiment.description["Context"]["TaskConfiguration"])
         assert experiment.description["Context"]["TaskConfiguration"]["TaskName"] == expected_experiment
-        # launch_stop_condition_threads without threading
-        activatedSCs = launch_stop_condition_threads(experiment_id=experiment.unique_id,experiment=experiment)
-        assert isinstance(activatedSCs[0], GuaranteedType)
+        # stop conditions and their validator
+        stop_condition_validator = build_stop_condition_validator(experiment_id=experiment.unique_id,experiment=experiment)
+        assert isinstance(stop_condition_validator.stop_conditions[0], GuaranteedType)
         # repetition management
         r = RepeaterOrchestration(experiment_id=experiment.unique_id, experiment=experiment)
         assert isinstance(r.get_repeater(), RMQuantityBasedType)
@@ -169,9 +169,9 @@ class TestInput:
         experiment = Experiment(experiment_description, search_space)
         Configuration.set_task_config(experiment.description["Context"]["TaskConfiguration"])
         assert experiment.description["Context"]["TaskConfiguration"]["TaskName"] == expected_experiment
-        # launch_stop_condition_threads without threading
-        activatedSCs = launch_stop_condition_threads(experiment_id=experiment.unique_id,experiment=experiment)
-        assert isinstance(activatedSCs[0], BadConfigurationBasedType)
+        # stop conditions and their validator
+        stop_condition_validator = build_stop_condition_validator(experiment_id=experiment.unique_id,experiment=experiment)
+        assert isinstance(stop_condition_validator.stop_conditions[0], BadConfigurationBasedType)
         # repetition management
         r = RepeaterOrchestration(experiment_id=experiment.unique_id, experiment=experiment)
         assert isinstance(r.get_repeater(), AcceptableErrorBasedType)
@@ -205,9 +205,9 @@ class TestInput:
         experiment = Experiment(experiment_description, search_space)
         Configuration.set_task_config(experiment.description["Context"]["TaskConfiguration"])
         assert experiment.description["Context"]["TaskConfiguration"]["TaskName"] == expected_experiment
-        # launch_stop_condition_threads without threading
-        activatedSCs = launch_stop_condition_threads(experiment_id=experiment.unique_id, experiment=experiment)
-        assert isinstance(activatedSCs[0], FewShotLearningBased)
+        # stop conditions and their validator
+        stop_condition_validator = build_stop_condition_validator(experiment_id=experiment.unique_id, experiment=experiment)
+        assert isinstance(stop_condition_validator.stop_conditions[0], FewShotLearningBased)
         # repetition management
         r = RepeaterOrchestration(experiment_id=experiment.unique_id, experiment=experiment)
         assert isinstance(r.get_repeater(), AcceptableErrorBasedType)
@@ -245,9 +245,9 @@ class TestInput:
         experiment = Experiment(experiment_description, search_space)
         Configuration.set_task_config(experiment.description["Context"]["TaskConfiguration"])
         assert experiment.description["Context"]["TaskConfiguration"]["TaskName"] == expected_experiment
-        # launch_stop_condition_threads without threading
-        activatedSCs = launch_stop_condition_threads(experiment_id=experiment.unique_id,experiment=experiment)
-        assert isinstance(activatedSCs[0], TimeBased)
+        # stop conditions and their validator
+        stop_condition_validator = build_stop_condition_validator(experiment_id=experiment.unique_id,experiment=experiment)
+        assert isinstance(stop_condition_validator.stop_conditions[0], TimeBased)
         # repetition management
         r = RepeaterOrchestration(experiment_id=experiment.unique_id, experiment=experiment)
         assert isinstance(r.get_repeater(), AcceptableErrorBasedType)
@@ -281,9 +281,9 @@ class TestInput:
         experiment = Experiment(experiment_description, search_space)
         Configuration.set_task_config(experiment.description["Context"]["TaskConfiguration"])
         assert experiment.description["Context"]["TaskConfiguration"]["TaskName"] == expected_experiment
-        # launch_stop_condition_threads without threading
-        activatedSCs = launch_stop_condition_threads(experiment_id=experiment.unique_id, experiment=experiment)
-        assert isinstance(activatedSCs[0], GuaranteedType)
+        # stop conditions and their validator
+        stop_condition_validator = build_stop_condition_validator(experiment_id=experiment.unique_id, experiment=experiment)
+        assert isinstance(stop_condition_validator.stop_conditions[0], GuaranteedType)
         # repetition management
         r = RepeaterOrchestration(experiment_id=experiment.unique_id, experiment=experiment)
         assert isinstance(r.get_repeater(), RMQuantityBasedType)
@@ -317,9 +317,9 @@ class TestInput:
         experiment = Experiment(experiment_description, search_space)
         Configuration.set_task_config(experiment.description["Context"]["TaskConfiguration"])
         assert experiment.description["Context"]["TaskConfiguration"]["TaskName"] == expected_experiment
-        # launch_stop_condition_threads without threading
-        activatedSCs = launch_stop_condition_threads(experiment_id=experiment.unique_id, experiment=experiment)
-        assert isinstance(activatedSCs[0], GuaranteedType)
+        # stop conditions and their validator
+        stop_condition_validator = build_stop_condition_validator(experiment_id=experiment.unique_id, experiment=experiment)
+        assert isinstance(stop_condition_validator.stop_conditions[0], GuaranteedType)
         # repetition management
         r = RepeaterOrchestration(experiment_id=experiment.unique_id, experiment=experiment)
         assert isinstance(r.get_repeater(), AcceptableErrorBasedType)
@@ -357,9 +357,9 @@ class TestInput:
         experiment = Experiment(experiment_description, search_space)
         Configuration.set_task_config(experiment.description["Context"]["TaskConfiguration"])
         assert experiment.description["Context"]["TaskConfiguration"]["TaskName"] == expected_experiment
-        # launch_stop_condition_threads without threading
-        activatedSCs = launch_stop_condition_threads(experiment_id=experiment.unique_id, experiment=experiment)
-        assert isinstance(activatedSCs[0], TimeBased)
+        # stop conditions and their validator
+        stop_condition_validator = build_stop_condition_validator(experiment_id=experiment.unique_id, experiment=experiment)
+        assert isinstance(stop_condition_validator.stop_conditions[0], TimeBased)
         # repetition management
         r = RepeaterOrchestration(experiment_id=experiment.unique_id, experiment=experiment)
         assert isinstance(r.get_repeater(), RMQuantityBasedType)
@@ -392,9 +392,9 @@ class TestInput:
         experiment = Experiment(experiment_description, search_space)
         Configuration.set_task_config(experiment.description["Context"]["TaskConfiguration"])
         assert experiment.description["Context"]["TaskConfiguration"]["TaskName"] == expected_experiment
-        # launch_stop_condition_threads without threading
-        activatedSCs = launch_stop_condition_threads(experiment_id=experiment.unique_id, experiment=experiment)
-        assert isinstance(activatedSCs[0], FewShotLearningBased)
+        # stop conditions and their validator
+        stop_condition_validator = build_stop_condition_validator(experiment_id=experiment.unique_id, experiment=experiment)
+        assert isinstance(stop_condition_validator.stop_conditions[0], FewShotLearningBased)
         # repetition management
         r = RepeaterOrchestration(experiment_id=experiment.unique_id, experiment=experiment)
         assert isinstance(r.get_repeater(), RMQuantityBasedType)
@@ -436,9 +436,9 @@ class TestInput:
         experiment = Experiment(experiment_description, search_space)
         Configuration.set_task_config(experiment.description["Context"]["TaskConfiguration"])
         assert experiment.description["Context"]["TaskConfiguration"]["TaskName"] == expected_experiment
-        # launch_stop_condition_threads without threading
-        activatedSCs = launch_stop_condition_threads(experiment_id=experiment.unique_id,experiment=experiment)
-        assert isinstance(activatedSCs[0], TimeBased)
+        # stop conditions and their validator
+        stop_condition_validator = build_stop_condition_validator(experiment_id=experiment.unique_id,experiment=experiment)
+        assert isinstance(stop_condition_validator.stop_conditions[0], TimeBased)
         # repetition management
         r = RepeaterOrchestration(experiment_id=experiment.unique_id, experiment=experiment)
         assert isinstance(r.get_repeater(), AcceptableErrorBasedType)
@@ -475,9 +475,9 @@ class TestInput:
         experiment = Experiment(experiment_description, search_space)
         Configuration.set_task_config(experiment.description["Context"]["TaskConfiguration"])
         assert experiment.description["Context"]["TaskConfiguration"]["TaskName"] == expected_experiment
-        # launch_stop_condition_threads without threading
-        activatedSCs = launch_stop_condition_threads(experiment_id=experiment.unique_id, experiment=experiment)
-        assert isinstance(activatedSCs[0], GuaranteedType)
+        # stop conditions and their validator
+        stop_condition_validator = build_stop_condition_validator(experiment_id=experiment.unique_id, experiment=experiment)
+        assert isinstance(stop_condition_validator.stop_conditions[0], GuaranteedType)
         # repetition management
         r = RepeaterOrchestration(experiment_id=experiment.unique_id, experiment=experiment)
         assert isinstance(r.get_repeater(), AcceptableErrorBasedType)
@@ -520,9 +520,9 @@ class TestInput:
         experiment = Experiment(experiment_description, search_space)
         Configuration.set_task_config(experiment.description["Context"]["TaskConfiguration"])
         assert experiment.description["Context"]["TaskConfiguration"]["TaskName"] == expected_experiment
-        # launch_stop_condition_threads without threading
-        activatedSCs = launch_stop_condition_threads(experiment_id=experiment.unique_id, experiment=experiment)
-        assert isinstance(activatedSCs[0], FewShotLearningBased)
+        # stop conditions and their validator
+        stop_condition_validator = build_stop_condition_validator(experiment_id=experiment.unique_id, experiment=experiment)
+        assert isinstance(stop_condition_validator.stop_conditions[0], FewShotLearningBased)
         # repetition management
         r = RepeaterOrchestration(experiment_id=experiment.unique_id, experiment=experiment)
         assert isinstance(r.get_repeater(), AcceptableErrorBasedType)
@@ -560,9 +560,9 @@ class TestInput:
         experiment = Experiment(experiment_description, search_space)
         Configuration.set_task_config(experiment.description["Context"]["TaskConfiguration"])
         assert experiment.description["Context"]["TaskConfiguration"]["TaskName"] == expected_experiment
-        # launch_stop_condition_threads without threading
-        activatedSCs = launch_stop_condition_threads(experiment_id=experiment.unique_id,experiment=experiment)
-        assert isinstance(activatedSCs[0], BadConfigurationBasedType)
+        # stop conditions and their validator
+        stop_condition_validator = build_stop_condition_validator(experiment_id=experiment.unique_id,experiment=experiment)
+        assert isinstance(stop_condition_validator.stop_conditions[0], BadConfigurationBasedType)
         # repetition management
         r = RepeaterOrchestration(experiment_id=experiment.unique_id, experiment=experiment)
         assert isinstance(r.get_repeater(), AcceptableErrorBasedType)
@@ -597,9 +597,9 @@ class TestInput:
         experiment = Experiment(experiment_description, search_space)
         Configuration.set_task_config(experiment.description["Context"]["TaskConfiguration"])
         assert experiment.description["Context"]["TaskConfiguration"]["TaskName"] == expected_experiment
-        # launch_stop_condition_threads without threading
-        activatedSCs = launch_stop_condition_threads(experiment_id=experiment.unique_id, experiment=experiment)
-        assert isinstance(activatedSCs[0], FewShotLearningBased)
+        # stop conditions and their validator
+        stop_condition_validator = build_stop_condition_validator(experiment_id=experiment.unique_id, experiment=experiment)
+        assert isinstance(stop_condition_validator.stop_conditions[0], FewShotLearningBased)
         # repetition management
         r = RepeaterOrchestration(experiment_id=experiment.unique_id, experiment=experiment)
         assert isinstance(r.get_repeater(), AcceptableErrorBasedType)
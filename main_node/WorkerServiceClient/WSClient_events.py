@@ -7,6 +7,10 @@ import uuid
 from core_entities.configuration import Configuration
 from tools.mongo_dao import MongoDB
 from tools.rabbitmq_common_tools import RabbitMQConnection, publish
+from WorkerServiceClient.measurement_cache import MeasurementCache
+from WorkerServiceClient.slot_reservations import SlotReservations
+from WorkerServiceClient.task_batch_size import TaskBatchSize
+from WorkerServiceClient.worker_registry import WorkerRegistry
 
 
 class WSClient:
@@ -26,7 +30,8 @@ class WSClient:
 
         experiment_description = None
         while experiment_description is None:
-            experiment_description = database.get_last_record_by_experiment_id("Experiment_description", experiment_id)
+            experiment_description = database.get_last_record_by_experiment_id(
+                "Experiment_description", experiment_id, {"ExperimentObject": False})
         task_configuration = experiment_description["Context"]["TaskConfiguration"]
         self._task_name = task_configuration["TaskName"]
         self.parameter_names = []
@@ -34,12 +39,25 @@ class WSClient:
         self._scenario = task_configuration["Scenario"]
         self._time_for_one_task_running = task_configuration[
             "MaxTimeToRunTask"] if "MaxTimeToRunTask" in task_configuration else float("inf")
+        # results of deterministic tasks could be reused between experiments, if the cache is enabled
+        cache_file = os.getenv("BRISE_MEASUREMENT_CACHE")
+        if cache_file and task_configuration.get("Deterministic", False):
+            self.measurement_cache = MeasurementCache(cache_file)
+        else:
+            self.measurement_cache = None
+        # measurement ID -> (task ID -> cache key), for the sent tasks, removed together with the measurement
+        self._mapping_task_cache_key = {}
         # Properties that holds current task data.
         self.measurement = {}
         # Create a connection and channel for sending configurations
         self.number_of_workers_lock = threading.Lock()
         self._number_of_workers = None
+        # slots for the configurations, requested from Configuration selection, which tasks were not sent yet
+        self.slot_reservations = SlotReservations()
         self.connection_thread = None
+        self.task_batch_size = TaskBatchSize()
+        self.worker_registry = WorkerRegistry()
+        self.worker_registry.clear_outstanding_tasks()  # tasks of a previous experiment are not reported anymore
         self.init_connection()
 
     def init_connection(self):
@@ -56,27 +74,92 @@ class WSClient:
     def _send_measurement(self, id_measurement, measurement):
         """
         Method to compose task description to JSON format and send it to Workers.
+        Cheap tasks are packed into micro-batches (see TaskBatchSize), a batch is sent as one message with the common
+        task description and the list of `tasks` (ID and parameters of each task).
         :param id_measurement: ID of measurement to send
         :param measurement: measurement description
         """
         number_ready_task = len(measurement['tasks_results'])
-        for i, task_parameter in enumerate(measurement['tasks_to_send']):
-            if i >= number_ready_task:
-                self.logger.info("Sending task: %s" % task_parameter)
-                task_description = dict()
-                task_description["experiment_id"] = self.experiment_id
-                task_description["id_measurement"] = id_measurement
-                task_description["task_id"] = str(uuid.uuid4())
-                config = Configuration.from_json(measurement["configuration"])
-                task_description["experiment_id"] = config.experiment_id
-                task_description["task_name"] = self._task_name
-                task_description["time_for_run"] = self._time_for_one_task_running
-                task_description["Scenario"] = self._scenario
-                task_description["result_structure"] = self._objectives
-                task_description["parameters"] = task_parameter
-                publish(exchange='',
-                        routing_key='task_queue',
-                        body=json.dumps(task_description))
+        tasks_parameters = measurement['tasks_to_send'][number_ready_task:]
+        if self.measurement_cache is not None:
+            tasks_parameters = self._take_cached_results(measurement, tasks_parameters)
+            if self.is_all_tasks_finish(id_measurement):
+                self._report_measurement(id_measurement)
+                return
+        config = Configuration.from_json(measurement["configuration"])
+        common_description = dict()
+        common_description["experiment_id"] = config.experiment_id
+        common_description["id_measurement"] = id_measurement
+        common_description["task_name"] = self._task_name
+        common_description["time_for_run"] = self._time_for_one_task_running
+        common_description["Scenario"] = self._scenario
+        common_description["result_structure"] = self._objectives
+        if self.task_batch_size.task_duration is None:
+            # until own tasks are finished, the durations reported by the Workers are used
+            self.task_batch_size.observe(self.worker_registry.get_task_duration())
+        batch_size = self.task_batch_size.get(len(tasks_parameters), self._number_of_workers)
+        self.worker_registry.add_outstanding_tasks(len(tasks_parameters))
+        for start in range(0, len(tasks_parameters), batch_size):
+            batch = [{"task_id": str(uuid.uuid4()), "parameters": task_parameter}
+                     for task_parameter in tasks_parameters[start:start + batch_size]]
+            self.logger.info("Sending tasks: %s" % [task["parameters"] for task in batch])
+            if self.measurement_cache is not None:
+                cache_keys = self._mapping_task_cache_key.setdefault(id_measurement, {})
+                for task in batch:
+                    cache_keys[task["task_id"]] = self._get_cache_key(task["parameters"])
+            if len(batch) == 1:
+                task_description = {**common_description, **batch[0]}
+            else:
+                task_description = {**common_description, "tasks": batch}
+            publish(exchange='',
+                    routing_key='task_queue',
+                    body=json.dumps(task_description))
+
+    def _get_cache_key(self, task_parameter) -> str:
+        return MeasurementCache.get_key(self._task_name, self._scenario, task_parameter, self._objectives)
+
+    def _take_cached_results(self, measurement, tasks_parameters) -> list:
+        """
+        Add the cached results of the tasks to the measurement.
+        :param measurement: measurement description
+        :param tasks_parameters: parameters of the tasks, which are not performed yet
+        :return: parameters of the tasks, which results are not cached and should be sent to Workers
+        """
+        not_cached = []
+        for task_parameter in tasks_parameters:
+            result = self.measurement_cache.get(self._get_cache_key(task_parameter))
+            if result is None:
+                not_cached.append(task_parameter)
+            else:
+                measurement['tasks_results'].append(
+                    {'task id': str(uuid.uuid4()), 'worker': 'measurement_cache', 'result': result})
+        if len(not_cached) < len(tasks_parameters):
+            self.logger.info(f"{len(tasks_parameters) - len(not_cached)} task results are taken from the cache.")
+        return not_cached
+
+    def _cache_results(self, id_measurement, tasks_results) -> None:
+        cache_keys = self._mapping_task_cache_key.get(id_measurement, {})
+        for task_result in tasks_results:
+            key = cache_keys.pop(task_result['task id'], None)
+            result = task_result['result']
+            # failed tasks are not cached
+            if key is not None and result and all(value is not None for value in result.values()):
+                self.measurement_cache.put(key, result)
+
+    def _report_measurement(self, id_measurement) -> None:
+        """
+        Send the finished measurement back to Repeater.
+        :param id_measurement: ID of the measurement
+        """
+        publish(exchange='measurement_results_exchange',
+                routing_key=self.experiment_id,
+                body=json.dumps(self.measurement[id_measurement]))
+
+        self.logger.debug("Results for {task_param} : {task_res}".format(
+            task_param=str(self.measurement[id_measurement]['tasks_to_send']),
+            task_res=str(self.measurement[id_measurement]['tasks_results'])))
+        del self.measurement[id_measurement]
+        self._mapping_task_cache_key.pop(id_measurement, None)
 
     def work(self, ch, method, properties, body) -> None:
         """
@@ -92,9 +175,17 @@ class WSClient:
         self.measurement[measurement_id]["tasks_to_send"] = tasks
         self.measurement[measurement_id]["tasks_results"] = []
         self.measurement[measurement_id]["configuration"] = j_conf
+        self.slot_reservations.release(json.loads(j_conf)["configuration_id"])
         self._send_measurement(measurement_id, self.measurement[measurement_id])
 
     def get_number_of_workers(self) -> int:
+        """
+        :return: number of task slots, known from the Worker heartbeats, or the number of consumers of the `task_queue`,
+        if no heartbeats were received (e.g. by Workers without heartbeats).
+        """
+        number_of_slots = self.worker_registry.get_number_of_slots()
+        if number_of_slots > 0:
+            return number_of_slots
         result = self.channel.queue_declare(
             queue="task_queue",
             durable=True,
@@ -104,14 +195,19 @@ class WSClient:
 
     def get_number_of_needed_configurations(self, ch=None, method=None, properties=None, body=None):
         """
-        The function that returns the number of needed configurations for making balanced loading
+        The function that returns the number of needed configurations for making balanced loading.
+        If the Workers send heartbeats, all idle slots are filled, otherwise the number of configurations follows
+        the changes of the number of Workers.
+        :param body: ID of the finished Configuration (if any), its reserved slot is released.
         :return:
         """
+        if body:
+            self.slot_reservations.release(json.loads(body.decode())["configuration_id"])
         with self.number_of_workers_lock:
             current_number_of_worker = self.get_number_of_workers()
             if self._number_of_workers is None:
                 self._number_of_workers = current_number_of_worker
-            differences = self.get_number_of_workers() - self._number_of_workers
+            differences = current_number_of_worker - self._number_of_workers
             self._number_of_workers = current_number_of_worker
             if differences == 0:
                 worker_capacity = 1
@@ -119,12 +215,23 @@ class WSClient:
                 worker_capacity = differences + 1
             else:
                 worker_capacity = 0
-        dictionary_dump = {"worker_capacity": worker_capacity}
+            idle_slots = self.worker_registry.get_number_of_idle_slots()
+            if worker_capacity > 0 and idle_slots is not None:
+                worker_capacity = max(worker_capacity, idle_slots - len(self.slot_reservations))
+            request_id = self.slot_reservations.request(worker_capacity)
+        dictionary_dump = {"worker_capacity": worker_capacity, "request_id": request_id}
         body = json.dumps(dictionary_dump)
         publish(exchange='get_new_configuration_exchange',
                 routing_key=self.experiment_id,
                 body=body)
 
+    def reserve_selected_configurations(self, ch, method, properties, body) -> None:
+        """
+        Callback function for the IDs of the Configurations, selected by Configuration selection for a request.
+        """
+        selection = json.loads(body.decode())
+        self.slot_reservations.assign(selection["request_id"], selection["configuration_ids"])
+
     def is_all_tasks_finish(self, id_measurement):
         """
         Checking are all tasks for specific configuration finish or not
@@ -143,22 +250,20 @@ class WSClient:
         :param channel: pika.Channel
         :param method:  pika.spec.Basic.GetOk
         :param properties: pika.spec.BasicProperties
-        :param body: result of a task in bytes format
+        :param body: result of a task (or of a batch of tasks) in bytes format
         """
         task_result = json.loads(body.decode())
+        # a batch of tasks is reported by one message with the list of `task_results`
+        tasks_results = task_result['task_results'] if 'task_results' in task_result else [task_result['task_result']]
+        self.task_batch_size.observe(task_result.get('duration'), len(tasks_results))
+        if self.measurement_cache is not None:
+            self._cache_results(task_result['id_measurement'], tasks_results)
         try:
-            self.measurement[task_result['id_measurement']]['tasks_results'].append(
-                task_result['task_result'])
+            self.measurement[task_result['id_measurement']]['tasks_results'].extend(tasks_results)
+            self.worker_registry.add_outstanding_tasks(-len(tasks_results))
             # We should decouple one from another.
             if self.is_all_tasks_finish(task_result['id_measurement']):
-                publish(exchange='measurement_results_exchange',
-                        routing_key=self.experiment_id,
-                        body=json.dumps(self.measurement[task_result['id_measurement']]))
-
-                self.logger.debug("Results for {task_param} : {task_res}".format(
-                    task_param=str(self.measurement[task_result['id_measurement']]['tasks_to_send']),
-                    task_res=str(self.measurement[task_result['id_measurement']]['tasks_results'])))
-                del self.measurement[task_result['id_measurement']]
+                self._report_measurement(task_result['id_measurement'])
         except KeyError:
             self.logger.info("The old task was received")  # in case of restart main without cleaning all queues
 
@@ -189,7 +294,17 @@ class WSClient:
                                        on_message_callback=self.ws_client.work)
             self.channel.basic_consume(queue='get_worker_capacity_exchange' + self.experiment_id, auto_ack=True,
                                        on_message_callback=self.ws_client.get_number_of_needed_configurations)
+            self.channel.basic_consume(queue='selected_configurations_exchange' + self.experiment_id, auto_ack=True,
+                                       on_message_callback=self.ws_client.reserve_selected_configurations)
             self.channel.basic_consume(queue=self.termination_queue_name, auto_ack=True,
                                        on_message_callback=self.stop)
+            # heartbeats are broadcast to all experiments
+            self.heartbeat_queue_name = self.channel.queue_declare(queue='', exclusive=True).method.queue
+            self.channel.queue_bind(exchange='worker_heartbeat_sender', queue=self.heartbeat_queue_name)
+            self.channel.basic_consume(queue=self.heartbeat_queue_name, auto_ack=True,
+                                       on_message_callback=self.update_worker_registry)
 
             self.sender_lock = threading.Lock()  # only one thread can use a channel for sending message
+
+        def update_worker_registry(self, ch, method, properties, body):
+            self.ws_client.worker_registry.update(json.loads(body.decode()))
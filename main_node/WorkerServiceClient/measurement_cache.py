@@ -0,0 +1,66 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, Optional
+
+
+class MeasurementCache:
+    """
+    Content-addressed cache of task results, shared between experiments.
+
+    A result is stored by the hash of the task name, the scenario, the parameters and the result structure,
+    therefore the cache is valid only for the deterministic tasks (the experiment should set
+    `TaskConfiguration.Deterministic`). The results are kept in an SQLite file, which could be shared
+    by several main-nodes (e.g. the runs of a benchmark).
+    """
+
+    def __init__(self, file_name: str):
+        """
+        :param file_name: path to the SQLite file, it is created if needed.
+        """
+        directory = os.path.dirname(file_name)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(file_name, timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")  # readers do not block the writers of other runs
+            self._connection.execute("CREATE TABLE IF NOT EXISTS task_results (key TEXT PRIMARY KEY, result TEXT)")
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_key(task_name: str, scenario: Dict, parameters, result_structure) -> str:
+        """
+        :return: key of the task, which does not depend on the order of the mappings.
+        """
+        content = json.dumps([task_name, scenario, parameters, result_structure], sort_keys=True)
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        :param key: key of the task (see `get_key`).
+        :return: stored result of the task or None.
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT result FROM task_results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, result: Dict) -> None:
+        """
+        :param key: key of the task (see `get_key`).
+        :param result: result of the task (mapping objective -> value), the first stored result is kept.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR IGNORE INTO task_results (key, result) VALUES (?, ?)",
+                                     (key, json.dumps(result)))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,60 @@
+import threading
+import uuid
+from typing import Dict, Iterable, Set
+
+
+class SlotReservations:
+    """
+    Worker slots, reserved for the Configurations, which are requested from Configuration selection, but which tasks
+    were not sent yet.
+
+    A request reserves the requested number of slots until Configuration selection reports the IDs of the Configurations,
+    selected for it (the selection could return less Configurations, e.g. if the Search Space is exhausted). Afterwards
+    a slot is reserved per Configuration ID and it is released by the first measurement of the Configuration or by its
+    final result (a Configuration could be finished without measurements, e.g. if it was disabled). The IDs, released
+    before they were reported, are remembered, therefore the order of the messages does not matter.
+    """
+
+    def __init__(self):
+        # request ID -> number of slots, reserved until the IDs of the selected Configurations are reported
+        self._requests: Dict[str, int] = {}
+        self._configurations: Set[str] = set()
+        self._released_configurations: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def request(self, number_of_configurations: int) -> str:
+        """
+        :param number_of_configurations: number of Configurations, requested from Configuration selection.
+        :return: ID of the request, which should be reported back together with the selected Configurations.
+        """
+        request_id = str(uuid.uuid4())
+        with self._lock:
+            if number_of_configurations > 0:
+                self._requests[request_id] = number_of_configurations
+        return request_id
+
+    def assign(self, request_id: str, configuration_ids: Iterable[str]) -> None:
+        """
+        Replace the reservation of the request by the reservations of the selected Configurations.
+        :param request_id: ID of the request (see `request`).
+        :param configuration_ids: IDs of the Configurations, selected for the request.
+        """
+        with self._lock:
+            self._requests.pop(request_id, None)
+            self._configurations.update(set(configuration_ids) - self._released_configurations)
+
+    def release(self, configuration_id: str) -> None:
+        """
+        Release the slot of the Configuration, the repeated calls have no effect.
+        :param configuration_id: ID of the measured or finished Configuration.
+        """
+        with self._lock:
+            self._released_configurations.add(configuration_id)
+            self._configurations.discard(configuration_id)
+
+    def __len__(self) -> int:
+        """
+        :return: number of reserved slots.
+        """
+        with self._lock:
+            return sum(self._requests.values()) + len(self._configurations)
@@ -0,0 +1,58 @@
+import math
+import os
+import threading
+
+
+class TaskBatchSize:
+    """
+    Estimates the number of Tasks, which are packed into one message for a Worker.
+
+    Cheap Tasks are dominated by the messaging overhead (a round trip through RabbitMQ and the parsing of JSON per Task),
+    therefore the Tasks are sent in micro-batches, which are executed by a Worker for about the target time.
+    The duration of a Task is estimated as the exponential moving average of the durations, reported by the Workers.
+    Until the first duration is known, as well as for the expensive Tasks, every Task is sent separately.
+
+    The target time and the maximal size of a batch are configured by the environment variables
+    `BRISE_TASK_BATCH_TARGET_TIME` (seconds, default 0.1) and `BRISE_TASK_BATCH_MAX_SIZE` (default 100, 1 disables
+    batching).
+    """
+
+    def __init__(self, target_time: float = None, max_size: int = None, smoothing: float = 0.2):
+        """
+        :param target_time: desired execution time of one batch in seconds.
+        :param max_size: maximal number of Tasks in one batch.
+        :param smoothing: weight of the latest observed duration in the moving average.
+        """
+        self.target_time = target_time or float(os.getenv("BRISE_TASK_BATCH_TARGET_TIME", "0.1"))
+        self.max_size = max(max_size or int(os.getenv("BRISE_TASK_BATCH_MAX_SIZE", "100")), 1)
+        self.smoothing = smoothing
+        self.task_duration = None
+        self._lock = threading.Lock()
+
+    def observe(self, duration: float, number_of_tasks: int = 1) -> None:
+        """
+        Update the estimation of the Task duration.
+        :param duration: execution time of the batch in seconds, reported by a Worker.
+        :param number_of_tasks: number of Tasks in the batch.
+        """
+        if duration is None or number_of_tasks < 1:
+            return
+        task_duration = max(float(duration), 0.0) / number_of_tasks
+        with self._lock:
+            if self.task_duration is None:
+                self.task_duration = task_duration
+            else:
+                self.task_duration += self.smoothing * (task_duration - self.task_duration)
+
+    def get(self, number_of_tasks: int, number_of_workers: int = None) -> int:
+        """
+        :param number_of_tasks: number of Tasks, which should be sent.
+        :param number_of_workers: number of Workers (if known), the Tasks are still spread between all of them.
+        :return: number of Tasks in one batch.
+        """
+        if self.task_duration is None or self.max_size == 1 or number_of_tasks <= 1:
+            return 1
+        size = self.max_size if self.task_duration == 0 else int(self.target_time / self.task_duration)
+        if number_of_workers:
+            size = min(size, math.ceil(number_of_tasks / number_of_workers))
+        return max(min(size, self.max_size, number_of_tasks), 1)
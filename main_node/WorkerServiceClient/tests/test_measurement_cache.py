@@ -0,0 +1,25 @@
+from WorkerServiceClient.measurement_cache import MeasurementCache
+
+
+class TestMeasurementCache:
+
+    def test_0_reuse_results_between_runs(self, tmp_path):
+        # Test #0. Store a task result, then look it up with the reordered scenario in another cache instance
+        # Expected result: the result is found by the content of the task, the first stored result is kept
+        file_name = str(tmp_path / "cache" / "measurements.sqlite")
+        first_run = MeasurementCache(file_name)
+        key = MeasurementCache.get_key("synthetic_problems", {"function_name": "ackley", "deviation": 0},
+                                       {"x": 1.0, "y": 2.0}, {"result": {"Minimization": True}})
+        assert first_run.get(key) is None
+        first_run.put(key, {"result": 5.4})
+        first_run.put(key, {"result": 0.0})
+        first_run.close()
+
+        second_run = MeasurementCache(file_name)
+        same_key = MeasurementCache.get_key("synthetic_problems", {"deviation": 0, "function_name": "ackley"},
+                                            {"x": 1.0, "y": 2.0}, {"result": {"Minimization": True}})
+        assert second_run.get(same_key) == {"result": 5.4}
+        other_key = MeasurementCache.get_key("synthetic_problems", {"deviation": 0, "function_name": "ackley"},
+                                             {"x": 1.0, "y": 2.5}, {"result": {"Minimization": True}})
+        assert second_run.get(other_key) is None
+        assert (second_run.hits, second_run.misses) == (1, 1)
@@ -0,0 +1,35 @@
+from WorkerServiceClient.slot_reservations import SlotReservations
+
+
+class TestSlotReservations:
+
+    def test_0_release_per_configuration(self):
+        # Test #0. Request 3 Configurations, get 2 of them selected, measure one of them twice
+        # Expected result: the request reserves 3 slots until the selection, then a slot per selected Configuration,
+        # which is released once by its first measurement and not by the repetitions
+        reservations = SlotReservations()
+        request_id = reservations.request(3)
+        assert len(reservations) == 3
+        reservations.assign(request_id, ["a", "b"])
+        assert len(reservations) == 2
+        reservations.release("a")
+        reservations.release("a")
+        assert len(reservations) == 1
+        reservations.release("b")
+        assert len(reservations) == 0
+
+    def test_1_undelivered_and_reordered_configurations(self):
+        # Test #1. Finish a Configuration without measurements, select nothing for a request, and measure
+        # a Configuration before its selection is reported
+        # Expected result: no slot stays reserved
+        reservations = SlotReservations()
+        first_request = reservations.request(2)
+        empty_request = reservations.request(1)
+        reservations.request(0)  # nothing is reserved, the selection of no Configurations is not reported
+        assert len(reservations) == 3
+        reservations.release("c")  # measured before the selection is reported
+        reservations.assign(first_request, ["c", "d"])
+        reservations.assign(empty_request, [])
+        assert len(reservations) == 1
+        reservations.release("d")  # finished without measurements, e.g. disabled
+        assert len(reservations) == 0
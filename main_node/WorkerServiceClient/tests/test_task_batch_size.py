@@ -0,0 +1,51 @@
+import pytest
+
+from WorkerServiceClient.task_batch_size import TaskBatchSize
+
+
+class TestTaskBatchSize:
+
+    def test_0_single_task_before_first_observation(self):
+        # Test #0. Request the batch size before any Task duration was reported
+        # Expected result: every Task is sent separately, reports without a duration are ignored
+        batch_size = TaskBatchSize(target_time=1.0, max_size=50)
+        assert batch_size.get(100) == 1
+        batch_size.observe(None)
+        batch_size.observe(0.5, number_of_tasks=0)
+        assert batch_size.task_duration is None
+        assert batch_size.get(100, number_of_workers=2) == 1
+
+    def test_1_size_by_target_time(self):
+        # Test #1. Report the durations of single Tasks and of batches
+        # Expected result: the batch is executed for about the target time, durations are smoothed
+        batch_size = TaskBatchSize(target_time=1.0, max_size=50, smoothing=0.5)
+        batch_size.observe(0.1)
+        assert batch_size.get(100) == 10
+        batch_size.observe(2.0, number_of_tasks=10)  # 0.2 seconds per Task
+        assert batch_size.task_duration == pytest.approx(0.15)
+        assert batch_size.get(100) == 6
+        assert batch_size.get(1) == 1
+        batch_size.observe(5.0)
+        assert batch_size.get(100) == 1  # expensive Tasks are sent separately
+
+    def test_2_caps(self):
+        # Test #2. Request batches of cheap Tasks for a few Workers
+        # Expected result: a batch is not larger than max_size, the number of Tasks and the share of one Worker
+        batch_size = TaskBatchSize(target_time=1.0, max_size=20)
+        batch_size.observe(0.0)
+        assert batch_size.get(100) == 20
+        assert batch_size.get(7) == 7
+        assert batch_size.get(100, number_of_workers=8) == 13
+        assert batch_size.get(100, number_of_workers=200) == 1
+        batch_size.observe(0.001)
+        assert batch_size.get(15, number_of_workers=2) == 8
+
+    def test_3_disabled_batching(self, monkeypatch):
+        # Test #3. Set the maximal size of a batch to 1 by the environment variable
+        # Expected result: every Task is sent separately, regardless of the observed durations
+        monkeypatch.setenv("BRISE_TASK_BATCH_MAX_SIZE", "1")
+        batch_size = TaskBatchSize(target_time=1.0)
+        assert batch_size.max_size == 1
+        batch_size.observe(0.001)
+        assert batch_size.get(100) == 1
+        assert batch_size.get(100, number_of_workers=1) == 1
@@ -0,0 +1,50 @@
+import threading
+
+from WorkerServiceClient.worker_registry import WorkerRegistry
+
+
+class TestWorkerRegistry:
+
+    def test_0_free_capacity_from_heartbeats(self):
+        # Test #0. Receive heartbeats of two Workers, send tasks, then let one Worker miss its heartbeats
+        # Expected result: idle slots account for busy and sent tasks, the silent Worker is forgotten
+        registry = WorkerRegistry()
+        registry._workers.clear()
+        registry.clear_outstanding_tasks()
+        assert registry.get_number_of_idle_slots() is None
+
+        registry.update({"worker_id": "w1", "slots": 4, "in_flight": 1, "task_duration": 0.2, "interval": 2},
+                        received_at=0)
+        registry.update({"worker_id": "w2", "slots": 2, "in_flight": 0, "task_duration": None, "interval": 2},
+                        received_at=5)
+        assert registry.get_workers(now=5).keys() == {"w1", "w2"}
+        registry.add_outstanding_tasks(3)
+        assert registry.get_number_of_slots() == 0  # both Workers missed their heartbeats by now
+
+        registry.update({"worker_id": "w1", "slots": 4, "in_flight": 1, "task_duration": 0.2, "interval": 60})
+        registry.update({"worker_id": "w2", "slots": 2, "in_flight": 0, "task_duration": None, "interval": 60})
+        assert registry.get_number_of_slots() == 6
+        assert registry.get_number_of_idle_slots() == 3
+        assert registry.get_task_duration() == 0.2
+        registry.add_outstanding_tasks(-3)
+        assert registry.get_number_of_idle_slots() == 5
+
+        registry.update({"worker_id": "w2", "slots": 0, "in_flight": 0, "task_duration": None, "interval": 60})
+        assert registry.get_number_of_slots() == 4
+
+    def test_1_idle_slots_under_lock(self):
+        # Test #1. Count the idle slots, while another thread holds the lock of the registry
+        # Expected result: the heartbeats and the sent tasks are read together, after the lock is released
+        registry = WorkerRegistry()
+        registry._workers.clear()
+        registry.clear_outstanding_tasks()
+        registry.update({"worker_id": "w1", "slots": 4, "in_flight": 0, "task_duration": None, "interval": 60})
+        result = []
+        with registry._lock:
+            counter = threading.Thread(target=lambda: result.append(registry.get_number_of_idle_slots()))
+            counter.start()
+            counter.join(timeout=0.2)
+            assert counter.is_alive()
+            registry._outstanding_tasks = 3
+        counter.join()
+        assert result == [1]
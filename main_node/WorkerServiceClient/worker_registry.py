@@ -0,0 +1,97 @@
+import threading
+import time
+from typing import Dict, Optional
+
+from tools.singleton import Singleton
+
+
+class WorkerRegistry(metaclass=Singleton):
+    """
+    Local view of the Workers, fed by the heartbeats, which every Worker broadcasts via `worker_heartbeat_sender`.
+
+    A heartbeat carries the number of task slots of a Worker, the number of tasks it executes (in-flight)
+    and the average duration of its recent tasks. A Worker, which did not send a heartbeat for several heartbeat
+    intervals, is considered as gone. Together with the number of tasks, sent by this main-node and not finished yet,
+    the registry estimates the free capacity without querying the broker.
+    """
+
+    def __init__(self, expiration_factor: float = 3.0):
+        """
+        :param expiration_factor: number of missed heartbeat intervals, after which a Worker is considered as gone.
+        """
+        self.expiration_factor = expiration_factor
+        # worker ID -> (last heartbeat, time of its receiving)
+        self._workers: Dict[str, tuple] = {}
+        self._outstanding_tasks = 0
+        self._lock = threading.Lock()
+
+    def update(self, heartbeat: Dict, received_at: float = None) -> None:
+        """
+        :param heartbeat: `worker_id`, `slots`, `in_flight`, `task_duration` (None if unknown) and `interval`
+        (seconds between heartbeats) of a Worker.
+        :param received_at: monotonic time of receiving, now by default.
+        """
+        received_at = time.monotonic() if received_at is None else received_at
+        with self._lock:
+            if heartbeat["slots"] > 0:
+                self._workers[heartbeat["worker_id"]] = (heartbeat, received_at)
+            else:
+                self._workers.pop(heartbeat["worker_id"], None)  # the Worker is shutting down
+
+    def add_outstanding_tasks(self, number_of_tasks: int) -> None:
+        """
+        :param number_of_tasks: number of sent (positive) or finished (negative) tasks.
+        """
+        with self._lock:
+            self._outstanding_tasks = max(self._outstanding_tasks + number_of_tasks, 0)
+
+    def clear_outstanding_tasks(self) -> None:
+        with self._lock:
+            self._outstanding_tasks = 0
+
+    def get_workers(self, now: float = None) -> Dict[str, Dict]:
+        """
+        :param now: monotonic time, now by default.
+        :return: the last heartbeat of every alive Worker.
+        """
+        with self._lock:
+            return self._get_alive_workers(now)
+
+    def _get_alive_workers(self, now: float = None) -> Dict[str, Dict]:
+        """
+        Forget the Workers, which did not send a heartbeat in time. Should be called with the lock held.
+        :param now: monotonic time, now by default.
+        :return: the last heartbeat of every alive Worker.
+        """
+        now = time.monotonic() if now is None else now
+        for worker_id, (heartbeat, received_at) in list(self._workers.items()):
+            if now - received_at > self.expiration_factor * heartbeat["interval"]:
+                del self._workers[worker_id]
+        return {worker_id: heartbeat for worker_id, (heartbeat, _) in self._workers.items()}
+
+    def get_number_of_slots(self) -> int:
+        """
+        :return: total number of task slots of the alive Workers (0 if no heartbeats were received).
+        """
+        return sum(heartbeat["slots"] for heartbeat in self.get_workers().values())
+
+    def get_number_of_idle_slots(self) -> Optional[int]:
+        """
+        :return: number of slots, which are neither busy nor reserved by the sent tasks, or None if no Workers are known.
+        """
+        with self._lock:
+            workers = self._get_alive_workers()
+            if not workers:
+                return None
+            number_of_slots = sum(heartbeat["slots"] for heartbeat in workers.values())
+            in_flight = sum(heartbeat["in_flight"] for heartbeat in workers.values())
+            # heartbeats lag behind, while the sent tasks are known immediately (including the queued ones)
+            return max(number_of_slots - max(in_flight, self._outstanding_tasks), 0)
+
+    def get_task_duration(self) -> Optional[float]:
+        """
+        :return: average duration of the recent tasks over all alive Workers or None if it is unknown.
+        """
+        durations = [heartbeat["task_duration"] for heartbeat in self.get_workers().values()
+                     if heartbeat.get("task_duration") is not None]
+        return sum(durations) / len(durations) if durations else None
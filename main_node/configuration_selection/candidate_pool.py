@@ -0,0 +1,111 @@
+import logging
+import threading
+from typing import List, Set
+
+from core_entities.configuration import Configuration
+from core_entities.experiment import Experiment
+
+
+class CandidatePool(threading.Thread):
+    """
+    Speculatively builds the models in background and keeps a pool of predicted candidates.
+
+    A rebuild is started as soon as a new Configuration is measured, so the models are usually ready
+    before the next request for new Configurations arrives. Candidates stay usable until more than `max_staleness`
+    Configurations were measured after the build. An improvement of the current solution is a significant change
+    of the training data, therefore it invalidates the pool (and the build in progress) immediately.
+    """
+
+    def __init__(self, configuration_selection, max_staleness: int = 1):
+        """
+        :param configuration_selection: ConfigurationSelection instance, used to build the models and predict.
+        :param max_staleness: number of measured Configurations, after which the pooled candidates are discarded.
+        """
+        super().__init__(daemon=True)
+        self.configuration_selection = configuration_selection
+        self.experiment: Experiment = configuration_selection.experiment
+        self.max_staleness = max_staleness
+        self.logger = logging.getLogger(__name__)
+
+        self.pool_size = 1
+        self._candidates: List[Configuration] = []
+        self._built_on = 0  # number of measured Configurations, the pooled candidates are based on
+        self._valid_from = 0  # candidates based on less measured Configurations are discarded
+        self._is_rebuild_requested = False
+        self._is_building = False
+        self._active = True
+        self._condition = threading.Condition()
+
+    def on_experiment_state_change(self, experiment: Experiment, events: Set[Experiment.Event]) -> None:
+        with self._condition:
+            if Experiment.Event.FINISHED in events:
+                self.stop()
+                return
+            if Experiment.Event.CONFIGURATION_MEASURED in events:
+                if Experiment.Event.SOLUTION_UPDATED in events:
+                    self._candidates = []
+                    self._valid_from = experiment.get_number_of_measured_configurations()
+                self._is_rebuild_requested = True
+                self._condition.notify_all()
+
+    def take(self, number_of_configurations: int) -> List[Configuration]:
+        """
+        Take up to the requested number of fresh candidates, which were not evaluated yet.
+        If there are no fresh candidates, but they are being built for the current training data, waits for them.
+        :param number_of_configurations: number of requested Configurations.
+        :return: list of candidates, could be shorter than requested or empty.
+        """
+        with self._condition:
+            # spare candidates serve the requests, which arrive while the pool is being rebuilt
+            self.pool_size = max(number_of_configurations, 1) * (self.max_staleness + 1)
+            measured = self.experiment.get_number_of_measured_configurations()
+            if not self._get_fresh_candidates(measured):
+                # do not wait for the builds, triggered by the Configurations measured later
+                self._condition.wait_for(lambda: not self._active or self._built_on >= measured or (
+                    not self._is_building and not self._is_rebuild_requested))
+            taken = []
+            for candidate in self._get_fresh_candidates(measured):
+                if len(taken) == number_of_configurations:
+                    break
+                self._candidates.remove(candidate)
+                taken.append(candidate)
+            if taken:
+                self.logger.debug(f"{len(taken)} Configuration(s) taken from the pool, "
+                                  f"built on {self._built_on} out of {measured} measured Configurations.")
+            return taken
+
+    def _get_fresh_candidates(self, measured: int) -> List[Configuration]:
+        if measured - self._built_on > self.max_staleness:
+            self._candidates = []
+        self._candidates = [c for c in self._candidates if c not in self.experiment.evaluated_configurations]
+        return list(self._candidates)
+
+    def run(self):
+        self.experiment.subscribe(self.on_experiment_state_change)
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: not self._active or self._is_rebuild_requested)
+                if not self._active:
+                    break
+                self._is_rebuild_requested = False
+                self._is_building = True
+                pool_size = self.pool_size
+                configurations = list(self.experiment.measured_configurations)
+            candidates = []
+            try:
+                candidates = self.configuration_selection.predict_batch(pool_size, configurations)
+            except Exception as error:
+                self.logger.error(f"Unable to build the candidate pool: {error}", exc_info=True)
+            with self._condition:
+                self._is_building = False
+                if len(configurations) >= self._valid_from:
+                    self._candidates = candidates
+                    self._built_on = len(configurations)
+                self._condition.notify_all()
+
+    def stop(self):
+        with self._condition:
+            self._active = False
+            self._candidates = []
+            self._condition.notify_all()
+        self.experiment.unsubscribe(self.on_experiment_state_change)
@@ -1,11 +1,13 @@
 import logging
 import json
 import os
+import threading
 from typing import List, Tuple
 from copy import deepcopy
 
 from core_entities.experiment import Experiment
 from core_entities.configuration import Configuration
+from configuration_selection.candidate_pool import CandidatePool
 from configuration_selection.model.predictor import Predictor
 from tools.front_API import API
 from tools.rabbitmq_common_tools import RabbitMQConnection, publish
@@ -35,7 +37,15 @@ class ConfigurationSelection:
             self.transfer_is_enabled = False
 
         self.logger = logging.getLogger(__name__)
+        # the models are built either by the background Candidate Pool or on request, but never simultaneously
+        self._prediction_lock = threading.Lock()
+        self.candidate_pool = None
         if os.environ.get('TEST_MODE') != 'UNIT_TEST':
+            # pooled candidates are not used with transfer learning, it modifies the models on every request
+            if not self.transfer_is_enabled:
+                self.candidate_pool = CandidatePool(
+                    self, int(os.getenv("BRISE_CANDIDATE_POOL_MAX_STALENESS", "1")))
+                self.candidate_pool.start()
             self.connection_thread = self._EventServiceConnection(self)
             self.connection_thread.start()
 
@@ -45,39 +55,41 @@ class ConfigurationSelection:
         This callback function will be triggered upon arrival of EACH measured Configuration.
         When there is new measured Configuration, the following steps are done:
 
-            1.   the surrogates are updated and validated
+            1.   the surrogates are updated and validated (or the candidates, built in background, are taken from the pool)
             2.   configuration(s) selection either by the surrogate, or by the sampling strategy:
                 Note: The number of new configurations can be:
                 - 0 if the number of the available Worker nodes has decreased;
                 - 1 if the number of the available Workers has not changed;
                 - N + 1 if the number of the available Workers has increased by N.
-            3.   new configuration(s) are sent to the Repetition Manager for evaluation.
+            3.   new configuration(s) are sent to the Repetition Manager for evaluation, their IDs are reported to
+                WSClient, which reserves the Worker slots for them.
 
         :return: FOR TESTING ONLY: Two lists:
                                 * configs_to_be_evaluated: contains all parameters for the flat search space
                                 * hierarchical_configs: the way a configuration is being sent to the worker
         """
-        needed_configs = json.loads(body.decode()).get("worker_capacity", 1)
-
-        number_of_predicted_configs = (
-            min([model.candidate_selector.number_of_points for model in self.predictor.mapping_region_model.values()]))
+        request = json.loads(body.decode())
+        needed_configs = request.get("worker_capacity", 1)
 
         predicted_configs = []
         configs_to_be_evaluated = []
 
         if not self.transfer_is_enabled:
-            predicted_configs.extend(self._regular_prediction(needed_configs, number_of_predicted_configs))
+            if self.candidate_pool is not None:
+                predicted_configs.extend(self.candidate_pool.take(needed_configs))
+            predicted_configs.extend(self.predict_batch(needed_configs - len(predicted_configs)))
         else:
             similar_experiments = self.transfer_learning_orchestrator.ted_module.analyse_experiments_similarity()
             if similar_experiments is None:
-                sampled_config = self.predictor.predict(self.experiment.measured_configurations, True)[0]
+                with self._prediction_lock:
+                    sampled_config = self.predictor.predict(self.experiment.measured_configurations, True)[0]
                 predicted_configs.append(sampled_config)
                 temp_msg = f"Transfer expediency cannot be determined yet. Sampled: {sampled_config}."
                 self.logger.info(temp_msg)
             elif len(similar_experiments) == 0:
                 temp_msg = "No similar experiment has been found."
                 self.logger.info(temp_msg)
-                predicted_configs.extend(self._regular_prediction(needed_configs, number_of_predicted_configs))
+                predicted_configs.extend(self.predict_batch(needed_configs))
             else:
                 # Model transfer
                 model_transfer_module = self.transfer_learning_orchestrator.transfer_submodules["Model_transfer"]
@@ -97,8 +109,7 @@ class ConfigurationSelection:
                         self.transfer_learning_orchestrator.transfer_submodules["Configuration_transfer"].
                         transfer_configurations(similar_experiments))
                     transferred_configurations = list(filter(
-                        lambda tc: tc.parameters not in [mc.parameters for mc in
-                                                         self.experiment.measured_configurations],
+                        lambda tc: self.experiment.measured_configurations.get_by_fingerprint(tc.fingerprint) is None,
                         transferred_configurations))
                     self.logger.info(f"Identified a set of promising configurations from a similar experiment, "
                                      f"{transferred_configurations}")
@@ -112,27 +123,23 @@ class ConfigurationSelection:
                     # take a single config from the prediction
                     elif model_transfer_module is not None and model_transfer_module.is_few_shot:
                         extended_configuration_list = self.experiment.measured_configurations + transferred_configurations
-                        temp_predicted = self.predictor.predict(extended_configuration_list)[0]
+                        with self._prediction_lock:
+                            temp_predicted = self.predictor.predict(extended_configuration_list)[0]
                         predicted_configs.append(temp_predicted)
                         self.logger.info("Measuring a configuration using the transferred model")
                     # regular transfer of configurations
                     else:
-                        while needed_configs > 0:
-                            if needed_configs - number_of_predicted_configs >= 0:
-                                extended_configuration_list = self.experiment.measured_configurations + transferred_configurations
-                                temp_predicted = self.predictor.predict(extended_configuration_list)
-                                predicted_configs.extend(temp_predicted)
-                            else:
-                                extended_configuration_list = self.experiment.measured_configurations + transferred_configurations
-                                temp_predicted = self.predictor.predict(extended_configuration_list)
-                                predicted_configs.extend(temp_predicted[:needed_configs])
-                            needed_configs -= number_of_predicted_configs
+                        extended_configuration_list = self.experiment.measured_configurations + transferred_configurations
+                        temp_predicted = self.predict_batch(needed_configs, extended_configuration_list)
+                        predicted_configs.extend(temp_predicted)
+                        needed_configs -= len(temp_predicted)
                 # regular transfer of models
                 if model_transfer_module is not None:
-                    predicted_configs.extend(self._regular_prediction(needed_configs, number_of_predicted_configs))
+                    predicted_configs.extend(self.predict_batch(needed_configs))
 
         for c in predicted_configs:
-            if c not in self.experiment.evaluated_configurations:
+            # pooled and freshly predicted candidates could coincide
+            if c not in self.experiment.evaluated_configurations and c not in configs_to_be_evaluated:
                 temp_msg = f"The model predicted {c}."
                 self.logger.info(temp_msg)
                 configs_to_be_evaluated.append(c)
@@ -145,7 +152,8 @@ class ConfigurationSelection:
                             body=msg)
 
             else:
-                sampled_config = self.predictor.predict(self.experiment.measured_configurations, True)[0]
+                with self._prediction_lock:
+                    sampled_config = self.predictor.predict(self.experiment.measured_configurations, True)[0]
                 temp_msg = f"Predicted configuration {c} has already been evaluated. Randomly sampled {sampled_config}."
                 self.logger.info(temp_msg)
                 configs_to_be_evaluated.append(sampled_config)
@@ -168,19 +176,38 @@ class ConfigurationSelection:
                 publish(exchange='measure_new_configuration_exchange',
                         routing_key=self.experiment.unique_id,
                         body=json.dumps({"configuration": c_to_send.to_json()}))
+        if "request_id" in request and os.environ.get('TEST_MODE') != 'UNIT_TEST':
+            # WSClient reserves the Worker slots for the selected configurations
+            publish(exchange='selected_configurations_exchange',
+                    routing_key=self.experiment.unique_id,
+                    body=json.dumps({"request_id": request["request_id"],
+                                     "configuration_ids": [c.unique_id for c in configs_to_be_evaluated]}))
 
         return configs_to_be_evaluated, hierarchical_configs
 
-    def _regular_prediction(self, needed_configs: int, number_of_predicted_configs: int):
+    def predict_batch(self, needed_configs: int, configurations: List[Configuration] = None) -> List[Configuration]:
+        """
+        Predict a batch of distinct Configurations from a single build of the models.
+        The candidates for hierarchical search space are combined from several levels, therefore the models are built
+        once per Configuration there. If the models propose less Configurations than needed, the rest is sampled.
+        :param needed_configs: number of Configurations to predict.
+        :param configurations: training data, measured Configurations of the Experiment if not specified.
+        :return: list of predicted Configurations.
+        """
+        if configurations is None:
+            configurations = self.experiment.measured_configurations
         result = []
-        while needed_configs > 0:
-            if needed_configs - number_of_predicted_configs >= 0:
-                temp_predicted = self.predictor.predict(self.experiment.measured_configurations)
-                result.extend(temp_predicted)
+        if needed_configs <= 0:
+            return result
+        with self._prediction_lock:
+            if self.experiment.search_space.is_flat:
+                result.extend(
+                    self.predictor.predict(configurations, number_of_candidates=needed_configs)[:needed_configs])
             else:
-                temp_predicted = self.predictor.predict(self.experiment.measured_configurations)
-                result.extend(temp_predicted[:needed_configs])
-            needed_configs -= number_of_predicted_configs
+                while len(result) < needed_configs:
+                    result.extend(self.predictor.predict(configurations)[:needed_configs - len(result)])
+            while len(result) < needed_configs:
+                result.extend(self.predictor.predict(configurations, True))
         return result
 
     class _EventServiceConnection(RabbitMQConnection):
@@ -1,5 +1,5 @@
 import pandas as pd
-from typing import Dict
+from typing import Dict, List
 
 from configuration_selection.model.candidate_selector.candidate_selector_abs import CandidateSelector
 
@@ -8,6 +8,7 @@ class BestMultiPoint(CandidateSelector):
     def __init__(self, candidate_selector_description: Dict):
         super().__init__(candidate_selector_description)
 
-    def select_candidates(self, candidates: pd.DataFrame) -> pd.DataFrame:
-        selected_candidates = candidates.head(self.number_of_points)
+    def select_candidates(self, candidates: pd.DataFrame, number_of_points: int = None,
+                          parameter_names: List[str] = None) -> pd.DataFrame:
+        selected_candidates = candidates.head(number_of_points or self.number_of_points)
         return selected_candidates
@@ -1,4 +1,5 @@
 import pandas as pd
+from typing import List
 from abc import ABC, abstractmethod
 
 
@@ -9,5 +10,12 @@ class CandidateSelector(ABC):
         self.number_of_points = candidate_selector_description[self.feature_name]["NumberOfPoints"]
 
     @abstractmethod
-    def select_candidates(self, candidates: pd.DataFrame) -> pd.DataFrame:
-        pass
+    def select_candidates(self, candidates: pd.DataFrame, number_of_points: int = None,
+                          parameter_names: List[str] = None) -> pd.DataFrame:
+        """
+        Select promising candidates from the optimizer output.
+        :param candidates: parameters and objective values of the candidates proposed by the optimizer(s).
+        :param number_of_points: number of candidates to select, `NumberOfPoints` of the description if not specified.
+        :param parameter_names: names of the parameter columns of the candidates, all columns if not specified.
+        :return: selected candidates.
+        """
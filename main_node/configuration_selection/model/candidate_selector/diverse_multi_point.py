@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List
+
+from configuration_selection.model.candidate_selector.candidate_selector_abs import CandidateSelector
+
+
+class DiverseMultiPoint(CandidateSelector):
+    """
+    Selects a batch of mutually distant candidates (greedy farthest-point selection).
+    The first candidate proposed by the optimizer is always selected, every next one is the candidate
+    with the largest distance to the already selected ones in the parameter space (the predicted objective values
+    are not taken into account). Numeric parameters are scaled to [0, 1], non-numeric parameters contribute 0
+    if the values are equal and 1 otherwise.
+    """
+    def __init__(self, candidate_selector_description: Dict):
+        super().__init__(candidate_selector_description)
+
+    def select_candidates(self, candidates: pd.DataFrame, number_of_points: int = None,
+                          parameter_names: List[str] = None) -> pd.DataFrame:
+        number_of_points = number_of_points or self.number_of_points
+        parameter_names = list(candidates.columns) if parameter_names is None else parameter_names
+        candidates = candidates.drop_duplicates(subset=parameter_names).reset_index(drop=True)
+        if len(candidates) <= number_of_points:
+            return candidates
+
+        parameters = candidates[parameter_names]
+        numeric = parameters.select_dtypes(include="number")
+        categorical = parameters[parameters.columns.difference(numeric.columns)].astype(str).to_numpy()
+        numeric_range = (numeric.max() - numeric.min()).replace(0, 1)
+        numeric = ((numeric - numeric.min()) / numeric_range).to_numpy(dtype=float)
+
+        def distances_to(index: int) -> np.ndarray:
+            squared = np.sum((numeric - numeric[index]) ** 2, axis=1)
+            squared += np.sum(categorical != categorical[index], axis=1)
+            return squared
+
+        selected = [0]
+        min_distances = distances_to(0)
+        while len(selected) < number_of_points:
+            next_index = int(np.argmax(min_distances))
+            selected.append(next_index)
+            min_distances = np.minimum(min_distances, distances_to(next_index))
+        return candidates.iloc[selected]
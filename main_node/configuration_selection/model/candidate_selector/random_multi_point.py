@@ -1,5 +1,5 @@
 import pandas as pd
-from typing import Dict
+from typing import Dict, List
 
 from configuration_selection.model.candidate_selector.candidate_selector_abs import CandidateSelector
 
@@ -8,7 +8,8 @@ class RandomMultiPoint(CandidateSelector):
     def __init__(self, candidate_selector_description: Dict):
         super().__init__(candidate_selector_description)
 
-    def select_candidates(self, candidates: pd.DataFrame) -> pd.DataFrame:
+    def select_candidates(self, candidates: pd.DataFrame, number_of_points: int = None,
+                          parameter_names: List[str] = None) -> pd.DataFrame:
         candidates = candidates.sample(frac=1).reset_index(drop=True)
-        selected_candidates = candidates.head(self.number_of_points)
+        selected_candidates = candidates.head(number_of_points or self.number_of_points)
         return selected_candidates
@@ -1,6 +1,11 @@
 from abc import ABC, abstractmethod
 import pandas as pd
-from typing import Tuple, Dict
+from sklearn.base import BaseEstimator
+from sklearn.pipeline import Pipeline
+from typing import Callable, Tuple, Dict
+
+from configuration_selection.model.configuration_transformer.sklearn_column_encoder import SklearnColumnTransformer
+from core_entities.search_space import Hyperparameter, CategoricalHyperparameter
 
 
 class ConfigurationTransformer(ABC):
@@ -9,6 +14,14 @@ class ConfigurationTransformer(ABC):
         self.relevant_parameters = relevant_parameters
         self.mapping_old_new_features = {}
 
+    @abstractmethod
+    def fit(self):
+        """
+        Fits the transformer once, using the boundaries and categories of the relevant hyperparameters.
+        Subsequent calls of transform and inverse_transform reuse the fitted state.
+        """
+        pass
+
     @abstractmethod
     def transform(self, features: pd.DataFrame) -> pd.DataFrame:
         """
@@ -23,6 +36,47 @@ class ConfigurationTransformer(ABC):
     def inverse_transform(self, transformed_features: pd.DataFrame) -> pd.DataFrame:
         pass
 
+    def _fit_sklearn_pipelines(self,
+                               get_encoder: Callable[[Hyperparameter], BaseEstimator]) -> Dict:
+        """
+        Helper method for sklearn fitting, which is identical for all parameter types.
+        Every relevant hyperparameter gets its own pipeline, fitted on its boundaries (numeric)
+        or on all of its categories (categorical), so the result does not depend on the transformed data.
+        :param get_encoder: creates a not fitted sklearn encoder for the hyperparameter
+        :return: mapping of the hyperparameter name to the fitted pipeline
+        """
+        mapping_old_feature_pipeline = {}
+        name = list(self.configuration_transformer_description.keys())[0]
+        for hp in self.relevant_parameters:
+            if isinstance(hp, CategoricalHyperparameter):
+                fit_data = pd.DataFrame({hp.name: hp.categories})
+            else:
+                fit_data = pd.DataFrame({hp.name: [hp.get_lower(), hp.get_upper()]})
+            encoder = SklearnColumnTransformer(get_encoder(hp), input_column_names=[hp.name])
+            features_pipeline = Pipeline([(f"{name} for {hp.name}", encoder)])
+            features_pipeline.fit(fit_data)
+            mapping_old_feature_pipeline[hp.name] = features_pipeline
+            self.mapping_old_new_features[hp.name] = encoder.out_column_names
+        return mapping_old_feature_pipeline
+
+    def _sklearn_transform(self, features: pd.DataFrame, mapping_old_feature_pipeline: Dict) -> pd.DataFrame:
+        """
+        Helper method for sklearn transformation, which is identical for all parameter types.
+        Features without a fitted pipeline are passed through, the ordering of features is preserved.
+        """
+        features = features.reset_index(drop=True)
+        relevant_features = self._filter_relevant_features(features)
+        if relevant_features.empty:
+            return pd.DataFrame()
+
+        transformed_features = []
+        for feature_name in features.columns:
+            if feature_name in mapping_old_feature_pipeline:
+                transformed_features.append(mapping_old_feature_pipeline[feature_name].transform(features[[feature_name]]))
+            else:
+                transformed_features.append(features[[feature_name]])
+        return pd.concat(transformed_features, axis=1)
+
     def _inverse_sklearn_transform(self,
                                    transformed_features: pd.DataFrame,
                                    mapping_old_feature_pipeline: Dict) -> pd.DataFrame:
@@ -64,28 +64,28 @@ class SklearnColumnTransformer(BaseEstimator, TransformerMixin):
             self.input_column_names = fit_params.get("column_names", None) or df.keys().tolist()
         self.original_data_types = df.dtypes.to_dict()
         self.transformer = self.transformer.fit(df[self.input_column_names], y=y, **fit_params)
-        return self
 
-    def transform(self, df: pd.DataFrame, y=None) -> pd.DataFrame:
-        df = df.copy(deep=True)
-        df['temp_index'] = range(1, len(df) + 1)
-        # Select needed columns
-        df_to_transform = df[self.input_column_names]
-        transformed_raw = self.transformer.transform(df_to_transform)
-
-        # Replace data in columns
-        if df_to_transform.shape != transformed_raw.shape:
+        # Names of the output columns are derived once, after fitting
+        transformed_raw = self.transformer.transform(df[self.input_column_names])
+        if len(self.input_column_names) != transformed_raw.shape[1]:
             self.out_column_names = ["_".join(self.input_column_names) + self._enc_suffix + str(x) for x in
                                      range(transformed_raw.shape[1])]
         else:
             self.out_column_names = [name + self._enc_suffix for name in self.input_column_names]
-        transformed_df = pd.DataFrame(transformed_raw, columns=self.out_column_names)
-        transformed_df['temp_index'] = range(1, len(transformed_df) + 1)
-        df = df.merge(transformed_df, on="temp_index")
+        return self
+
+    def transform(self, df: pd.DataFrame, y=None) -> pd.DataFrame:
+        # Select needed columns
+        transformed_raw = self.transformer.transform(df[self.input_column_names])
+
+        # Replace data in columns, keeping the row alignment of the input
+        transformed_df = pd.DataFrame(transformed_raw, columns=self.out_column_names, index=df.index)
         df = df.drop(columns=self.input_column_names)
-        df = df.drop(columns='temp_index')
 
-        return df
+        return pd.concat([df, transformed_df], axis=1)
+
+    def __sklearn_is_fitted__(self) -> bool:
+        return self.out_column_names is not None
 
     def inverse_transform(self, df: pd.DataFrame) -> pd.DataFrame:
         df = df.copy(deep=True)
@@ -1,8 +1,9 @@
 import itertools
 import time
 import pandas as pd
+from copy import deepcopy
 
-from typing import List, Mapping, Tuple, Dict
+from typing import List, Mapping, Tuple, Dict, Optional
 from core_entities.search_space import Hyperparameter
 from core_entities.configuration import Configuration
 
@@ -11,8 +12,11 @@ from configuration_selection.model.surrogate.surrogate_abs import Surrogate
 from configuration_selection.model.optimizer.optimizer_orchestrator import OptimizerOrchestrator
 from configuration_selection.model.optimizer.optimizer_abs import Optimizer
 from configuration_selection.model.validator.validator_orchestrator import ValidatorOrchestrator
+from configuration_selection.model.validator.validator_abs import Validator
 from configuration_selection.model.candidate_selector.candidate_selector_orchestrator import CandidateSelectorOrchestrator
 from configuration_selection.model.surrogate.composite_surrogate import CompositeSurrogate
+from configuration_selection.model.model_executor import ModelExecutor
+from configuration_selection.model.training_data import TrainingData
 
 
 class Model:
@@ -99,17 +103,26 @@ class Model:
         self.created_surrogates_descriptions_and_objectives_and_optimizer_descriptions = []
         self.model_dumps = None
 
-    def predict(self, parameters: List[Hyperparameter], configurations: List[Configuration]) -> pd.DataFrame:
+    def predict(self, parameters: List[Hyperparameter], configurations: List[Configuration],
+                number_of_candidates: int = None, training_data: TrainingData = None) -> pd.DataFrame:
         """
         Encapsulates all model related functionality.
+        The surrogates are built, validated and optimized once, all candidates are selected from the optimizer output.
+        :param parameters: hyperparameters of the region.
+        :param configurations: measured configurations, used as training data.
+        :param number_of_candidates: number of distinct candidates to propose,
+        `NumberOfPoints` of the Candidate Selector if not specified.
+        :param training_data: accumulated training data of the region, the configurations are converted from scratch
+        if not specified.
         """
         self.created_surrogates_descriptions_and_objectives_and_optimizer_descriptions = []  # clean up descriptions for transfer learning
 
         # handle multiple objectives
         names_of_parameters = [p.name for p in parameters]
 
-        data = pd.DataFrame(
-            [cfg.to_series()[names_of_parameters + list(self.objectives.keys())] for cfg in configurations])
+        if training_data is None:
+            training_data = TrainingData(names_of_parameters + list(self.objectives.keys()))
+        data = training_data.get_data(configurations)
 
         if data.empty:
             return pd.DataFrame()
@@ -125,6 +138,9 @@ class Model:
                 return pd.DataFrame(result)
 
         promising_surrogates: Mapping[Surrogate, Dict] = {}
+        # fold x surrogate work units are executed in parallel, every unit fits its own copy of the surrogate
+        mapping_unit_fold = []
+        units = []
         for k in range(len(train_features)):
             for s in self.mapping_surrogate_objective.keys():
                 considered_objectives = self.mapping_surrogate_objective[s]
@@ -141,25 +157,22 @@ class Model:
                                 empty or inner_test_labels[0].empty):
                             continue
 
-                    was_not_built_or_validated = False
+                    mapping_unit_fold.append((s, len(units), len(inner_train_features)))
                     for k2 in range(len(inner_train_features)):
-                        is_built = s.create(inner_train_features[k2], inner_train_labels[k2])
-                        if not is_built:
-                            was_not_built_or_validated = True
-                            continue
-                        is_valid, _ = self.internal_validator.validate(s, inner_test_features[k2], inner_test_labels[k2])
-                        if not is_valid:
-                            was_not_built_or_validated = True
-                            continue
-                    if was_not_built_or_validated:
-                        continue
-                    promising_surrogates[s] = considered_objectives
+                        units.append((s, self.internal_validator, inner_train_features[k2], inner_train_labels[k2],
+                                      inner_test_features[k2], inner_test_labels[k2]))
                 else:
                     # create surrogate
-                    is_built = s.create(train_features[k], train_labels_filtered)
-                    if not is_built:
-                        return pd.DataFrame()
-                    promising_surrogates[s] = considered_objectives
+                    mapping_unit_fold.append((s, len(units), 1))
+                    units.append((s, None, train_features[k], train_labels_filtered, None, None))
+
+        unit_results = ModelExecutor().map(_fit_and_validate, units)
+        for s, first_unit, number_of_units in mapping_unit_fold:
+            fold_results = unit_results[first_unit:first_unit + number_of_units]
+            if all(is_valid for is_valid, _ in fold_results):
+                promising_surrogates[s] = self.mapping_surrogate_objective[s]
+            elif self.internal_validator is None:
+                return pd.DataFrame()
 
         surrogates_for_outer_validation = []
         if (self.mo_handling_surrogate_type == "Compositional" or self.
@@ -194,35 +207,30 @@ class Model:
                 surrogates_for_outer_validation.append(s)
 
         # outer validation
+        units = [(s, self.external_validator, train_features[k], train_labels[k], test_features[k], test_labels[k])
+                 for s in surrogates_for_outer_validation for k in range(len(train_features))]
+        unit_results = iter(ModelExecutor().map(_fit_and_validate, units))
         validated_surrogates: Dict[Surrogate, float] = {}
         for s in surrogates_for_outer_validation:
-            was_not_built_or_validated = False
-            score = 0.0
-            for k in range(len(train_features)):
-                is_built = s.create(train_features[k], train_labels[k])
-                if not is_built:
-                    was_not_built_or_validated = True
-                    break
-                is_valid, score = self.external_validator.validate(s, test_features[k], test_labels[k])
-                if not is_valid:
-                    was_not_built_or_validated = True
-                    break
-            if not was_not_built_or_validated:
-                validated_surrogates[s] = score
+            fold_results = [next(unit_results) for _ in range(len(train_features))]
+            if all(is_valid for is_valid, _ in fold_results):
+                validated_surrogates[s] = fold_results[-1][1]
 
         # sort by validation score
         validated_surrogates = dict(sorted(validated_surrogates.items(), key=lambda item: item[1], reverse=True))
 
         # create surrogates depending on MO handling type
-        created_surrogates = []
         start_time = time.time()
 
-        for s in validated_surrogates:
-            b = s.create(features, labels)
-            if b:
+        surrogates_to_create = list(validated_surrogates)
+        if self.mo_handling_surrogate_type == "DynamicCompositional":
+            surrogates_to_create = surrogates_to_create[:1]
+        fitted_states = ModelExecutor().map(_build, [(s, features, labels) for s in surrogates_to_create])
+        created_surrogates = []
+        for s, fitted_state in zip(surrogates_to_create, fitted_states):
+            if fitted_state is not None:
+                s.set_fitted_state(fitted_state)
                 created_surrogates.append(s)
-            if self.mo_handling_surrogate_type == "DynamicCompositional":
-                break
 
         if len(created_surrogates) == 0:
             return pd.DataFrame()
@@ -258,9 +266,12 @@ class Model:
         else:
             names_and_objectives = [r.name for r in self.region] + ["Y"]
 
-        selected_candidates = self.candidate_selector.select_candidates(optimized_full[names_and_objectives])
+        # several surrogates or optimizers could propose the same configuration
+        optimized_full = optimized_full[names_and_objectives].drop_duplicates(subset=[r.name for r in self.region])
+        selected_candidates = self.candidate_selector.select_candidates(optimized_full, number_of_candidates,
+                                                                        [r.name for r in self.region])
 
-        return pd.DataFrame(selected_candidates)
+        return pd.DataFrame(selected_candidates).reset_index(drop=True)
 
     def update_surrogates_and_optimizers(self, surrogates_description_and_objectives_and_optimizers_description: List):
         """
@@ -297,3 +308,36 @@ class Model:
             del self.mapping_optimizer_objective[opt]
         for opt_transferred in optimizers:
             self.mapping_optimizer_objective[opt_transferred] = opt_transferred.objectives
+
+
+def _fit_and_validate(surrogate: Surrogate, validator: Optional[Validator], train_features: pd.DataFrame,
+                      train_labels: pd.DataFrame, test_features: pd.DataFrame,
+                      test_labels: pd.DataFrame) -> Tuple[bool, float]:
+    """
+    Work unit of the Model build: fit a copy of the surrogate on a fold and validate it.
+    The surrogate itself is not changed, since the surrogates (e.g. parts of Composite Surrogates) could be shared.
+    :param validator: Validator, or None if the surrogate should be only fitted.
+    :return: whether the surrogate was built and valid, and the validation score.
+    """
+    surrogate = _copy_surrogate(surrogate)
+    if not surrogate.create(train_features, train_labels):
+        return False, 0.0
+    if validator is None:
+        return True, 0.0
+    return validator.validate(surrogate, test_features, test_labels)
+
+
+def _build(surrogate: Surrogate, features: pd.DataFrame, labels: pd.DataFrame) -> Optional[Dict]:
+    """
+    Work unit of the Model build: fit a copy of the surrogate on all data.
+    :return: fitted state of the surrogate, or None if it could not be built.
+    """
+    surrogate = _copy_surrogate(surrogate)
+    return surrogate.get_fitted_state() if surrogate.create(features, labels) else None
+
+
+def _copy_surrogate(surrogate: Surrogate) -> Surrogate:
+    # hyperparameters of the region are shared with the optimizers and the search space, they are not copied
+    memo = {id(surrogate.region): surrogate.region}
+    memo.update({id(hp): hp for hp in surrogate.region})
+    return deepcopy(surrogate, memo)
@@ -0,0 +1,75 @@
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Iterable, List, Tuple
+
+from tools.singleton import Singleton
+
+
+class ModelExecutor(metaclass=Singleton):
+    """
+    Runs independent work units of the Model build (fitting and validation of surrogates on folds) in parallel.
+
+    The kind of the pool and the number of workers are configured by the environment variables
+    `BRISE_MODEL_EXECUTOR` (`thread` - default, `process` or `serial`) and `BRISE_MODEL_EXECUTOR_WORKERS`
+    (default - number of available cores). Threads are enough for the most of surrogates, since numpy, scipy and
+    sklearn release the GIL. The results are always returned in the order of the work units.
+    """
+
+    def __init__(self, kind: str = None, workers: int = None):
+        """
+        :param kind: `thread`, `process` or `serial`.
+        :param workers: maximal number of concurrently executed work units.
+        """
+        self.kind = kind or os.getenv("BRISE_MODEL_EXECUTOR", "thread")
+        self.workers = workers or int(os.getenv("BRISE_MODEL_EXECUTOR_WORKERS", "0")) or os.cpu_count() or 1
+        if self.kind not in ("thread", "process", "serial"):
+            raise ValueError(f"Unknown type of Model executor: {self.kind}")
+        self.logger = logging.getLogger(__name__)
+        self._executor: Executor = None
+        self._lock = threading.Lock()
+        self._in_worker = threading.local()
+
+    def map(self, function: Callable, units: Iterable[Tuple]) -> List:
+        """
+        Execute the function for every work unit and wait for all results.
+        :param function: module-level function (it should be picklable for the process pool).
+        :param units: arguments of the function, one tuple per work unit.
+        :return: list of results, in the order of the units.
+        """
+        units = list(units)
+        # nested calls from a worker thread are executed inline to avoid the pool starvation
+        if len(units) <= 1 or self.kind == "serial" or self.workers <= 1 or getattr(self._in_worker, "value", False):
+            return [function(*unit) for unit in units]
+        executor = self._get_executor()
+        if self.kind == "thread":
+            futures = [executor.submit(self._run_in_worker, function, unit) for unit in units]
+        else:
+            futures = [executor.submit(function, *unit) for unit in units]
+        return [future.result() for future in futures]
+
+    def _run_in_worker(self, function: Callable, unit: Tuple):
+        self._in_worker.value = True
+        try:
+            return function(*unit)
+        finally:
+            self._in_worker.value = False
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "thread":
+                    self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="model-executor")
+                else:
+                    # the main-node holds open connections and threads, which should not be forked
+                    self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+                self.logger.info(f"Model executor started: {self.kind} pool with {self.workers} workers.")
+            return self._executor
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
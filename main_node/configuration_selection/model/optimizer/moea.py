@@ -60,9 +60,14 @@ class MOEA(Optimizer):
 
     def optimize(self, surrogate: Surrogate) -> pd.DataFrame:
         problem = self._PygmoProblem(optimizer=self, surrogate=surrogate)
-        population = pg.population(problem, self.pop_size)
+        # the whole population (or generation) is evaluated by the problem's batch_fitness in one call
+        bfe = pg.bfe(pg.member_bfe())
+        population = pg.population(problem, self.pop_size, b=bfe)
         for algo_name in self.algorithms:
-            algo = pg.algorithm(getattr(pg, algo_name)(gen=self.generations))
+            uda = getattr(pg, algo_name)(gen=self.generations)
+            if hasattr(uda, "set_bfe"):  # not all pygmo algorithms support batch evaluation
+                uda.set_bfe(bfe)
+            algo = pg.algorithm(uda)
             population = algo.evolve(population)
 
         optimized_features = pd.DataFrame(population.get_x(), columns=self.params)
@@ -95,25 +100,32 @@ class MOEA(Optimizer):
                 self._optimizer._resolve_configuration_transformers(surrogate))
 
         def fitness(self, x):
+            return self.batch_fitness(x)
+
+        def batch_fitness(self, dvs):
+            """
+            Evaluates several decision vectors at once.
+            :param dvs: decision vectors, concatenated into one flat array as required by pygmo
+            :return: fitness vectors, concatenated into one flat array
+            """
             temp_params = self._params.copy()
-            temp_x = x
+            temp_x = np.asarray(dvs, dtype=float).reshape(-1, len(self._params))
             for p, val_ind in self._optimizer.masked_params.items():
                 temp_params.insert(val_ind[1], p)
-                temp_x = np.insert(temp_x, val_ind[1], val_ind[0])
-            x = dict(map(lambda i, j: (i, j), temp_params, temp_x))
+                temp_x = np.insert(temp_x, val_ind[1], val_ind[0], axis=1)
 
-            x = pd.Series(x)
+            x_df = pd.DataFrame(temp_x, columns=temp_params)
 
             if self._inverse_transform_optimizer:
-                x_df = pd.DataFrame(columns=x.index)
-                x_df.loc[0] = x.values
                 x_df = self._optimizer._inverse_transform_configuration(x_df)
-                x = x_df.loc[0]
 
-            result = self._surrogate.predict(x, self._transform_surrogate)
+            result = self._surrogate.predict_batch(x_df, self._transform_surrogate)
 
             transformed_result = self._optimizer._transform_values(result)
-            return transformed_result.values.flatten().tolist()
+            return transformed_result.values.flatten()
+
+        def has_batch_fitness(self):
+            return True
 
         def get_nobj(self):
             return len(self._objectives) if not self._surrogate.scalarized else 1
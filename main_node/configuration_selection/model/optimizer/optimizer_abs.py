@@ -72,31 +72,37 @@ class Optimizer(ABC):
         features = features.reset_index(drop=True)
         if len(self.mapping_config_transformer_parameter) > 0:
             transformed_names = sum([[hp.name for hp in p] for p in self.mapping_config_transformer_parameter.values()], [])
-            transformed_features = pd.DataFrame()
+            transformed_columns = []
             for f_name in features.columns:
                 if f_name in transformed_names:
                     for ct, p in self.mapping_config_transformer_parameter.items():
                         for hp in p:
                             if hp.name == f_name:
-                                transformed_relevant_features = ct.transform(pd.DataFrame(features.loc[:, hp.name]))
-                                if transformed_features.empty:
-                                    transformed_features = transformed_relevant_features
-                                else:
-                                    transformed_features = transformed_features.join(transformed_relevant_features)
+                                transformed_columns.append(ct.transform(pd.DataFrame(features.loc[:, hp.name])))
                 else:
-                    if transformed_features.empty:
-                        transformed_features = pd.DataFrame(features.loc[:, f_name])
-                    else:
-                        transformed_features = transformed_features.join(pd.DataFrame(features.loc[:, f_name]))
+                    transformed_columns.append(pd.DataFrame(features.loc[:, f_name]))
+            # join all columns at once, transformers preserve the row alignment
+            transformed_features = pd.concat(transformed_columns, axis=1) if transformed_columns else pd.DataFrame()
         else:
             transformed_features = features
         return transformed_features
 
-    def _inverse_transform_configuration(self, optimized_features: pd.DataFrame) -> pd.DataFrame:
+    def _inverse_transform_configuration(
+            self, optimized_features: pd.DataFrame,
+            mapping_config_transformer_parameter: Mapping[ConfigurationTransformer, Tuple[Hyperparameter]] = None
+    ) -> pd.DataFrame:
+        """
+        :param optimized_features: configurations in the transformed space.
+        :param mapping_config_transformer_parameter: configuration transformers to be inverted,
+        the transformers of the optimizer if not specified.
+        :return: configurations in the space of the hyperparameters.
+        """
+        if mapping_config_transformer_parameter is None:
+            mapping_config_transformer_parameter = self.mapping_config_transformer_parameter
         result = pd.DataFrame()
         involved_features = set()  # features involved in configuration transformers
         for new_hp_name in optimized_features.columns:
-            for ct, params in self.mapping_config_transformer_parameter.items():
+            for ct, params in mapping_config_transformer_parameter.items():
                 for old_f, new_f in ct.mapping_old_new_features.items():
                     if new_hp_name not in new_f:
                         continue
@@ -17,14 +17,9 @@ class RandomSearch(Optimizer):
         """
         :returns: pd.Dataframe: (n,m), where n is sampling size and m the number of parameters
         """
-        predicted = pd.DataFrame()
-        for i in range(self.sampling_size):
-            # sample pd.Series
-            configuration = self.sampler.sample()
-            configuration_as_series: pd.Series = configuration.iloc[0]
-            # predict value
-            prediction = surrogate.predict(configuration_as_series)
-            evaluated_configuration = configuration.join(prediction)
-            predicted = pd.concat([predicted, evaluated_configuration])
+        # sample all configurations first and predict them with one call to the surrogate
+        sampled = self.sampler.sample_batch(self.sampling_size)
+        prediction = surrogate.predict_batch(sampled)
+        predicted = sampled.join(prediction)
 
         return predicted
@@ -0,0 +1,89 @@
+from typing import Dict, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from scipy.stats import truncnorm
+
+from core_entities.search_space import CategoricalHyperparameter, IntegerHyperparameter, NumericHyperparameter
+from configuration_selection.model.optimizer.optimizer_abs import Optimizer
+from configuration_selection.model.surrogate.surrogate_abs import Surrogate
+from configuration_selection.model.surrogate.tree_parzen_estimator import TreeParzenEstimator
+from configuration_selection.sampling.mersenne_twister import MersenneTwister
+
+
+class TpeSampling(Optimizer):
+    """
+    Draws the candidates directly from the density of good configurations of the Tree Parzen Estimator, as BOHB does,
+    and evaluates all of them with one call to the surrogate, so no iterative optimization of the surrogate is needed.
+    Every candidate is a perturbation of a randomly picked good configuration: continuous values are drawn from
+    the truncated normal distribution with the widened KDE bandwidth, discrete values are kept with the probability
+    (1 - bandwidth) and replaced by a random value otherwise.
+    Surrogates other than the Tree Parzen Estimator are evaluated on uniformly sampled candidates, as by Random Search.
+    """
+    def __init__(self, optimizer_description: Dict, region: Tuple, objectives: Dict):
+        super().__init__(optimizer_description, region, objectives)
+        self.sampling_size = optimizer_description["Instance"][self.feature_name]["SamplingSize"]
+        self.sampler = MersenneTwister({}, region)
+        self.random_generator = np.random.default_rng()
+
+    def optimize(self, surrogate: Surrogate) -> pd.DataFrame:
+        """
+        :returns: pd.Dataframe: (n,m), where n is sampling size and m the number of parameters and objectives,
+        sorted by the (transformed) predicted values.
+        """
+        if isinstance(surrogate, TreeParzenEstimator) and surrogate.model:
+            sampled = self._sample_good_density(surrogate)
+        else:
+            sampled = self.sampler.sample_batch(self.sampling_size)
+        prediction = self._transform_values(surrogate.predict_batch(sampled))
+        labels = ["Y"] if surrogate.scalarized else list(self.objectives.keys())
+        prediction = pd.DataFrame(prediction.to_numpy(), columns=labels)
+        # the transformed values (e.g. TPE_EI ratio) are minimized, as by MOEA
+        return sampled.join(prediction).sort_values(by=labels, kind="stable").reset_index(drop=True)
+
+    def _sample_good_density(self, surrogate: TreeParzenEstimator) -> pd.DataFrame:
+        good_kde = surrogate.model["good"]
+        bandwidths = np.maximum(np.asarray(good_kde.bw, dtype=float) * surrogate.bandwidth_factor,
+                                surrogate.min_bandwidth)
+        centers = good_kde.data[self.random_generator.integers(len(good_kde.data), size=self.sampling_size)]
+        domains = self._get_column_domains(surrogate)
+
+        sampled = np.empty(centers.shape)
+        for i, (column, vartype) in enumerate(zip(surrogate.columns, surrogate.kde_vartypes)):
+            if vartype == 'c':
+                lower, upper = domains[column]
+                a = (lower - centers[:, i]) / bandwidths[i]
+                b = (upper - centers[:, i]) / bandwidths[i]
+                sampled[:, i] = truncnorm.rvs(a, b, loc=centers[:, i], scale=bandwidths[i],
+                                              random_state=self.random_generator)
+            else:
+                is_kept = self.random_generator.random(self.sampling_size) < 1 - bandwidths[i]
+                random_values = self.random_generator.choice(domains[column], size=self.sampling_size)
+                sampled[:, i] = np.where(is_kept, centers[:, i], random_values)
+
+        sampled = pd.DataFrame(sampled, columns=surrogate.columns)
+        sampled = self._inverse_transform_configuration(sampled, surrogate.mapping_config_transformer_parameter)
+        for hp in self.region:
+            if isinstance(hp, IntegerHyperparameter):
+                sampled[hp.name] = np.clip(np.round(sampled[hp.name].to_numpy(dtype=float)),
+                                           hp.get_lower(), hp.get_upper()).astype(int)
+        return sampled[[hp.name for hp in self.region]]
+
+    def _get_column_domains(self, surrogate: Surrogate) -> Dict[str, Union[Tuple[float, float], np.ndarray]]:
+        """
+        :return: bounds of every continuous column and possible values of every discrete column
+        in the space of the surrogate.
+        """
+        domains = {}
+        for hp in self.region:
+            if isinstance(hp, NumericHyperparameter):
+                transformed = surrogate._transform_configuration(
+                    pd.DataFrame({hp.name: [hp.get_lower(), hp.get_upper()]}))
+                for column in transformed.columns:
+                    values = transformed[column].to_numpy(dtype=float)
+                    domains[column] = (values.min(), values.max())
+            elif isinstance(hp, CategoricalHyperparameter):
+                transformed = surrogate._transform_configuration(pd.DataFrame({hp.name: hp.categories}))
+                for column in transformed.columns:
+                    domains[column] = np.unique(transformed[column].to_numpy(dtype=float))
+        return domains
@@ -1,7 +1,8 @@
 import logging
 import pickle
 import os
-from typing import List, Mapping, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Mapping, Set, Tuple
 
 import pandas as pd
 
@@ -11,6 +12,8 @@ from core_entities.search_space import Hyperparameter
 from core_entities.search_space import SearchSpace
 from tools.mongo_dao import MongoDB
 from configuration_selection.model.model import Model
+from configuration_selection.model.model_executor import ModelExecutor
+from configuration_selection.model.training_data import TrainingData
 
 
 class Predictor:
@@ -49,6 +52,12 @@ class Predictor:
             model = Model(model_description=type, region=r, objectives=self.task_config["Objectives"])
             self.mapping_region_model[r] = model
 
+        # training data is accumulated per region, every measured Configuration is converted only once
+        self.mapping_region_training_data = {}
+        for r in self.search_space.regions:
+            self.mapping_region_training_data[r] = TrainingData(
+                [hp.name for hp in r] + list(self.task_config["Objectives"].keys()))
+
         self.mapping_region_sampling_strategy = {}
         for r in self.search_space.regions:
             sampling_strategy = (self.sampling_strategy_orchestrator.
@@ -60,11 +69,14 @@ class Predictor:
 
         self.logger = logging.getLogger(__name__)
 
-    def predict(self, measured_configurations: List[Configuration], sample: bool = False) -> List[Configuration]:
+    def predict(self, measured_configurations: List[Configuration], sample: bool = False,
+                number_of_candidates: int = None) -> List[Configuration]:
         """
         Predict or sample one or multiple configurations
         :param measured_configurations: list of already measured configurations
         :param sample: whether to fully sample or do a surrogate-based prediction
+        :param number_of_candidates: number of configurations to predict from a single build of the models,
+        `NumberOfPoints` of the Candidate Selectors if not specified. Ignored for sampling.
         :return: list of predicted configurations
         """
 
@@ -87,8 +99,11 @@ class Predictor:
         while len(activated_regions) > 0:
             self.search_space.next_level()
             next_activated_regions: Set[Tuple[Hyperparameter]] = set()
-            for region in activated_regions:
-                if not sample:
+            activated_regions = list(activated_regions)  # fix the order, in which the regions are joined
+            mapping_region_partial_configuration = {}
+            if not sample:
+                mapping_region_considered_configs = {}
+                for region in activated_regions:
                     considered_hp_names_in_region = [hp.name for hp in region]
                     considered_hp_names += considered_hp_names_in_region
                     considered_activation_category = [hp.activation_category for hp in region][0]
@@ -97,17 +112,24 @@ class Predictor:
                     # filter according to the considered activation category for the current region
                     if considered_parent_hp_name != "root":
                         considered_configs = list(filter(lambda cfg:
-                               cfg.parameters[considered_parent_hp_name] == considered_activation_category,
+                               cfg.get_parameter(considered_parent_hp_name) == considered_activation_category,
                                considered_configs))
                     # filter according to the region
                     if len(considered_configs) > 0 and considered_parent_hp_name != "root":
                         logging.info("Considered Configs: " + " ".join([c.__str__() for c in considered_configs]))
                         logging.info("REGION: " + str(region.__str__()))
+                    considered_hp_names_in_region_set = set(considered_hp_names_in_region)
                     considered_configs = list(filter(
-                        lambda cfg: any(map(lambda x: x in considered_hp_names_in_region, list(cfg.parameters.keys()))),
+                        lambda cfg: not considered_hp_names_in_region_set.isdisjoint(cfg.get_parameters_names()),
                         considered_configs  # Input data for filter
                     ))
-                    partial_configuration = self.mapping_region_model[region].predict(list(region), considered_configs)
+                    mapping_region_considered_configs[region] = considered_configs
+                mapping_region_partial_configuration = self._predict_regions(
+                    mapping_region_considered_configs, number_of_candidates)
+
+            for region in activated_regions:
+                if not sample:
+                    partial_configuration = mapping_region_partial_configuration[region]
 
                     if partial_configuration.empty:
                         configuration_type = Configuration.Type.FROM_SELECTOR
@@ -175,6 +197,27 @@ class Predictor:
         self.store_model_dumps_to_db()
         return predicted_configurations
 
+    def _predict_regions(self, mapping_region_considered_configs: Dict[Tuple[Hyperparameter], List[Configuration]],
+                         number_of_candidates: int = None) -> Dict[Tuple[Hyperparameter], pd.DataFrame]:
+        """
+        Build and optimize the models of the activated regions of one level.
+        The regions of the same level are independent, so their models are processed concurrently.
+        :param mapping_region_considered_configs: measured configurations to be used by the model of each region.
+        :param number_of_candidates: number of configurations to predict by each model.
+        :return: configurations, predicted for each region (empty if the model could not be built).
+        """
+        def predict(region: Tuple[Hyperparameter]) -> pd.DataFrame:
+            return self.mapping_region_model[region].predict(
+                list(region), mapping_region_considered_configs[region], number_of_candidates,
+                self.mapping_region_training_data[region])
+
+        regions = list(mapping_region_considered_configs.keys())
+        workers = min(len(regions), ModelExecutor().workers)
+        if workers <= 1 or ModelExecutor().kind == "serial":
+            return {region: predict(region) for region in regions}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="region-predictor") as executor:
+            return dict(zip(regions, executor.map(predict, regions)))
+
     def store_model_dumps_to_db(self):
         # initialize connection to the database
         database = MongoDB(os.getenv("BRISE_DATABASE_HOST"),
@@ -182,15 +225,10 @@ class Predictor:
                            os.getenv("BRISE_DATABASE_NAME"),
                            os.getenv("BRISE_DATABASE_USER"),
                            os.getenv("BRISE_DATABASE_PASS"))
-        if database.get_last_record_by_experiment_id("Transfer_learning_info", self.experiment_id) is None:
-            database.write_one_record("Transfer_learning_info",
-                                      {"Exp_unique_ID": self.experiment_id,
-                                       "Models_dumps": self.hierarchical_models_dumps})
-        else:
-            database.update_record(
-                "Transfer_learning_info",
-                {"Exp_unique_ID": self.experiment_id},
-                {"Models_dumps": self.hierarchical_models_dumps})
+        database.upsert_record(
+            "Transfer_learning_info",
+            {"Exp_unique_ID": self.experiment_id},
+            {"Models_dumps": self.hierarchical_models_dumps})
 
     def update_mapping_region_model(self, transferred_mapping_region_model):
         """
@@ -1,10 +1,13 @@
 import pandas as pd
-from typing import Tuple
+from typing import Dict, Tuple
 
 from configuration_selection.model.surrogate.surrogate_abs import Surrogate
 
 
 class CompositeSurrogate(Surrogate):
+    # the sub-surrogates are cached separately
+    CACHEABLE = False
+
     def __init__(self, surrogates: Tuple[Surrogate], region: Tuple):
         self.surrogates = surrogates
         objectives = {}
@@ -17,20 +20,27 @@ class CompositeSurrogate(Surrogate):
         super().__init__(surrogate_description, region, objectives)
         self.multi_objective = True
 
-    def create(self, features: pd.DataFrame, labels: pd.DataFrame) -> bool:
+    def _fit(self, features: pd.DataFrame, labels: pd.DataFrame) -> bool:
         is_built = []
         for s in self.surrogates:
             i_b = s.create(features, labels[list(s.objectives.keys())])
             is_built.append(i_b)
         return all(is_built) is True
 
-    def predict(self, cfg: pd.Series, transform: bool = True) -> pd.DataFrame:
+    def get_fitted_state(self) -> Dict:
+        return {"surrogates": [s.get_fitted_state() for s in self.surrogates]}
+
+    def set_fitted_state(self, state: Dict) -> None:
+        for s, s_state in zip(self.surrogates, state["surrogates"]):
+            s.set_fitted_state(s_state)
+
+    def predict_batch(self, configurations: pd.DataFrame, transform: bool = True) -> pd.DataFrame:
         result = pd.DataFrame()
 
         for s in self.surrogates:
             if result.empty:
-                result = s.predict(cfg, transform)
+                result = s.predict_batch(configurations, transform)
             else:
-                temp = s.predict(cfg, transform)
+                temp = s.predict_batch(configurations, transform)
                 result = result.join(temp)
         return result
@@ -0,0 +1,82 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Dict, Tuple, Union
+
+import pandas as pd
+
+from tools.singleton import Singleton
+
+
+class FitCache(metaclass=Singleton):
+    """
+    Content-addressed cache of fitted surrogates, shared by all Models of the process.
+
+    The key is built from the surrogate type and description (including its configuration and value transformers),
+    the objectives, the region and a hash of the training data. Therefore, an identical fit within an iteration
+    (e.g. sub-surrogates of several Composite Surrogates, validation folds) or across iterations is reused.
+    The least recently used fits are evicted when the cache is full.
+    """
+
+    def __init__(self, max_size: int = 256):
+        """
+        :param max_size: maximal number of cached fits.
+        """
+        self.max_size = max_size
+        self._fits: Dict[str, Tuple[bool, Dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_key(surrogate, features: pd.DataFrame, labels: pd.DataFrame) -> str:
+        """
+        :param surrogate: Surrogate instance to be fitted.
+        :param features: training features.
+        :param labels: training labels.
+        :return: key of the fit.
+        """
+        digest = hashlib.sha1()
+        digest.update(json.dumps([type(surrogate).__name__,
+                                  surrogate.surrogate_description,
+                                  surrogate.objectives,
+                                  [hp.name for hp in surrogate.region]], sort_keys=True, default=str).encode("utf-8"))
+        for frame in (features, labels):
+            digest.update(json.dumps([str(column) for column in frame.columns]).encode("utf-8"))
+            # row indices are hashed as well, since some surrogates rely on them
+            digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Union[Tuple[bool, Dict[str, Any]], None]:
+        """
+        :param key: key of the fit.
+        :return: a copy of the cached result of the fit and the fitted state, or None if the fit is not cached.
+        """
+        with self._lock:
+            cached = self._fits.get(key)
+            if cached is None:
+                self.misses += 1
+                return None
+            self._fits.move_to_end(key)
+            self.hits += 1
+        is_built, state = cached
+        return is_built, deepcopy(state)
+
+    def put(self, key: str, is_built: bool, state: Dict[str, Any]) -> None:
+        """
+        :param key: key of the fit.
+        :param is_built: result of the fit.
+        :param state: fitted state of the surrogate, it is copied.
+        """
+        state = deepcopy(state)
+        with self._lock:
+            self._fits[key] = (is_built, state)
+            self._fits.move_to_end(key)
+            while len(self._fits) > self.max_size:
+                self._fits.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fits.clear()
@@ -1,48 +1,49 @@
 import random
 
+import numpy as np
 import pandas as pd
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 from configuration_selection.model.surrogate.surrogate_abs import Surrogate
 
 
 class ModelMock(Surrogate):
+    # nothing is fitted
+    CACHEABLE = False
+
     def __init__(self, surrogate_description: Dict, region: Tuple, objectives: Dict):
         super().__init__(surrogate_description, region, objectives)
         self.multi_objective = surrogate_description['Instance']['ModelMock']['MultiObjective']
 
-    def create(self, features: pd.DataFrame, labels: pd.DataFrame) -> bool:
+    def _fit(self, features: pd.DataFrame, labels: pd.DataFrame) -> bool:
         return True
 
-    def predict(self, cfg: pd.Series, transform: bool = True) -> pd.DataFrame:
-        mapping_predicted_objective: Dict[float, str] = {}
+    def predict_batch(self, configurations: pd.DataFrame, transform: bool = True) -> pd.DataFrame:
+        mapping_objective_predicted: Dict[str, List[float]] = {}
         for o in self.objectives:
-            mapping_predicted_objective[random.random()] = o
-        transformed_prediction = self._transform(mapping_predicted_objective)
+            mapping_objective_predicted[o] = [random.random() for _ in range(len(configurations))]
+        transformed_prediction = self._transform(mapping_objective_predicted)
 
         return transformed_prediction
 
-    def _transform(self, mapping_predicted_objective: Dict[float, str]) -> pd.DataFrame:
+    def _transform(self, mapping_objective_predicted: Dict[str, List[float]]) -> pd.DataFrame:
         """
-        Transform a floating point value between 0 and 1 into a DataFrame according to the Objective type.
-        :param df: Floating-point value to be transformed.
+        Transform floating point values between 0 and 1 into a DataFrame according to the Objective type.
+        :param mapping_objective_predicted: Floating-point values to be transformed, per objective.
         :return: Transformed DataFrame.
         """
         transformed_values = pd.DataFrame()  # transform based on the Objective type
-        for value, objective in mapping_predicted_objective.items():
+        for objective, values in mapping_objective_predicted.items():
+            values = np.array(values, dtype=float)
+            lower = self.objectives[objective]["MinExpectedValue"]
+            upper = self.objectives[objective]["MaxExpectedValue"]
             if self.objectives[objective]["DataType"].__eq__("float"):
-                transformed_value = self.objectives[objective]["MinExpectedValue"] + value * (self.objectives[objective]["MaxExpectedValue"] - self.objectives[objective]["MinExpectedValue"])
+                transformed_value = lower + values * (upper - lower)
             elif self.objectives[objective]["DataType"].__eq__("int"):
-                transformed_value = round(self.objectives[objective]["MinExpectedValue"] + value * (self.objectives[objective]["MaxExpectedValue"] - self.objectives[objective]["MinExpectedValue"]))
+                transformed_value = np.round(lower + values * (upper - lower)).astype(int)
             else:
                 raise NotImplementedError  # Objective function types except of numeric are not supported!
 
-            if transformed_values.empty:
-                transformed_values = pd.DataFrame(columns=[self.objectives[objective]["Name"]])
-                transformed_values.loc[0] = transformed_value
-            else:
-                temp = pd.DataFrame(columns=[self.objectives[objective]["Name"]])
-                temp.loc[0] = transformed_value
-                transformed_values = transformed_values.join(temp)
+            transformed_values[self.objectives[objective]["Name"]] = transformed_value
 
         return transformed_values
@@ -8,15 +8,85 @@ from configuration_selection.model.surrogate.surrogate_abs import Surrogate
 from core_entities.search_space import CategoricalHyperparameter
 
 
+class ArmStatistics:
+    """
+    Running statistics of the arms (categories of every hyperparameter): number of pulls and the sum of rewards,
+    as well as the mean and the sum of squared deviations of all rewards (Welford/Chan update).
+
+    The training data of subsequent builds usually extends the data of the previous build, then only the new rows
+    are added. Otherwise (e.g. for the validation folds), the statistics are collected from scratch.
+
+    Limitation: surrogates receive the whole training data on every build, therefore the update still compares
+    the stored rows with the prefix of the new data, which is O(n) per build (vectorized, the rewards are compared
+    first). If `WindowSize` < 1 shifts the training window, or the value transformers re-scale the previous rewards,
+    the prefix does not match and the statistics are rebuilt from scratch, as before.
+    """
+
+    def __init__(self, region: Tuple):
+        self.names = [hp.name for hp in region]
+        self.mapping_name_categories = {hp.name: list(hp.categories) for hp in region}
+        self.reset()
+
+    def reset(self) -> None:
+        self.pulls = {name: np.zeros(len(categories)) for name, categories in self.mapping_name_categories.items()}
+        self.rewards_sum = {name: np.zeros(len(categories)) for name, categories in self.mapping_name_categories.items()}
+        self.features = np.empty((0, len(self.names)), dtype=object)
+        self.rewards = np.empty(0)
+        self.mean = 0.0
+        self.squared_deviations = 0.0
+
+    def update(self, features: pd.DataFrame, rewards: np.ndarray) -> None:
+        """
+        :param features: all pulled arms, one row per pull and one column per hyperparameter.
+        :param rewards: all obtained rewards.
+        """
+        seen = len(self.rewards)
+        # the rewards are cheaper to compare, they also differ if the window is shifted or the rewards are re-scaled
+        is_extended = seen <= len(rewards) and np.array_equal(rewards[:seen], self.rewards)
+        values = features[self.names].to_numpy(dtype=object)
+        if not is_extended or not np.array_equal(values[:seen], self.features):
+            self.reset()
+            seen = 0
+        new_values, new_rewards = values[seen:], rewards[seen:]
+        if len(new_rewards) == 0:
+            return
+
+        for i, name in enumerate(self.names):
+            codes = pd.Categorical(new_values[:, i], categories=self.mapping_name_categories[name]).codes
+            pulled = codes >= 0  # values, which are not categories of the hyperparameter, are ignored
+            np.add.at(self.pulls[name], codes[pulled], 1)
+            np.add.at(self.rewards_sum[name], codes[pulled], new_rewards[pulled])
+
+        # merge the mean and the squared deviations of the new rewards
+        new_mean = float(np.mean(new_rewards))
+        new_squared_deviations = float(np.sum((new_rewards - new_mean) ** 2))
+        total = seen + len(new_rewards)
+        delta = new_mean - self.mean
+        self.mean += delta * len(new_rewards) / total
+        self.squared_deviations += new_squared_deviations + delta ** 2 * seen * len(new_rewards) / total
+
+        self.features = values
+        self.rewards = rewards.copy()
+
+    def get_std(self) -> float:
+        return float(np.sqrt(self.squared_deviations / len(self.rewards))) if len(self.rewards) > 0 else 0.0
+
+
 class MultiArmedBandit(Surrogate):
+    # the fit is incremental, while a cached fit would copy the whole history of the arm statistics on every build
+    CACHEABLE = False
+    FITTED_ATTRIBUTES = ("arm_statistics", "ucb_values")
 
     def __init__(self, surrogate_description: Dict, region: Tuple, objectives: Dict):
         super().__init__(surrogate_description, region, objectives)
         self.objective = self.objectives[list(self.objectives.keys())[0]]  # FRAMAB is always single-objective
         self.multi_objective = surrogate_description['Instance']['MultiArmedBandit']['MultiObjective']
         self.c = surrogate_description['Instance']['MultiArmedBandit']['Parameters']['c']
+        self.arm_statistics = None
+        # UCB value of every category, in the order of the categories of each hyperparameter
+        self.ucb_values: Dict[str, np.ndarray] = {}
 
-    def create(self, features: pd.DataFrame, labels: pd.DataFrame) -> bool:
+    def _fit(self, features: pd.DataFrame, labels: pd.DataFrame) -> bool:
         if self.objective["Minimization"]:
             raise TypeError("Multi Armed Bandit optimizer performs only maximization tasks!")
 
@@ -33,65 +103,49 @@ class MultiArmedBandit(Surrogate):
                 logging.getLogger(__name__).error(msg)
                 return False
 
-        # for each category in each hyperparameter calculate:
+        # for each category in each hyperparameter update:
         # 1. number of times it was used
         # 2. quality (avg improvement)
-        categories_info = {}
-        for hp in self.region:
-            categories_info[hp.name] = {}
-            for feature_category in hp.categories:
-                category_features = transformed_features[transformed_features[hp.name] == feature_category]
-                category_used_times = len(category_features)
+        if self.arm_statistics is None:
+            self.arm_statistics = ArmStatistics(self.region)
+        rewards = transformed_labels[objective_column].to_numpy(dtype=float)
+        self.arm_statistics.update(transformed_features, rewards)
 
+        # 3. calculate UCB value of each category in every hyperparameter
+        if isinstance(self.c, (int, float)):
+            c = self.c
+        elif len(rewards) > 1:
+            c = self.arm_statistics.get_std()
+        else:
+            c = 1  # to avoid 'nan's in following formula
+        ucb_values = {}
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for name in self.arm_statistics.names:
+                pulls = self.arm_statistics.pulls[name]
                 # MAB could properly evaluate only those categories, which were probed at least once thus,
                 # we encourage to evaluate not evaluated yet categories
-                if category_used_times > 0:
-                    category_quality = sum(
-                        transformed_labels.iloc[category_features.index][objective_column]) / category_used_times
-                else:
-                    category_quality = np.inf
-
-                categories_info[hp.name][feature_category] = {
-                    "times used": category_used_times,
-                    "quality": category_quality,
-                    "UCB_value": 0  # will be calculated later, since it depends on quality of other categories
-                }
-        # 3. calculate UCB value of each category in every hyperparameter
-        for hp in self.region:
-            for feature_category in hp.categories:
-                exploration_rate = np.sqrt(
-                    np.divide(
-                        2 * np.log(len(transformed_labels)),
-                        categories_info[hp.name][feature_category]["times used"]
-                    )
-                )
-                if np.isnan(exploration_rate):
-                    # only one, but not this category was used (in previous formula nominator=inf and denominator=inf).
-                    exploration_rate = np.inf
-                exploitation_rate = categories_info[hp.name][feature_category]["quality"]
-                if isinstance(self.c, (int, float)):
-                    c = self.c
-                else:
-                    if len(transformed_labels[objective_column]) > 1:
-                        c = np.std(transformed_labels[objective_column])  # * 10
-                    else:
-                        c = 1  # to avoid 'nan's in following formula
-                categories_info[hp.name][feature_category]["UCB_value"] = exploitation_rate + c * exploration_rate
-        self.categories_info = categories_info
+                quality = np.where(pulls > 0, self.arm_statistics.rewards_sum[name] / pulls, np.inf)
+                exploration_rate = np.sqrt(np.divide(2 * np.log(len(rewards)), pulls))
+                # only one, but not this category was used (in previous formula nominator=inf and denominator=inf).
+                exploration_rate = np.where(np.isnan(exploration_rate), np.inf, exploration_rate)
+                ucb_values[name] = quality + c * exploration_rate
+        self.ucb_values = ucb_values
         return True
 
-    def predict(self, cfg: pd.Series, transform: bool = True) -> pd.DataFrame:
+    def predict_batch(self, configurations: pd.DataFrame, transform: bool = True) -> pd.DataFrame:
         # Multi-armed bandit does not predict an objective function, but calculates an upper confidence bound,
         # "optimism in the face of uncertainty", higher is better
         # WARNING: general validators cannot be used
-        ucbs = []
-        for hp_name in cfg.index:
-            ucb = self.categories_info[hp_name][cfg[hp_name]]["UCB_value"]
-            ucbs.append(ucb)
-        summed_ucb = sum(ucbs)
+        configurations = configurations.reset_index(drop=True)
+        summed_ucb = np.zeros(len(configurations))
+        for hp_name in configurations.columns:
+            codes = pd.Categorical(configurations[hp_name],
+                                   categories=self.arm_statistics.mapping_name_categories[hp_name]).codes
+            # unknown categories get NaN, as by the mapping of values
+            summed_ucb += np.where(codes >= 0, self.ucb_values[hp_name][codes], np.nan)
         if not self.scalarized:
-            result = pd.DataFrame([summed_ucb], columns=list(self.objectives.keys()))
+            result = pd.DataFrame(summed_ucb, columns=list(self.objectives.keys()))
         else:
-            result = pd.DataFrame([summed_ucb], columns=["Y"])
+            result = pd.DataFrame(summed_ucb, columns=["Y"])
 
         return result
@@ -1,4 +1,5 @@
 import importlib
+import numbers
 import pandas as pd
 from typing import Dict, Tuple
 
@@ -22,8 +23,19 @@ class SklearnWrapper(Surrogate):
             self.surrogate_instance = surrogate_class(**surrogate_description['Instance'][self.feature_name]['Parameters'])
         else:
             self.surrogate_instance = surrogate_class()
+        self.CACHEABLE = self._is_deterministic(self.surrogate_instance)
 
-    def create(self, features: pd.DataFrame, labels: pd.DataFrame) -> bool:
+    @staticmethod
+    def _is_deterministic(estimator) -> bool:
+        """
+        :param estimator: scikit-learn estimator.
+        :return: whether the fit of the estimator (and of its nested estimators) does not depend on a random seed
+        or the seed is fixed by an integer `random_state`.
+        """
+        return all(isinstance(value, numbers.Integral) for name, value in estimator.get_params(deep=True).items()
+                   if name == "random_state" or name.endswith("__random_state"))
+
+    def _fit(self, features: pd.DataFrame, labels: pd.DataFrame) -> bool:
 
         transformed_features = self._transform_configuration(features)
         transformed_labels = self._transform_values(labels)
@@ -31,17 +43,15 @@ class SklearnWrapper(Surrogate):
         self.surrogate_instance.fit(transformed_features, transformed_labels)
         return True
 
-    def predict(self, cfg: pd.Series, transform: bool = True) -> pd.DataFrame:
-        # Series to Dataframe
-        configuration = pd.DataFrame(columns=cfg.index)
-        configuration.loc[0] = cfg.values
+    def predict_batch(self, configurations: pd.DataFrame, transform: bool = True) -> pd.DataFrame:
+        configurations = configurations.reset_index(drop=True)
 
         if transform:
-            transformed_configuration = self._transform_configuration(configuration)
+            transformed_configurations = self._transform_configuration(configurations)
         else:
-            transformed_configuration = configuration
+            transformed_configurations = configurations
 
-        predicted = self.surrogate_instance.predict(transformed_configuration)
+        predicted = self.surrogate_instance.predict(transformed_configurations)
         if not self.scalarized:
             result = pd.DataFrame(predicted, columns=list(self.objectives.keys()))
         else:
@@ -5,10 +5,17 @@ from abc import ABC, abstractmethod
 from configuration_selection.model.configuration_transformer.configuration_transformer_orchestrator import ConfigurationTransformerOrchestrator
 from configuration_selection.model.value_transformer.value_transformer_orchestrator import ValueTransformerOrchestrator
 from configuration_selection.model.configuration_transformer.configuration_transformer_abs import ConfigurationTransformer
+from configuration_selection.model.surrogate.fit_cache import FitCache
 from core_entities.search_space import Hyperparameter
 
 
 class Surrogate(ABC):
+    # whether the fits could be reused from the FitCache. A cached fit freezes a single outcome of a random fit,
+    # therefore it is disabled (also per instance) for the non-deterministic fits and for the incremental surrogates
+    CACHEABLE = True
+    # attributes, which form the fitted state of the surrogate and are stored in the FitCache
+    FITTED_ATTRIBUTES: Tuple[str, ...] = ("surrogate_instance",)
+
     def __init__(self, surrogate_description: Dict, region: Tuple, objectives: Dict):
         self.surrogate_instance = None
         self.region = region
@@ -46,11 +53,44 @@ class Surrogate(ABC):
 
         self.multi_objective = False
 
-    @abstractmethod
     def create(self, features: pd.DataFrame, labels: pd.DataFrame) -> bool:
-        pass
+        """
+        Fit the surrogate or restore the fitted state, if the identical fit is already cached.
+        :param features: training features.
+        :param labels: training labels.
+        :return: whether the surrogate is built.
+        """
+        if not self.CACHEABLE:
+            return self._fit(features, labels)
+        fit_cache = FitCache()
+        key = fit_cache.get_key(self, features, labels)
+        cached = fit_cache.get(key)
+        if cached is not None:
+            is_built, state = cached
+            self.set_fitted_state(state)
+            return is_built
+        is_built = self._fit(features, labels)
+        # a failed fit leaves the previous state of the surrogate untouched, so nothing should be restored
+        fit_cache.put(key, is_built, self.get_fitted_state() if is_built else {})
+        return is_built
+
+    def get_fitted_state(self) -> Dict:
+        """
+        :return: attributes, which were set by the fit (not copied).
+        """
+        return {attribute: getattr(self, attribute) for attribute in self.FITTED_ATTRIBUTES}
+
+    def set_fitted_state(self, state: Dict) -> None:
+        """
+        Restore the fitted state, e.g. of the same surrogate fitted in the FitCache or in the ModelExecutor.
+        :param state: attributes, returned by `get_fitted_state`.
+        """
+        self.__dict__.update(state)
 
     @abstractmethod
+    def _fit(self, features: pd.DataFrame, labels: pd.DataFrame) -> bool:
+        pass
+
     def predict(self, configuration: pd.Series, transform: bool = True) -> pd.DataFrame:
         """
         Predict exactly one configuration to be used by the optimizer and validator
@@ -58,28 +98,35 @@ class Surrogate(ABC):
         :param transform: whether to apply the transformation or not, e.g., if transformation is already done by the optimizer
         :return: predicted value(-s) as a Dataframe
         """
+        # Series to Dataframe
+        configurations = pd.DataFrame([configuration.values], columns=configuration.index)
+        return self.predict_batch(configurations, transform)
+
+    @abstractmethod
+    def predict_batch(self, configurations: pd.DataFrame, transform: bool = True) -> pd.DataFrame:
+        """
+        Predict a batch of configurations in one call to be used by the optimizer and validator
+        :param configurations: configurations to be predicted, one configuration per row
+        :param transform: whether to apply the transformation or not, e.g., if transformation is already done by the optimizer
+        :return: predicted value(-s) as a Dataframe with one row per configuration, indexed from 0
+        """
         pass
 
     def _transform_configuration(self, features: pd.DataFrame) -> pd.DataFrame:
         features = features.reset_index(drop=True)
         if len(self.mapping_config_transformer_parameter) > 0:
             transformed_names = sum([[hp.name for hp in p] for p in self.mapping_config_transformer_parameter.values()], [])
-            transformed_features = pd.DataFrame()
+            transformed_columns = []
             for f_name in features.columns:
                 if f_name in transformed_names:
                     for ct, p in self.mapping_config_transformer_parameter.items():
                         for hp in p:
                             if hp.name == f_name:
-                                transformed_relevant_features = ct.transform(pd.DataFrame(features.loc[:, hp.name]))
-                                if transformed_features.empty:
-                                    transformed_features = transformed_relevant_features
-                                else:
-                                    transformed_features = transformed_features.join(transformed_relevant_features)
+                                transformed_columns.append(ct.transform(pd.DataFrame(features.loc[:, hp.name])))
                 else:
-                    if transformed_features.empty:
-                        transformed_features = pd.DataFrame(features.loc[:, f_name])
-                    else:
-                        transformed_features = transformed_features.join(pd.DataFrame(features.loc[:, f_name]))
+                    transformed_columns.append(pd.DataFrame(features.loc[:, f_name]))
+            # join all columns at once, transformers preserve the row alignment
+            transformed_features = pd.concat(transformed_columns, axis=1) if transformed_columns else pd.DataFrame()
         else:
             transformed_features = features
         return transformed_features
@@ -43,22 +43,31 @@ from configuration_selection.model.surrogate.surrogate_abs import Surrogate
 
 
 class TreeParzenEstimator(Surrogate):
+    FITTED_ATTRIBUTES = ("model", "kde_vartypes", "varsizes", "columns")
+    # maximal number of kernel values, evaluated at once (number of predicted configurations x training configurations)
+    PDF_CHUNK_SIZE = 2 ** 20
+
     def __init__(self, surrogate_description: Dict, region: Tuple, objectives: Dict):
         super().__init__(surrogate_description, region, objectives)
         self.objective = self.objectives[list(self.objectives.keys())[0]]  # TPE is always single-objective
         self.min_bandwidth = surrogate_description["Instance"][self.feature_name]["Parameters"]["min_bandwidth"]
         self.random_fraction = surrogate_description["Instance"][self.feature_name]["Parameters"]["random_fraction"]
         self.top_n_percent = surrogate_description["Instance"][self.feature_name]["Parameters"]["top_n_percent"]
+        self.bandwidth_factor = surrogate_description["Instance"][self.feature_name]["Parameters"].get(
+            "bandwidth_factor", 3.0)
         self.kde_vartypes = ""
         self.varsizes = []
+        self.columns = []
         self.model = {}
 
     def create(self, features: pd.DataFrame, labels: pd.DataFrame) -> bool:
-        is_built = False
-
-        # Skip with predefined probability
+        # Skip with predefined probability, before the fit is looked up in the cache
         if np.random.rand() <= self.random_fraction:
-            return is_built
+            return False
+        return super().create(features, labels)
+
+    def _fit(self, features: pd.DataFrame, labels: pd.DataFrame) -> bool:
+        is_built = False
 
         # 1. Check if enough data in model.
         min_points_in_model = len(features.keys()) + 1
@@ -107,6 +116,7 @@ class TreeParzenEstimator(Surrogate):
                 self.varsizes.append(len(hyperparameter.categories))
 
         self.varsizes = np.array(self.varsizes, dtype=int)
+        self.columns = list(transformed_features.keys())
 
         # Bandwidth selection method. There are 3 possible variants:
         # 'cv_ml' - cross validation maximum likelihood
@@ -128,26 +138,55 @@ class TreeParzenEstimator(Surrogate):
         is_built = True
         return is_built
 
-    def predict(self, cfg: pd.Series, transform: bool = True) -> pd.DataFrame:
+    def predict_batch(self, configurations: pd.DataFrame, transform: bool = True) -> pd.DataFrame:
         if self.model == {}:
             return pd.DataFrame()
-        # Series to Dataframe
-        configuration = pd.DataFrame(columns=cfg.index)
-        configuration.loc[0] = cfg.values
+        configurations = configurations.reset_index(drop=True)
 
         if transform:
-            transformed_configuration = self._transform_configuration(configuration)
+            transformed_configurations = self._transform_configuration(configurations)
         else:
-            transformed_configuration = configuration
+            transformed_configurations = configurations
 
         # Get accumulated probabilities for provided vectors.
-        good_pdf = self.model['good'].pdf
-        bad_pdf = self.model['bad'].pdf
-
-        predicted_probability_good = max(1e-32, good_pdf(transformed_configuration))
-        predicted_probability_bad = max(1e-32, bad_pdf(transformed_configuration))
+        data_predict = transformed_configurations.to_numpy(dtype=float)
+        predicted_probability_good = np.maximum(1e-32, self._pdf(self.model['good'], data_predict))
+        predicted_probability_bad = np.maximum(1e-32, self._pdf(self.model['bad'], data_predict))
 
         result = pd.DataFrame({self.objective["Name"] + "_probability_good": predicted_probability_good,
-                               self.objective["Name"] + "_probability_bad": predicted_probability_bad}, index=[0])
+                               self.objective["Name"] + "_probability_bad": predicted_probability_bad})
 
         return result
+
+    def _pdf(self, kde: sm.nonparametric.KDEMultivariate, data_predict: np.ndarray) -> np.ndarray:
+        """
+        Vectorized equivalent of `KDEMultivariate.pdf`, which evaluates the kernels for every configuration separately.
+        The same kernels are used: Gaussian for continuous, Aitchison-Aitken for unordered
+        and Wang-Ryzin for ordered hyperparameters.
+        :param kde: fitted kernel density estimator.
+        :param data_predict: configurations to be evaluated, one per row.
+        :return: density of every configuration.
+        """
+        data = kde.data
+        bw = np.asarray(kde.bw, dtype=float)
+        is_continuous = np.array([vartype == 'c' for vartype in kde.var_type])
+        # number of levels of the unordered hyperparameters is derived from the training data, as statsmodels does
+        num_levels = [np.unique(data[:, i]).size for i in range(data.shape[1])]
+        chunk_size = max(1, self.PDF_CHUNK_SIZE // max(1, len(data)))
+
+        densities = []
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for start in range(0, len(data_predict), chunk_size):
+                chunk = data_predict[start:start + chunk_size]
+                kernel_values = np.ones((len(chunk), len(data)))
+                for i, vartype in enumerate(kde.var_type):
+                    difference = data[np.newaxis, :, i] - chunk[:, np.newaxis, i]
+                    h = bw[i]
+                    if vartype == 'c':
+                        kernel_values *= np.exp(-difference ** 2 / (h ** 2 * 2.)) / np.sqrt(2 * np.pi)
+                    elif vartype == 'u':
+                        kernel_values *= np.where(difference == 0, 1 - h, h / (num_levels[i] - 1))
+                    else:
+                        kernel_values *= np.where(difference == 0, 1 - h, 0.5 * (1 - h) * h ** np.abs(difference))
+                densities.append(kernel_values.sum(axis=1) / np.prod(bw[is_continuous]) / len(data))
+        return np.concatenate(densities) if densities else np.empty(0)
@@ -0,0 +1,59 @@
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from core_entities.configuration import Configuration
+
+
+class TrainingData:
+    """
+    Append-only training matrix of one region: values of the region hyperparameters and of the objectives
+    for every measured Configuration.
+
+    Measured Configurations do not change, therefore every Configuration is converted into a row only once,
+    when it is requested for the first time. The training data of an iteration (e.g. the window of the latest
+    Configurations) is sliced from the matrix by row numbers, so the cost of its update is proportional to the number
+    of new Configurations.
+    """
+
+    def __init__(self, columns: List[str], initial_capacity: int = 64):
+        """
+        :param columns: names of the region hyperparameters, followed by the names of the objectives.
+        :param initial_capacity: initial number of rows, the matrix is grown twice if needed.
+        """
+        self.columns = list(columns)
+        self._matrix = np.empty((initial_capacity, len(self.columns)), dtype=object)
+        self._number_of_rows = 0
+        self._mapping_id_row: Dict[str, int] = {}
+
+    def __len__(self):
+        return self._number_of_rows
+
+    def get_data(self, configurations: List[Configuration]) -> pd.DataFrame:
+        """
+        :param configurations: measured Configurations, which form the training data.
+        :return: training data with a row per Configuration (in the given order) and a column per
+        hyperparameter or objective, indexed from 0.
+        """
+        if not configurations:
+            return pd.DataFrame()
+        rows = [self._get_row(configuration) for configuration in configurations]
+        return pd.DataFrame(self._matrix[rows], columns=self.columns).infer_objects()
+
+    def _get_row(self, configuration: Configuration) -> int:
+        row = self._mapping_id_row.get(configuration.unique_id)
+        if row is None:
+            if self._number_of_rows == len(self._matrix):
+                grown = np.empty((2 * len(self._matrix), len(self.columns)), dtype=object)
+                grown[:self._number_of_rows] = self._matrix[:self._number_of_rows]
+                self._matrix = grown
+            row = self._number_of_rows
+            self._matrix[row] = self._to_row(configuration)
+            self._mapping_id_row[configuration.unique_id] = row
+            self._number_of_rows += 1
+        return row
+
+    def _to_row(self, configuration: Configuration) -> List:
+        values = configuration.to_series()
+        return [values[column] for column in self.columns]
@@ -23,3 +23,10 @@ class MersenneTwister(SamplingStrategy):
 
         result = self.transform(sampled_values)
         return result
+
+    def sample_batch(self, number_of_samples: int) -> pd.DataFrame:
+        sampled_values = [[random.random() for _ in range(len(self.region))] for _ in range(number_of_samples)]
+        sampled_values = np.array(sampled_values).reshape(number_of_samples, len(self.region))
+
+        result = self.transform(sampled_values)
+        return result
@@ -30,20 +30,26 @@ class SamplingStrategy(ABC):
         Returns a DataFrame with sampled (partial) configuration.
         """
 
+    def sample_batch(self, number_of_samples: int) -> pd.DataFrame:
+        """
+        Returns a DataFrame with several sampled (partial) configurations, one per row.
+        Strategies that are able to draw many points at once should override this method.
+        :param number_of_samples: number of configurations to be sampled.
+        :return: DataFrame with sampled configurations.
+        """
+        return pd.concat([self.sample() for _ in range(number_of_samples)], ignore_index=True)
+
     def transform(self, df: np.array) -> pd.DataFrame:
         """
-        Transform a floating point value between 0 and 1 into a DataFrame according to the Hyperparameter type.
-        :param df: Floating-point value to be transformed.
+        Transform floating point values between 0 and 1 into a DataFrame according to the Hyperparameter type.
+        :param df: Floating-point values to be transformed, one row per configuration and one column per Hyperparameter.
         :return: Transformed DataFrame.
         """
-
-        transformed_values = []  # transform based on the Hyperparameter type
-        it = np.nditer(df, flags=['f_index'])  # safe iterator for ndarrays
-        for sampled_value in it:
-            transformed_values.append(self.region[it.index].transform(sampled_value))
-
-        transformed_values_np = np.array(transformed_values, dtype=object)
-        transformed_values_np = transformed_values_np.reshape(df.shape)
+        df = np.atleast_2d(df)
+        transformed_values_np = np.empty(df.shape, dtype=object)  # transform based on the Hyperparameter type
+        for index, hyperparameter in enumerate(self.region):
+            for row, sampled_value in enumerate(df[:, index]):
+                transformed_values_np[row, index] = hyperparameter.transform(sampled_value)
 
         result = pd.DataFrame(transformed_values_np, columns=self.names)
         return result
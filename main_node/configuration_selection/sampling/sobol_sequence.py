@@ -1,7 +1,9 @@
 __doc__ = """
     Sampling strategy that uses Sobol Sequence generator."""
+import warnings
+import numpy as np
 import pandas as pd
-from typing import Mapping, Tuple
+from typing import Dict, Mapping, Tuple
 from scipy.stats.qmc import Sobol
 
 from configuration_selection.sampling.selection_algorithm_abs import SamplingStrategy
@@ -9,21 +11,68 @@ from core_entities.search_space import Hyperparameter
 
 
 class SobolSequence(SamplingStrategy):
+    # number of points, generated at once and kept in memory
+    CHUNK_SIZE = 1024
+
     def __init__(self, parameters: Mapping, region: Tuple[Hyperparameter]):
         """
         Sampling strategy that uses Sobol Sequence generator.
+        Points are generated lazily, in chunks of CHUNK_SIZE, so the memory footprint does not depend on
+        the number of drawn points.
         """
         super().__init__(parameters, region)
-        dimensionality = len(region)
+        self.dimensionality = len(region)
         self.seed = parameters["Seed"]
-        self.sampler = Sobol(d=dimensionality, scramble=False, seed=self.seed)
-        self.sequence = self.sampler.random_base2(20)  # sample 1kk points
-        self.index = 0
+        self.sampler = Sobol(d=self.dimensionality, scramble=False, seed=self.seed)
+        self.index = 0  # position of the next point in the sequence
+        self._chunk = np.empty(shape=(0, self.dimensionality))
+        self._chunk_start = 0  # position of the first point of the chunk in the sequence
 
     def sample(self) -> pd.DataFrame:
-        sampled_values = self.sequence[self.index]
-        sampled_values = sampled_values.reshape(1, len(sampled_values))  # reshape to 1 row, X columns
+        return self.sample_batch(1)
 
+    def sample_batch(self, number_of_samples: int) -> pd.DataFrame:
+        sampled_values = self._draw(number_of_samples)
         result = self.transform(sampled_values)
-        self.index += 1
         return result
+
+    def get_state(self) -> Dict:
+        """
+        Note: the main-node does not persist the sampling strategies yet (experiments are not resumed),
+        therefore the state is only an extension point for such a persistence.
+        :return: position of the strategy in the sequence, which could be stored and later passed to `set_state`.
+        """
+        return {"index": self.index}
+
+    def set_state(self, state: Dict) -> None:
+        """
+        Restores the position in the sequence, e.g., when an experiment is resumed.
+        :param state: state, previously returned by `get_state`.
+        """
+        self.index = state["index"]
+        self._chunk = np.empty(shape=(0, self.dimensionality))
+        self._chunk_start = self.index
+
+    def _draw(self, number_of_points: int) -> np.ndarray:
+        points = []
+        while number_of_points > 0:
+            offset = self.index - self._chunk_start
+            if offset >= len(self._chunk):
+                self._generate_chunk()
+                offset = 0
+            taken = self._chunk[offset:offset + number_of_points]
+            points.append(taken)
+            self.index += len(taken)
+            number_of_points -= len(taken)
+        return np.vstack(points) if points else np.empty(shape=(0, self.dimensionality))
+
+    def _generate_chunk(self) -> None:
+        if self.sampler.num_generated != self.index:
+            # position was restored, continue the sequence from the restored point
+            self.sampler.reset()
+            self.sampler.fast_forward(self.index)
+        with warnings.catch_warnings():
+            # points are consumed one by one, the balance properties of power-of-2 samples are not relied upon
+            warnings.simplefilter("ignore", UserWarning)
+            self._chunk = self.sampler.random(self.CHUNK_SIZE)
+        self._chunk_start = self.index
@@ -0,0 +1,141 @@
+import threading
+from typing import List
+
+import pytest
+
+from configuration_selection.candidate_pool import CandidatePool
+from core_entities.configuration import Configuration
+from core_entities.experiment import Experiment
+
+
+class StubConfigurationSelection:
+    """
+    Builds the candidates, prepared by the test for the given number of measured Configurations.
+    A build is blocked until it is released by the test.
+    """
+    def __init__(self, experiment: Experiment):
+        self.experiment = experiment
+        self.candidates = {}
+        self.started = {}
+        self.released = {}
+
+    def prepare(self, measured: int, candidates: List[Configuration]) -> None:
+        self.candidates[measured] = candidates
+        self.started[measured] = threading.Event()
+        self.released[measured] = threading.Event()
+
+    def release(self, measured: int) -> None:
+        self.released[measured].set()
+
+    def predict_batch(self, number_of_configurations: int, configurations: List[Configuration]):
+        measured = len(configurations)
+        self.started[measured].set()
+        assert self.released[measured].wait(5)
+        return list(self.candidates[measured])
+
+
+@pytest.fixture
+def pool(get_energy_experiment_and_search_space):
+    experiment = Experiment(*get_energy_experiment_and_search_space)
+    candidate_pool = CandidatePool(StubConfigurationSelection(experiment))
+    candidate_pool.start()
+    yield candidate_pool
+    candidate_pool.stop()
+
+
+def get_configuration(experiment: Experiment, threads: int) -> Configuration:
+    return Configuration({"frequency": 2900.0, "threads": threads}, Configuration.Type.PREDICTED, experiment.unique_id)
+
+
+def measure(pool: CandidatePool, *events: Experiment.Event) -> None:
+    experiment = pool.experiment
+    experiment.measured_configurations.append(get_configuration(experiment, -len(experiment.measured_configurations)))
+    pool.on_experiment_state_change(experiment, {Experiment.Event.CONFIGURATION_MEASURED, *events})
+
+
+def take_in_thread(pool: CandidatePool, number_of_configurations: int):
+    taken = []
+    thread = threading.Thread(target=lambda: taken.extend(pool.take(number_of_configurations)), daemon=True)
+    thread.start()
+    return thread, taken
+
+
+def test_0_take_fresh_candidates(pool):
+    # Test #0. Take the candidates of a build, after some of them were evaluated
+    # Expected result: take waits for the build, evaluated candidates are filtered out
+    stub, experiment = pool.configuration_selection, pool.experiment
+    candidates = [get_configuration(experiment, threads) for threads in (1, 2, 3)]
+    stub.prepare(1, candidates)
+    measure(pool)
+    thread, taken = take_in_thread(pool, 1)
+    assert stub.started[1].wait(5)
+    stub.release(1)
+    thread.join(5)
+    assert taken == [candidates[0]]
+
+    experiment.evaluated_configurations.append(get_configuration(experiment, 2))
+    assert pool.take(2) == [candidates[2]]
+    assert pool.take(1) == []
+
+
+def test_1_invalidation_on_solution_update(pool):
+    # Test #1. Improve the current solution, while the candidates are pooled and while they are being rebuilt
+    # Expected result: the pool and the build in progress are discarded, only the candidates of the new data are taken
+    stub, experiment = pool.configuration_selection, pool.experiment
+    first, second, third = ([get_configuration(experiment, threads)] for threads in (1, 2, 3))
+    stub.prepare(1, first)
+    stub.prepare(2, second)
+    stub.prepare(3, third)
+    stub.release(1)
+    measure(pool)
+    assert pool.take(0) == []
+    assert pool._built_on == 1
+
+    measure(pool, Experiment.Event.SOLUTION_UPDATED)
+    assert pool._candidates == []
+    assert stub.started[2].wait(5)
+    measure(pool, Experiment.Event.SOLUTION_UPDATED)
+    thread, taken = take_in_thread(pool, 1)
+    stub.release(2)
+    stub.release(3)
+    thread.join(5)
+    assert taken == third
+
+
+def test_2_no_waiting_for_later_builds(pool):
+    # Test #2. Request candidates, while the build for the Configuration measured after the request is in progress
+    # Expected result: take returns the candidates of the current training data without waiting for the later build
+    stub, experiment = pool.configuration_selection, pool.experiment
+    first, second = [get_configuration(experiment, 1)], [get_configuration(experiment, 2)]
+    stub.prepare(1, first)
+    stub.prepare(2, second)
+    stub.prepare(3, [])
+    stub.release(1)
+    measure(pool)
+    assert pool.take(1) == first
+
+    measure(pool)
+    assert stub.started[2].wait(5)
+    thread, taken = take_in_thread(pool, 1)
+    measure(pool)
+    stub.release(2)
+    assert stub.started[3].wait(5)
+    thread.join(5)
+    assert not thread.is_alive()
+    assert taken == second
+    stub.release(3)
+
+
+def test_3_stop_releases_take(pool):
+    # Test #3. Stop the pool, while a request waits for the build
+    # Expected result: the request returns without candidates
+    stub = pool.configuration_selection
+    stub.prepare(1, [get_configuration(pool.experiment, 1)])
+    measure(pool)
+    assert stub.started[1].wait(5)
+    thread, taken = take_in_thread(pool, 1)
+    pool.stop()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert taken == []
+    stub.release(1)
@@ -0,0 +1,32 @@
+import pandas as pd
+
+from configuration_selection.model.candidate_selector.candidate_selector_orchestrator import CandidateSelectorOrchestrator
+from configuration_selection.model.candidate_selector.diverse_multi_point import DiverseMultiPoint
+
+
+class TestCandidateSelector:
+
+    def test_0_diverse_multi_point(self):
+        # Test #0. Select a batch of candidates, which contains duplicates and close points
+        # Expected result: the first candidate and the most distant distinct candidates are selected
+        description = {"DiverseMultiPointProposal": {"NumberOfPoints": 1, "Type": "diverse_multi_point"}}
+        selector = CandidateSelectorOrchestrator().get_candidate_selector(description)
+        assert isinstance(selector, DiverseMultiPoint)
+        candidates = pd.DataFrame({"x": [0.0, 0.0, 0.1, 10.0, 5.0], "c": ["a", "a", "a", "a", "b"],
+                                   "Y": [1.0, 1.0, 1.1, 3.0, 2.0]})
+        assert len(selector.select_candidates(candidates)) == 1
+        selected = selector.select_candidates(candidates, 3)
+        assert selected["x"].tolist() == [0.0, 10.0, 5.0]
+        assert len(selector.select_candidates(candidates, 10)) == 4
+
+    def test_1_diversity_in_parameter_space(self):
+        # Test #1. Select from candidates, two of which have the same parameters, but different predicted values
+        # Expected result: the predicted values are not a diversity dimension, the distinct parameters are selected
+        description = {"DiverseMultiPointProposal": {"NumberOfPoints": 2, "Type": "diverse_multi_point"}}
+        selector = CandidateSelectorOrchestrator().get_candidate_selector(description)
+        candidates = pd.DataFrame({"x": [0.0, 0.0, 1.0], "c": ["a", "a", "a"],
+                                   "Y1": [1.0, 100.0, 2.0], "Y2": [5.0, -5.0, 5.0]})
+        assert selector.select_candidates(candidates)["Y1"].tolist() == [1.0, 100.0]
+        selected = selector.select_candidates(candidates, parameter_names=["x", "c"])
+        assert selected["x"].tolist() == [0.0, 1.0]
+        assert selected["Y1"].tolist() == [1.0, 2.0]
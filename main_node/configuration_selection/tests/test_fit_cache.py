@@ -0,0 +1,60 @@
+import pandas as pd
+from sklearn.neural_network import MLPRegressor
+
+from configuration_selection.model.surrogate.fit_cache import FitCache
+from configuration_selection.model.surrogate.multi_armed_bandit import MultiArmedBandit
+from configuration_selection.model.surrogate.sklearn_wrapper import SklearnWrapper
+from core_entities.search_space import IntegerHyperparameter
+
+
+class TestFitCache:
+
+    description = {"Instance": {"LinearRegression": {"MultiObjective": False,
+                                                     "Type": "sklearn_model_wrapper",
+                                                     "Class": "sklearn.linear_model.LinearRegression"}}}
+    region = (IntegerHyperparameter("x", 0, 0, 10),)
+    objectives = {"Y": {"Name": "Y", "Minimization": True}}
+
+    def test_0_reuse_identical_fit(self):
+        # Test #0. Fit two surrogates with the same description on the same data, then on the changed data
+        # Expected result: the second fit is restored from the cache, the changed data is fitted again
+        FitCache().clear()
+        features = pd.DataFrame({"x": [1, 2, 3, 4]})
+        labels = pd.DataFrame({"Y": [2.0, 4.0, 6.0, 8.0]})
+        first = SklearnWrapper(self.description, self.region, self.objectives)
+        second = SklearnWrapper(self.description, self.region, self.objectives)
+        assert first.create(features, labels) is True
+        hits = FitCache().hits
+        assert second.create(features, labels) is True
+        assert FitCache().hits == hits + 1
+        assert second.surrogate_instance is not first.surrogate_instance
+        assert second.predict_batch(pd.DataFrame({"x": [5]}))["Y"][0] == first.predict_batch(pd.DataFrame({"x": [5]}))["Y"][0]
+
+        second.create(features, labels * 2)
+        assert FitCache().hits == hits + 1
+        assert round(second.predict_batch(pd.DataFrame({"x": [5]}))["Y"][0]) == 20
+
+    def test_1_random_fits_are_not_cached(self):
+        # Test #1. Create the surrogates with a random fit, with a fixed seed and with an incremental fit
+        # Expected result: only the deterministic fits are taken from the cache
+        def get_description(name: str, parameters: dict) -> dict:
+            return {"Instance": {name: {"MultiObjective": False, "Type": "sklearn_model_wrapper",
+                                        "Class": f"sklearn.neural_network.{name}", "Parameters": parameters}}}
+
+        assert SklearnWrapper(self.description, self.region, self.objectives).CACHEABLE
+        assert not SklearnWrapper(get_description("MLPRegressor", {}), self.region, self.objectives).CACHEABLE
+        assert SklearnWrapper(get_description("MLPRegressor", {"random_state": 0}),
+                              self.region, self.objectives).CACHEABLE
+        bagging = {"Instance": {"BaggingRegressor": {
+            "MultiObjective": False, "Type": "sklearn_model_wrapper", "Class": "sklearn.ensemble.BaggingRegressor",
+            "Parameters": {"random_state": 0, "estimator": MLPRegressor()}}}}
+        assert not SklearnWrapper(bagging, self.region, self.objectives).CACHEABLE  # the nested estimator is random
+        assert not MultiArmedBandit.CACHEABLE
+
+        features = pd.DataFrame({"x": [1, 2, 3, 4]})
+        labels = pd.DataFrame({"Y": [2.0, 4.0, 6.0, 8.0]})
+        hits, misses = FitCache().hits, FitCache().misses
+        for _ in range(2):
+            SklearnWrapper(get_description("MLPRegressor", {"max_iter": 5}), self.region,
+                           self.objectives).create(features, labels)
+        assert (FitCache().hits, FitCache().misses) == (hits, misses)
@@ -0,0 +1,22 @@
+from configuration_selection.model.model_executor import ModelExecutor
+
+
+def nested_map(value: int) -> int:
+    return sum(ModelExecutor().map(pow, [(value, 2), (value, 3)]))
+
+
+class TestModelExecutor:
+
+    def test_0_ordered_results(self):
+        # Test #0. Execute work units in a thread pool, every unit submits nested work units to the same executor
+        # Expected result: results are returned in the order of units, nested units do not block the pool
+        executor = ModelExecutor()
+        kind, workers = executor.kind, executor.workers
+        executor.shutdown()
+        executor.kind, executor.workers = "thread", 2
+        try:
+            assert executor.map(nested_map, [(v,) for v in range(6)]) == [v ** 2 + v ** 3 for v in range(6)]
+            assert executor.map(nested_map, []) == []
+        finally:
+            executor.shutdown()
+            executor.kind, executor.workers = kind, workers
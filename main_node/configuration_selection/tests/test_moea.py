@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+
+from configuration_selection.model.optimizer.moea import MOEA
+from configuration_selection.model.optimizer.optimizer_orchestrator import OptimizerOrchestrator
+from configuration_selection.model.surrogate.surrogate_orchestrator import SurrogateOrchestrator
+from core_entities.search_space import FloatHyperparameter, NominalHyperparameter
+
+
+class TestMOEA:
+
+    # the single category of "k" is encoded into a constant column, which is masked by MOEA
+    region = (FloatHyperparameter("x", 0, -5.0, 5.0),
+              NominalHyperparameter("k", 0, ["only"]),
+              FloatHyperparameter("y", 0, 0.0, 1.0),
+              NominalHyperparameter("c", 0, ["a", "b", "c"]))
+    objectives = {"Y": {"Name": "Y", "Minimization": True}}
+    configuration_transformers = {
+        "FloatTransformer": {"SklearnFloatMinMaxScaler": {"Type": "sklearn_float_transformer",
+                                                          "Class": "sklearn.MinMaxScaler"}},
+        "NominalTransformer": {"BinaryEncoder": {"Type": "binary_transformer", "Class": "brise.BinaryEncoder"}}}
+    surrogate_description = {
+        "ConfigurationTransformers": configuration_transformers,
+        "Instance": {"TreeParzenEstimator": {"MultiObjective": False, "Type": "tree_parzen_estimator",
+                                             "Parameters": {"top_n_percent": 30, "random_fraction": 0.0,
+                                                            "bandwidth_factor": 3.0, "min_bandwidth": 0.001}}}}
+    optimizer_description = {
+        "ConfigurationTransformers": configuration_transformers,
+        "ValueTransformers": {"AcquisitionFunction": {"TPE_EI": {"Type": "tpe_ei"}}},
+        "Instance": {"MOEA": {"Generations": 2, "PopulationSize": 8, "Type": "moea",
+                              "Algorithms": {"GACO": {"MultiObjective": False}}}}}
+
+    def test_0_batch_fitness(self):
+        # Test #0. Evaluate k stacked decision vectors of a region with a masked parameter at once and one by one
+        # Expected result: the batch fitness equals the k single fitness evaluations, the masked parameter is restored
+        rng = np.random.default_rng(0)
+        features = pd.DataFrame({"x": rng.uniform(-5, 5, 30), "k": ["only"] * 30, "y": rng.uniform(0, 1, 30),
+                                 "c": rng.choice(["a", "b", "c"], 30)})
+        labels = pd.DataFrame({"Y": features["x"] ** 2 + features["y"]})
+        surrogate = SurrogateOrchestrator().get_surrogate(self.surrogate_description, self.region, self.objectives)
+        assert surrogate.create(features, labels)
+        optimizer = OptimizerOrchestrator().get_optimizer(self.optimizer_description, self.region, self.objectives)
+        assert isinstance(optimizer, MOEA)
+        assert list(optimizer.masked_params) == ["k_BinaryEncoder"]
+
+        evaluated = []
+        predict_batch = surrogate.predict_batch
+
+        def spy(configurations, transform=True):
+            evaluated.append(configurations)
+            return predict_batch(configurations, transform)
+
+        surrogate.predict_batch = spy
+        problem = MOEA._PygmoProblem(optimizer=optimizer, surrogate=surrogate)
+        # continuous scaled values and binary codes of the categories "a", "b" and "c"
+        codes = np.array([[0, 1], [1, 0], [1, 1]])[rng.integers(3, size=5)]
+        vectors = np.column_stack([rng.uniform(0, 1, 5), rng.uniform(0, 1, 5), codes])
+
+        batch = problem.batch_fitness(vectors.flatten())
+        single = np.concatenate([problem.fitness(vector) for vector in vectors])
+        assert batch.shape == (5,)
+        assert np.allclose(batch, single)
+        assert len(evaluated[0]) == 5
+        assert list(evaluated[0].columns) == ["x_MinMaxScaler", "k_BinaryEncoder", "y_MinMaxScaler",
+                                              "c_BinaryEncoder0", "c_BinaryEncoder1"]
+        assert (evaluated[0]["k_BinaryEncoder"] == optimizer.masked_params["k_BinaryEncoder"][0]).all()
@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from configuration_selection.model.surrogate.multi_armed_bandit import MultiArmedBandit
+from core_entities.search_space import NominalHyperparameter
+
+
+class TestMultiArmedBandit:
+
+    region = (NominalHyperparameter("h", 0, ["a", "b", "c"]),
+              NominalHyperparameter("l", 0, ["x", "y"]))
+    objectives = {"Y": {"Name": "Y", "Minimization": False}}
+    description = {"Instance": {"MultiArmedBandit": {"MultiObjective": False, "Type": "multi_armed_bandit",
+                                                     "Parameters": {"c": "std"}}}}
+
+    def test_0_incremental_statistics(self):
+        # Test #0. Fit the bandit on the growing data, then on the unrelated data
+        # Expected result: UCB values are equal to those of the bandit fitted on the same data from scratch
+        rng = np.random.default_rng(0)
+        features = pd.DataFrame({"h": rng.choice(["a", "b"], 30), "l": rng.choice(["x", "y"], 30)})
+        labels = pd.DataFrame({"Y": rng.normal(size=30)})
+        incremental = MultiArmedBandit(self.description, self.region, self.objectives)
+        for size in (1, 2, 10, 30, 12):
+            assert incremental._fit(features[:size], labels[:size])
+            from_scratch = MultiArmedBandit(self.description, self.region, self.objectives)
+            assert from_scratch._fit(features[:size], labels[:size])
+            for name in ("h", "l"):
+                assert np.allclose(incremental.ucb_values[name], from_scratch.ucb_values[name], equal_nan=True)
+
+        # the never pulled category "c" is always the most promising
+        prediction = incremental.predict_batch(pd.DataFrame({"h": ["a", "c", "d"], "l": ["x", "x", "x"]}))["Y"]
+        assert np.isfinite(prediction[0]) and prediction[1] == np.inf and np.isnan(prediction[2])
@@ -0,0 +1,32 @@
+import numpy as np
+from scipy.stats.qmc import Sobol
+
+from configuration_selection.sampling.sobol_sequence import SobolSequence
+from core_entities.search_space import FloatHyperparameter
+
+
+class TestSobolSequence:
+
+    region = (FloatHyperparameter("x", 0, 0.0, 1.0), FloatHyperparameter("y", 0, 0.0, 1.0))
+
+    def test_0_chunked_sequence(self):
+        # Test #0. Draw points across the chunk boundary one by one and in batches
+        # Expected result: the points are the prefix of the sequence, previously generated at once by random_base2(20)
+        strategy = SobolSequence({"Seed": 1}, self.region)
+        number_of_points = SobolSequence.CHUNK_SIZE + 100
+        drawn = np.vstack([strategy._draw(1) for _ in range(10)] + [strategy._draw(number_of_points - 10)])
+        expected = Sobol(d=2, scramble=False, seed=1).random_base2(20)[:number_of_points]
+        assert np.array_equal(drawn, expected)
+
+    def test_1_restore_state(self):
+        # Test #1. Store the position in the sequence, then restore it in a new strategy and sample
+        # Expected result: the restored strategy continues the same sequence
+        strategy = SobolSequence({"Seed": 1}, self.region)
+        strategy.sample_batch(SobolSequence.CHUNK_SIZE - 24)
+        state = strategy.get_state()
+        continued = strategy.sample_batch(50)
+
+        restored = SobolSequence({"Seed": 1}, self.region)
+        restored.set_state(state)
+        assert restored.sample_batch(50).equals(continued)
+        assert restored.get_state() == strategy.get_state()
@@ -0,0 +1,25 @@
+from collections import OrderedDict
+
+from configuration_selection.model.training_data import TrainingData
+from core_entities.configuration import Configuration
+
+
+class TestTrainingData:
+
+    def test_0_incremental_rows(self):
+        # Test #0. Request the training data several times, while new Configurations are measured
+        # Expected result: every Configuration is converted once, rows follow the order of requested Configurations
+        configurations = []
+        for i in range(100):
+            c = Configuration(OrderedDict({"x": float(i), "c": f"c{i % 3}", "other": 0}), Configuration.Type.FROM_SELECTOR, "ID")
+            c.results = {"Y": 2.0 * i}
+            configurations.append(c)
+        training_data = TrainingData(["x", "c", "Y"], initial_capacity=4)
+        assert training_data.get_data([]).empty
+        assert len(training_data.get_data(configurations[:10])) == 10
+        data = training_data.get_data(configurations[-5:] + configurations[:3])
+        assert len(training_data) == 15
+        assert data.columns.tolist() == ["x", "c", "Y"]
+        assert data["x"].tolist() == [95.0, 96.0, 97.0, 98.0, 99.0, 0.0, 1.0, 2.0]
+        assert data["Y"].dtype == float
+        assert data.index.tolist() == list(range(8))
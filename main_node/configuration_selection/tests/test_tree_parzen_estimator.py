@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from configuration_selection.model.optimizer.optimizer_orchestrator import OptimizerOrchestrator
+from configuration_selection.model.optimizer.tpe_sampling import TpeSampling
+from configuration_selection.model.surrogate.surrogate_orchestrator import SurrogateOrchestrator
+from core_entities.search_space import FloatHyperparameter, IntegerHyperparameter, NominalHyperparameter
+
+
+class TestTreeParzenEstimator:
+
+    region = (FloatHyperparameter("x", 0, -5.0, 5.0),
+              IntegerHyperparameter("n", 0, 1, 20),
+              NominalHyperparameter("c", 0, ["a", "b", "c", "d", "e"]))
+    objectives = {"Y": {"Name": "Y", "Minimization": True}}
+    surrogate_description = {
+        "ConfigurationTransformers": {
+            "FloatTransformer": {"SklearnFloatMinMaxScaler": {"Type": "sklearn_float_transformer",
+                                                              "Class": "sklearn.MinMaxScaler"}},
+            "IntegerTransformer": {"SklearnIntMinMaxScaler": {"Type": "sklearn_integer_transformer",
+                                                              "Class": "sklearn.MinMaxScaler"}},
+            "NominalTransformer": {"BinaryEncoder": {"Type": "binary_transformer", "Class": "brise.BinaryEncoder"}}},
+        "Instance": {"TreeParzenEstimator": {"MultiObjective": False, "Type": "tree_parzen_estimator",
+                                             "Parameters": {"top_n_percent": 30, "random_fraction": 0.0,
+                                                            "bandwidth_factor": 3.0, "min_bandwidth": 0.001}}}}
+    optimizer_description = {
+        "ValueTransformers": {"AcquisitionFunction": {"TPE_EI": {"Type": "tpe_ei"}}},
+        "Instance": {"TpeSampling": {"SamplingSize": 64, "MultiObjective": False, "Type": "tpe_sampling"}}}
+
+    def get_surrogate(self):
+        rng = np.random.default_rng(1)
+        features = pd.DataFrame({"x": rng.uniform(-5, 5, 40), "n": rng.integers(1, 21, 40),
+                                 "c": rng.choice(["a", "b", "c", "d", "e"], 40)})
+        labels = pd.DataFrame({"Y": features["x"] ** 2 + features["n"]})
+        surrogate = SurrogateOrchestrator().get_surrogate(self.surrogate_description, self.region, self.objectives)
+        assert surrogate.create(features, labels)
+        return surrogate
+
+    def test_0_vectorized_pdf(self):
+        # Test #0. Evaluate the densities of the fitted Tree Parzen Estimator for a batch of configurations
+        # Expected result: densities are equal to those calculated by statsmodels for every configuration
+        surrogate = self.get_surrogate()
+        data_predict = surrogate._transform_configuration(
+            pd.DataFrame({"x": [-4.0, 0.0, 4.5], "n": [1, 10, 20], "c": ["a", "c", "e"]})).to_numpy(dtype=float)
+        for kde in surrogate.model.values():
+            assert np.allclose(surrogate._pdf(kde, data_predict), kde.pdf(data_predict))
+
+    def test_1_sample_good_density(self):
+        # Test #1. Draw candidates from the density of good configurations
+        # Expected result: candidates are valid configurations of the region, sorted by the TPE_EI ratio
+        surrogate = self.get_surrogate()
+        optimizer = OptimizerOrchestrator().get_optimizer(self.optimizer_description, self.region, self.objectives)
+        assert isinstance(optimizer, TpeSampling)
+        candidates = optimizer.optimize(surrogate)
+        assert len(candidates) == 64
+        assert candidates["x"].between(-5.0, 5.0).all()
+        assert candidates["n"].between(1, 20).all() and candidates["n"].dtype.kind == "i"
+        assert candidates["c"].isin(["a", "b", "c", "d", "e"]).all()
+        assert candidates["Y"].is_monotonic_increasing
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import numbers
 import pickle
 import uuid
 from collections import OrderedDict
@@ -9,7 +11,9 @@ from copy import deepcopy
 from enum import Enum
 from typing import Any, Dict, List, Mapping, MutableMapping, Tuple
 
+import numpy as np
 import pandas as pd
+from core_entities.running_statistics import RunningStatistics
 from tools.front_API import API
 
 
@@ -65,6 +69,7 @@ class Configuration:
         # The unique configuration ID
         self.unique_id = str(uuid.uuid4())
         self._parameters: MutableMapping = OrderedDict()
+        self._fingerprint: str = None
         self.parameters = parameters
         self._tasks = {}
         self._results: Mapping = OrderedDict()
@@ -73,6 +78,8 @@ class Configuration:
         self.type = config_type
         # Meta information
         self._standard_deviation = []
+        # objective name -> streaming statistics of the results of tasks, which are not bad values or outliers
+        self._statistics: Dict[str, RunningStatistics] = None
         self.number_of_failed_tasks = 0
         self._task_number = 0
         self.parameter_control_info = {}  # additional information used in parameter control experiments, e.g., initial solution for a warm startup of an optimizer within the worker node
@@ -96,6 +103,10 @@ class Configuration:
         self.type = Configuration.Type(space['type'])
         self._parameters = OrderedDict(space["_parameters"])
         self._results = OrderedDict(space["_results"])
+        # Configurations pickled before the fingerprint and the statistics were introduced
+        if self.__dict__.get("_fingerprint") is None:
+            self._fingerprint = Configuration.parameters_fingerprint(self._parameters)
+        self.__dict__.setdefault("_statistics", None)
 
     @property
     def parameters(self) -> MutableMapping:
@@ -112,6 +123,49 @@ class Configuration:
                                     f"parameters was swapped due to specifics of MH!")
                 parameters['lambda_'], parameters['mu'] = parameters['mu'], parameters['lambda_']
         self._parameters = parameters
+        self._fingerprint = Configuration.parameters_fingerprint(parameters)
+
+    def get_parameter(self, name: str) -> Any:
+        """
+        Read access to a single parameter value without copying all the parameters.
+        :param name: String. Name of the parameter.
+        :return: value of the parameter.
+        """
+        return self._parameters[name]
+
+    def get_parameters_names(self) -> Tuple[str, ...]:
+        return tuple(self._parameters.keys())
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Canonical fingerprint of the Configuration parameters.
+        Configurations with equal parameters have equal fingerprints, regardless of the parameters order and of the
+        numeric type of the values (e.g. ``1`` and ``1.0``), therefore it could be used as a hash index key.
+        """
+        return self._fingerprint
+
+    @staticmethod
+    def parameters_fingerprint(parameters: Mapping) -> str:
+        """
+        Calculates the canonical fingerprint of (possibly nested) parameters mapping.
+        :param parameters: parameters mapping name:value
+        :return: String. SHA-1 hex digest of the canonical parameters representation.
+        """
+        def canonical(value):
+            if isinstance(value, Mapping):
+                return [[str(k), canonical(v)] for k, v in sorted(value.items(), key=lambda item: str(item[0]))]
+            if isinstance(value, (list, tuple)):
+                return [canonical(v) for v in value]
+            if isinstance(value, (bool, np.bool_)):
+                return ["b", bool(value)]
+            if isinstance(value, numbers.Real):
+                return ["n", repr(float(value))]
+            if isinstance(value, str):
+                return ["s", value]
+            return ["o", repr(value)]
+
+        return hashlib.sha1(json.dumps(canonical(parameters)).encode("utf-8")).hexdigest()
 
     @property
     def results(self) -> Mapping:
@@ -142,10 +196,14 @@ class Configuration:
         Add new measurements of concrete parameters
         :param task: mapping of task results
         """
-        task_id = task["task id"]
+        task_id = str(task["task id"])
         self.parameter_control_info = task["result"].pop("parameter_control_info", {})
-        self._tasks[str(task_id)] = task
-        self._assemble_tasks_results()
+        is_new_task = task_id not in self._tasks
+        self._tasks[task_id] = task
+        if is_new_task and self._statistics is not None:
+            self._accumulate_task(task)
+        else:
+            self._assemble_tasks_results()
 
     def get_tasks(self) -> Mapping:
         return self._tasks.copy()
@@ -164,6 +222,16 @@ class Configuration:
     def get_standard_deviation(self):
         return self._standard_deviation.copy()
 
+    def get_statistics(self) -> Dict[str, RunningStatistics]:
+        """
+        Streaming statistics (count, mean, variance, min, max) of the Configuration results per objective.
+        Only the Tasks, which are not marked as bad values, outliers or out of bounds values, are taken into account.
+        :return: mapping objective name: RunningStatistics (a copy).
+        """
+        if self._statistics is None:
+            self._assemble_tasks_results()
+        return deepcopy(self._statistics)
+
     def to_json(self) -> str:
         dictionary_dump = {"configuration_id": self.unique_id,
                            "parameters": self.parameters,
@@ -172,6 +240,8 @@ class Configuration:
                            "predicted_result": self.predicted_result,
                            "prediction_info": self.prediction_info,
                            "standard_deviation": self._standard_deviation,
+                           "statistics": {objective: statistics.to_list() for objective, statistics in
+                                          (self._statistics or {}).items()},
                            "type": self.type,
                            "status": self.status,
                            "number_of_failed_tasks": self.number_of_failed_tasks,
@@ -196,6 +266,9 @@ class Configuration:
         conf.number_of_failed_tasks = dictionary_dump["number_of_failed_tasks"]
         conf._task_number = dictionary_dump["_task_number"]
         conf.parameter_control_info = dictionary_dump["parameter_control_info"]
+        if dictionary_dump.get("statistics"):
+            conf._statistics = {objective: RunningStatistics.from_list(dump)
+                                for objective, dump in dictionary_dump["statistics"].items()}
         return conf
 
     def is_better(self, o_minimize: List[bool], other: Configuration) -> bool:
@@ -222,7 +295,7 @@ class Configuration:
     def __eq__(self, other: Configuration) -> bool:
         if not isinstance(other, Configuration):
             return False
-        return self.unique_id == other.unique_id or self.parameters == other.parameters
+        return self.unique_id == other.unique_id or self.fingerprint == other.fingerprint
 
     def __lt__(self, other: Configuration) -> bool:
         """
@@ -261,22 +334,30 @@ class Configuration:
     def _assemble_tasks_results(self) -> None:
         """
         Updates the results of the Configuration measurement by aggregating the results from all available Tasks.
-        The Average Results of the Configuration and the BaseMTL Deviation between Tasks are calculated.
-        """
-        # list of a result list from all tasks
-        results_tuples, marks = self.get_required_results_with_marks_from_all_tasks()
-        task_index_size = len(results_tuples) - 1
-        # delete marked bad/outliers values before average is calculated
-        for task_index in range(task_index_size, -1, -1):
-            if marks[task_index] == 'Bad value' or \
-                    marks[task_index] == 'Outlier' or \
-                    marks[task_index] == 'Out of bounds':
-                del (results_tuples[task_index])
-        # calculating the average over all result items
-        ok_tasks_results = pd.DataFrame(results_tuples, columns=self.TaskConfiguration["Objectives"])
-        self.results = OrderedDict(ok_tasks_results.mean())
-        self._standard_deviation = ok_tasks_results.std().to_list()
-        self._task_number = len(results_tuples)
+        The streaming statistics are rebuilt from scratch, e.g. when the Task validity marks might have been changed.
+        """
+        self._statistics = OrderedDict((objective, RunningStatistics())
+                                       for objective in self.TaskConfiguration["Objectives"])
+        self._task_number = 0
+        for task in self._tasks.values():
+            self._accumulate_task(task, update_results=False)
+        self._update_results_from_statistics()
+
+    def _accumulate_task(self, task: Mapping, update_results: bool = True) -> None:
+        """
+        Adds the Task results to the streaming statistics in O(1), bad values and outliers are skipped.
+        The Average Results of the Configuration and the Standard Deviation between Tasks are updated.
+        """
+        if task['ResultValidityCheckMark'] not in ('Bad value', 'Outlier', 'Out of bounds'):
+            for objective, statistics in self._statistics.items():
+                statistics.add(task['result'][objective])
+            self._task_number += 1
+        if update_results:
+            self._update_results_from_statistics()
+
+    def _update_results_from_statistics(self) -> None:
+        self.results = OrderedDict((objective, statistics.mean) for objective, statistics in self._statistics.items())
+        self._standard_deviation = [statistics.standard_deviation for statistics in self._statistics.values()]
 
     def __repr__(self) -> str:
         """
@@ -8,8 +8,9 @@ import pickle
 import uuid
 from collections.abc import Mapping
 from copy import deepcopy
+from enum import Enum
 from threading import Lock
-from typing import List, Union
+from typing import Callable, Iterable, List, Set, Union
 
 import numpy as np
 from core_entities.configuration import Configuration
@@ -18,8 +19,95 @@ from tools.front_API import API
 from tools.mongo_dao import MongoDB
 
 
+class IndexedConfigurations(list):
+    """
+    A list of Configurations, which additionally keeps a hash index by the Configuration unique ID and by the
+    fingerprint of its parameters. Membership checks (``in``) and lookups by parameters take constant time, while
+    the semantic stays the same as for ``Configuration.__eq__``.
+    """
+
+    def __init__(self, configurations: Iterable[Configuration] = ()):
+        super().__init__()
+        self._by_id = {}
+        self._by_fingerprint = {}
+        self.extend(configurations)
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    def _index(self, configuration: Configuration) -> None:
+        # the first registered Configuration wins, as it would be for the linear search
+        self._by_id.setdefault(configuration.unique_id, configuration)
+        self._by_fingerprint.setdefault(configuration.fingerprint, configuration)
+
+    def _reindex(self) -> None:
+        self._by_id = {}
+        self._by_fingerprint = {}
+        for configuration in self:
+            self._index(configuration)
+
+    def append(self, configuration: Configuration) -> None:
+        super().append(configuration)
+        self._index(configuration)
+
+    def extend(self, configurations: Iterable[Configuration]) -> None:
+        for configuration in configurations:
+            self.append(configuration)
+
+    def __iadd__(self, configurations: Iterable[Configuration]):
+        self.extend(configurations)
+        return self
+
+    def insert(self, index: int, configuration: Configuration) -> None:
+        super().insert(index, configuration)
+        self._reindex()
+
+    def remove(self, configuration: Configuration) -> None:
+        super().remove(configuration)
+        self._reindex()
+
+    def pop(self, index: int = -1) -> Configuration:
+        configuration = super().pop(index)
+        self._reindex()
+        return configuration
+
+    def clear(self) -> None:
+        super().clear()
+        self._reindex()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._reindex()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._reindex()
+
+    def __contains__(self, configuration: Configuration) -> bool:
+        if not isinstance(configuration, Configuration):
+            return False
+        return configuration.unique_id in self._by_id or configuration.fingerprint in self._by_fingerprint
+
+    def get_by_fingerprint(self, fingerprint: str) -> Union[None, Configuration]:
+        """
+        :param fingerprint: String. Fingerprint of the Configuration parameters.
+        :return: the first added Configuration with the given parameters fingerprint or `None`.
+        """
+        return self._by_fingerprint.get(fingerprint)
+
+
 class Experiment:
 
+    class Event(str, Enum):
+        """
+        Changes of the Experiment state, that are reported to the subscribers (e.g. to the Stop Condition Validator).
+        """
+        CONFIGURATION_MEASURED = "configuration_measured"
+        SOLUTION_UPDATED = "solution_updated"
+        BAD_CONFIGURATION = "bad_configuration"
+        MODEL_STATE_UPDATED = "model_state_updated"
+        FINISHED = "finished"
+
     def __init__(self, description: dict, search_space: SearchSpace):
         """
         Initialization of Experiment class
@@ -32,8 +120,10 @@ class Experiment:
         self.logger = logging.getLogger(__name__)
         self.api = API()
 
-        self.evaluated_configurations: List[Configuration] = []  # repeater already evaluates these configurations
-        self.measured_configurations: List[Configuration] = []  # the results for these configurations are already received
+        # repeater already evaluates these configurations
+        self.evaluated_configurations: IndexedConfigurations = IndexedConfigurations()
+        # the results for these configurations are already received
+        self.measured_configurations: IndexedConfigurations = IndexedConfigurations()
         self._default_configuration: Configuration = None
         self._description: Mapping = description
         self.search_space: SearchSpace = search_space
@@ -47,11 +137,15 @@ class Experiment:
 
         self.current_best_configurations: List[Configuration] = []
         self.bad_configurations_number = 0
+        # incrementally maintained counters of the Experiment state, used by Stop Conditions
+        self.configurations_without_improvement_number = 0
+        self.transferred_configurations_number = 0
         self.model_is_valid = False
         self.current_best_curve = []
 
         self.measured_conf_lock = Lock()
         self.evaluated_conf_lock = Lock()
+        self._subscribers: List[Callable[[Experiment, Set[Experiment.Event]], None]] = []
 
         # initialize connection to the database
         self.database = MongoDB(os.getenv("BRISE_DATABASE_HOST"),
@@ -84,16 +178,49 @@ class Experiment:
         del space['measured_conf_lock']
         del space['evaluated_conf_lock']
         del space['database']
+        del space['_subscribers']
         return space
 
     def __setstate__(self, space):
         self.__dict__ = space
         self.logger = logging.getLogger(__name__)
         self.api = API()
+        # dumps of older versions contain plain lists of Configurations
+        self.evaluated_configurations = IndexedConfigurations(self.evaluated_configurations)
+        self.measured_configurations = IndexedConfigurations(self.measured_configurations)
+        # dumps of older versions do not contain the incremental counters
+        self.__dict__.setdefault("configurations_without_improvement_number", 0)
+        self.__dict__.setdefault("transferred_configurations_number", 0)
 
         # for thread-safe adding value to relevant array; protection against duplicates configurations
         self.measured_conf_lock = Lock()
         self.evaluated_conf_lock = Lock()
+        self._subscribers = []
+
+    def subscribe(self, callback: Callable[['Experiment', Set['Experiment.Event']], None]) -> None:
+        """
+        Register a callback, that is called in-process every time the Experiment state changes.
+        :param callback: callable, that takes the Experiment instance and a set of occurred Experiment.Event.
+        """
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[['Experiment', Set['Experiment.Event']], None]) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _notify_subscribers(self, *events: 'Experiment.Event') -> None:
+        """
+        Report the state changes to all subscribers. Experiment state is already written to the database at this point.
+        A failing subscriber does not affect the Experiment and other subscribers.
+        :param events: occurred Experiment.Event.
+        """
+        for callback in list(self._subscribers):
+            try:
+                callback(self, set(events))
+            except Exception as error:
+                self.logger.error(f"Unable to process Experiment state change {[e.value for e in events]}: {error}",
+                                  exc_info=True)
 
     @property
     def default_configuration(self) -> Configuration:
@@ -111,6 +238,7 @@ class Experiment:
                 self.measured_configurations.append(default_configuration)
                 if not self.current_best_configurations:
                     self.current_best_configurations = [default_configuration]
+                self.configurations_without_improvement_number += 1
                 self.database.write_one_record(
                     "Configuration",
                     default_configuration.get_configuration_record()
@@ -120,6 +248,7 @@ class Experiment:
                     record={"Exp_unique_ID": self.unique_id, "parameter_control_info": default_configuration.parameter_control_info}
                 )
                 self.send_state_to_db()
+                self._notify_subscribers(Experiment.Event.CONFIGURATION_MEASURED, Experiment.Event.SOLUTION_UPDATED)
             else:
                 raise ValueError("The default Configuration was registered already.")
 
@@ -155,19 +284,17 @@ class Experiment:
                 raise ValueError(
                     f"Can not add Configuration with status {configuration_instance.status.name} to Experiment.")
 
-    def get_any_configuration_by_parameters(self, parameters: tuple) -> Union[None, Configuration]:
+    def get_any_configuration_by_parameters(self, parameters: Mapping) -> Union[None, Configuration]:
         """
         Find and retrieve instance of Configuration that was previously added to Experiment by it's Parameters.
-        :param parameters: tuple. Parameters of desired Configuration.
+        :param parameters: Mapping. Parameters of desired Configuration.
         :return: instance of Configuration class or`None` if the Configuration instance was not found.
         """
-        for configuration_instance in self.measured_configurations:
-            if configuration_instance.parameters == parameters:
-                return configuration_instance
-        for configuration_instance in self.evaluated_configurations:
-            if configuration_instance.parameters == parameters:
-                return configuration_instance
-        return None
+        fingerprint = Configuration.parameters_fingerprint(parameters)
+        configuration_instance = self.measured_configurations.get_by_fingerprint(fingerprint)
+        if configuration_instance is None:
+            configuration_instance = self.evaluated_configurations.get_by_fingerprint(fingerprint)
+        return configuration_instance
 
     def get_current_status(self, serializable: bool):
         """
@@ -229,9 +356,11 @@ class Experiment:
 
     def get_final_report_and_result(self):
         self.end_time = datetime.datetime.now()
+        self._notify_subscribers(Experiment.Event.FINISHED)
         if self.measured_configurations:
             performed_measurements = \
-                self.database.get_last_record_by_experiment_id("Experiment_state", self.unique_id)["Number_of_measured_tasks"]
+                self.database.get_last_record_by_experiment_id(
+                    "Experiment_state", self.unique_id, ["Number_of_measured_tasks"])["Number_of_measured_tasks"]
             self.logger.info("\n\nFinal report:")
 
             self.logger.info("ALL MEASURED CONFIGURATIONS:\n")
@@ -279,11 +408,15 @@ class Experiment:
         :return: None
         """
         self.measured_configurations.append(configuration)
+        events = [Experiment.Event.CONFIGURATION_MEASURED]
         if configuration.is_better(self.get_objectives_minimization(),
                                    self.current_best_configurations[0]):
+            events.append(Experiment.Event.SOLUTION_UPDATED)
             # we do not need parameter_control_info anymore, since better configuration was found
             self.current_best_configurations[0].parameter_control_info = {}
             self.current_best_configurations = [configuration]
+            # the solution itself is counted, as the last Configuration without improvement
+            self.configurations_without_improvement_number = 1
 
             self.database.update_record(
                 collection_name="Parameter_control_info",
@@ -293,6 +426,9 @@ class Experiment:
         else:
             # this configuration did not improve the previous solution, no need to keep track its solutions.
             configuration.parameter_control_info = {}
+            self.configurations_without_improvement_number += 1
+        if configuration.type == Configuration.Type.TRANSFERRED:
+            self.transferred_configurations_number += 1
 
         self.current_best_curve.append(self.get_current_solution().results)
         self.database.write_one_record("Configuration", configuration.get_configuration_record())
@@ -301,6 +437,7 @@ class Experiment:
                       configurations=[configuration.parameters],
                       results=[configuration.results])
         self.logger.info("Adding to Experiment: %s" % configuration)
+        self._notify_subscribers(*events)
 
     def add_evaluated_configuration_to_experiment(self, configuration: Configuration) -> None:
         """
@@ -345,23 +482,16 @@ class Experiment:
             {"ExperimentObject": pickle.dumps(self, pickle.HIGHEST_PROTOCOL)}
         )
         # save information needed for Transfer Learning
-        if self.database.get_last_record_by_experiment_id("Transfer_learning_info", self.unique_id) is None:
-            self.database.write_one_record("Transfer_learning_info",
-                                           {"Exp_unique_ID": self.unique_id,
-                                            "Scenario": self.description["Context"]["TaskConfiguration"]["Scenario"],
-                                            "Samples": [{"type": config.type, "parameters": config.parameters,
-                                                        "results": config.results, "prediction_info": config.prediction_info}
-                                                        for config in self.measured_configurations],
-                                            "Current_best_curve": self.current_best_curve})
-        else:
-            self.database.update_record(
-                "Transfer_learning_info",
-                {"Exp_unique_ID": self.unique_id},
-                {"Scenario": self.description["Context"]["TaskConfiguration"]["Scenario"],
-                 "Samples": [{"type": config.type, "parameters": config.parameters,
-                             "results": config.results, "prediction_info": config.prediction_info}
-                             for config in self.measured_configurations],
-                 "Current_best_curve": self.current_best_curve})
+        self.database.upsert_record(
+            "Transfer_learning_info",
+            {"Exp_unique_ID": self.unique_id},
+            {"Scenario": self.description["Context"]["TaskConfiguration"]["Scenario"],
+             "Samples": [{"type": config.type, "parameters": config.parameters,
+                         "results": config.results, "prediction_info": config.prediction_info}
+                         for config in self.measured_configurations],
+             "Current_best_curve": self.current_best_curve})
+        # checkpoint: the dump is made at the end of the Experiment
+        self.database.flush()
 
     def write_csv(self, folder_path: str) -> None:
         """save .csv file with main metrics of the experiment
@@ -440,13 +570,32 @@ class Experiment:
 
     def increment_bad_configuration_number(self):
         self.bad_configurations_number = self.bad_configurations_number + 1
+        self.send_state_to_db()
+        self._notify_subscribers(Experiment.Event.BAD_CONFIGURATION)
         return self
 
     def get_bad_configuration_number(self):
         return self.bad_configurations_number
 
+    def get_number_of_configurations_without_improvement(self) -> int:
+        """
+        :return: number of measured Configurations starting from the current solution (inclusive).
+        """
+        return self.configurations_without_improvement_number
+
+    def get_number_of_transferred_configurations(self) -> int:
+        return self.transferred_configurations_number
+
+    def is_default_configuration_improved(self) -> bool:
+        current_solution = self.get_current_solution()
+        return self.default_configuration is not None and current_solution is not None \
+            and current_solution != self.default_configuration
+
     def update_model_state(self, model_state: bool):
-        self.model_is_valid = model_state
+        if self.model_is_valid != model_state:
+            self.model_is_valid = model_state
+            self.send_state_to_db()
+            self._notify_subscribers(Experiment.Event.MODEL_STATE_UPDATED)
 
     def get_model_state(self) -> bool:
         return self.model_is_valid
@@ -454,21 +603,18 @@ class Experiment:
     def send_state_to_db(self) -> None:
         """
         Send current experiment state information, or create one if not exist.
+        All counters are updated at once, within a single update of the Experiment state record.
         :return: None
         """
-        if self.database.get_last_record_by_experiment_id("Experiment_state", self.unique_id) is None:
-            self.database.write_one_record("Experiment_state", self.get_experiment_state_record())
-        else:
-            self.database.update_record(
-                "Experiment_state",
-                {"Exp_unique_ID": self.unique_id},
-                {
-                    "Number_of_measured_configs": self.get_number_of_measured_configurations(),
-                    "Number_of_bad_configs": self.get_bad_configuration_number(),
-                    "Current_solution": self.get_current_solution().get_configuration_record(),
-                    "is_model_valid": self.get_model_state()
-                }
-            )
+        record = self.get_experiment_state_record()
+        self.database.upsert_record(
+            "Experiment_state",
+            {"Exp_unique_ID": self.unique_id},
+            {field: record[field] for field in
+             ("Number_of_measured_configs", "Number_of_bad_configs", "Current_solution", "is_model_valid",
+              "Number_of_configs_without_improvement", "Number_of_transferred_configs", "Is_default_improved")},
+            on_insert=record
+        )
 
     def get_experiment_description_record(self) -> Mapping:
         """
@@ -500,5 +646,8 @@ class Experiment:
             current_solution = current_solution.get_configuration_record()
         record["Current_solution"] = current_solution
         record["is_model_valid"] = self.get_model_state()
+        record["Number_of_configs_without_improvement"] = self.get_number_of_configurations_without_improvement()
+        record["Number_of_transferred_configs"] = self.get_number_of_transferred_configurations()
+        record["Is_default_improved"] = self.is_default_configuration_improved()
         record["Number_of_measured_tasks"] = 0
         return record
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from math import inf, nan, sqrt
+from typing import List
+
+
+class RunningStatistics:
+    """
+    Streaming accumulator of a single objective values.
+    Count, mean, variance (Welford's algorithm), minimum and maximum are updated in O(1) per added value.
+    Mean and standard deviation match the pandas ``mean()`` and ``std()`` (with ``ddof=1``) of the same values.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = nan
+        self._m2 = 0.0
+        self.min = inf
+        self.max = -inf
+
+    def add(self, value: float) -> None:
+        value = float(value)
+        self.count += 1
+        if self.count == 1:
+            self.mean = value
+        else:
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def variance(self) -> float:
+        """
+        Sample variance (with Bessel's correction), NaN for less than 2 values.
+        """
+        return self._m2 / (self.count - 1) if self.count > 1 else nan
+
+    @property
+    def standard_deviation(self) -> float:
+        return sqrt(self.variance) if self.count > 1 else nan
+
+    def to_list(self) -> List[float]:
+        return [self.count, self.mean, self._m2, self.min, self.max]
+
+    @staticmethod
+    def from_list(dump: List[float]) -> RunningStatistics:
+        statistics = RunningStatistics()
+        statistics.count, statistics.mean, statistics._m2, statistics.min, statistics.max = dump
+        return statistics
+
+    def __repr__(self) -> str:
+        return f"RunningStatistics(count={self.count}, mean={self.mean}, std={self.standard_deviation}, " \
+               f"min={self.min}, max={self.max})"
@@ -0,0 +1,60 @@
+from core_entities.configuration import Configuration
+from core_entities.experiment import Experiment, IndexedConfigurations
+
+
+def test_0_equality_does_not_depend_on_parameters_order():
+    # Configurations with the same parameters, given in a different order
+    # Expected result: Configurations are equal and have the same fingerprint, different parameters are not equal
+    first = Configuration({"frequency": 2900.0, "threads": 32, "governor": "performance"}, Configuration.Type.TEST, "")
+    second = Configuration({"governor": "performance", "threads": 32, "frequency": 2900.0}, Configuration.Type.TEST, "")
+    third = Configuration({"governor": "performance", "threads": 16, "frequency": 2900.0}, Configuration.Type.TEST, "")
+    assert first.unique_id != second.unique_id
+    assert first.fingerprint == second.fingerprint
+    assert first == second
+    assert first != third
+    assert first != first.parameters
+
+
+def test_1_equality_does_not_depend_on_numeric_type():
+    # Configurations with integer and float representations of the same values
+    # Expected result: 1 and 1.0 are treated as the same value, also in the nested parameters
+    integer = Configuration({"x": 1, "nested": {"y": [2, 3]}}, Configuration.Type.TEST, "")
+    floating = Configuration({"nested": {"y": [2.0, 3.0]}, "x": 1.0}, Configuration.Type.TEST, "")
+    assert integer == floating
+    assert Configuration.parameters_fingerprint({"x": 1}) == Configuration.parameters_fingerprint({"x": 1.0})
+    assert Configuration.parameters_fingerprint({"x": 1}) != Configuration.parameters_fingerprint({"x": 1.5})
+
+
+def test_2_index_is_consistent_after_list_modifications():
+    # Append, remove and slice assignment of Configurations
+    # Expected result: membership checks and lookups by fingerprint follow the content of the list
+    first, second, third, fourth = (Configuration({"x": value}, Configuration.Type.TEST, "") for value in range(4))
+    configurations = IndexedConfigurations([first])
+    configurations.append(second)
+    assert first in configurations and second in configurations and third not in configurations
+    assert configurations.get_by_fingerprint(second.fingerprint) is second
+
+    configurations.remove(first)
+    assert first not in configurations
+    assert configurations.get_by_fingerprint(first.fingerprint) is None
+
+    configurations[0:1] = [third, fourth]
+    assert list(configurations) == [third, fourth]
+    assert second not in configurations
+    assert configurations.get_by_fingerprint(second.fingerprint) is None
+    assert configurations.get_by_fingerprint(fourth.fingerprint) is fourth
+    assert Configuration({"x": 3.0}, Configuration.Type.TEST, "") in configurations
+    assert "x" not in configurations
+
+
+def test_3_get_any_configuration_by_parameters(get_energy_experiment_and_search_space):
+    # Lookup of the evaluated and the measured Configurations by their parameters
+    # Expected result: the Configuration is found regardless of the parameters order and type, unknown is not found
+    experiment = Experiment(*get_energy_experiment_and_search_space)
+    evaluated = Configuration({"frequency": 2900.0, "threads": 32}, Configuration.Type.TEST, experiment.unique_id)
+    measured = Configuration({"frequency": 2200.0, "threads": 8}, Configuration.Type.TEST, experiment.unique_id)
+    experiment.evaluated_configurations.append(evaluated)
+    experiment.measured_configurations.append(measured)
+    assert experiment.get_any_configuration_by_parameters({"threads": 32, "frequency": 2900}) is evaluated
+    assert experiment.get_any_configuration_by_parameters({"threads": 8, "frequency": 2200.0}) is measured
+    assert experiment.get_any_configuration_by_parameters({"threads": 16, "frequency": 2900.0}) is None
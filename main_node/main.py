@@ -19,12 +19,14 @@ from core_entities.search_space import Hyperparameter, get_search_space_record
 from logger.default_logger import BRISELogConfigurator
 from repeater.repeater_selector import RepeaterOrchestration
 from stop_condition.stop_condition_selector import (
-    launch_stop_condition_threads
+    build_stop_condition_validator
 )
+from stop_condition.stop_condition_validator import StopConditionValidator
 from tools.front_API import API
 from tools.initial_config import load_experiment_setup
 
 from tools.mongo_dao import MongoDB
+from tools.rabbitmq_common_tools import shutdown_publisher
 from WorkerServiceClient.WSClient_events import WSClient
 
 logging.getLogger("pika").setLevel(logging.WARNING)
@@ -62,6 +64,7 @@ class MainThread(threading.Thread):
         self.connection: pika.BlockingConnection = None
         self.consume_channel = None
         self.wsc_client: WSClient = None
+        self.stop_condition_validator: StopConditionValidator = None
         self.database: MongoDB = None
         self.is_transfer_enabled = False
 
@@ -143,8 +146,8 @@ class MainThread(threading.Thread):
                       )
         self.logger.debug("Experiment description and global configuration sent to the API.")
 
-        # Create and launch Stop Condition services in separate threads.
-        launch_stop_condition_threads(self.experiment.unique_id)
+        # Create Stop Conditions, they are evaluated in-process on the Experiment state changes.
+        self.stop_condition_validator = build_stop_condition_validator(self.experiment.unique_id, self.experiment)
 
         # Instantiate client for Worker Service, establish connection.
         self.wsc_client = WSClient(self.experiment.unique_id)
@@ -223,7 +226,7 @@ class MainThread(threading.Thread):
                 self.sub.send('log', 'info', message=temp_msg)
                 self.consume_channel.basic_publish(exchange='get_worker_capacity_exchange',
                                                    routing_key=self.experiment.unique_id,
-                                                   body='')
+                                                   body=json.dumps({"configuration_id": configuration.unique_id}))
 
     def experiment_api(self, ch=None, method=None, properties=None, body=None):
         dictionary_dump = json.loads(body.decode())
@@ -242,11 +245,16 @@ class MainThread(threading.Thread):
             self.logger.info(f"Terminating experiment. Reason: {body}")
             self._state = self.State.SHUTTING_DOWN
             self._is_interrupted = True
+            if self.stop_condition_validator is not None:
+                self.stop_condition_validator.stop()  # cancels the timers and unsubscribes from the Experiment
             optimal_configuration = self.experiment.get_final_report_and_result()
             self._state = self.State.IDLE
             self.consume_channel.basic_publish(exchange='experiment_termination_exchange',
                                                routing_key=self.experiment.unique_id,
                                                body='')
+            # release long-lived connections of the publisher, they are reopened on demand by the next experiment
+            shutdown_publisher()
+            self.database.flush()
             return optimal_configuration
 
     def get_state(self):
@@ -258,9 +266,10 @@ class MainThread(threading.Thread):
         """
         self.exchanges = ['experiment_termination_exchange', 'task_result_exchange', 'measurement_results_exchange',
                           'default_configuration_results_exchange', 'configurations_results_exchange',
-                          'stop_experiment_exchange', 'check_stop_condition_expression_exchange', 'logging_exchange',
+                          'stop_experiment_exchange', 'logging_exchange',
                           'get_worker_capacity_exchange', 'get_new_configuration_exchange',
-                          'measure_new_configuration_exchange', 'process_tasks_exchange', 'experiment_api_exchange']
+                          'measure_new_configuration_exchange', 'process_tasks_exchange', 'experiment_api_exchange',
+                          'selected_configurations_exchange']
         for exchange in self.exchanges:
             queue_name = exchange + self.experiment.unique_id
             result = self.consume_channel.queue_declare(queue=queue_name)
@@ -1,5 +1,5 @@
 import os
-from math import exp, sqrt
+from math import exp, isfinite, sqrt
 
 from core_entities.configuration import Configuration
 from repeater.repeater import Repeater
@@ -52,16 +52,18 @@ class AcceptableErrorBasedType(Repeater):
         if os.environ.get('TEST_MODE') == 'UNIT_TEST':
             self.experiment = experiment
 
-    def evaluate(self, current_configuration: Configuration):
+    def evaluate(self, current_configuration: Configuration, free_worker_capacity: int = None):
         """
         Return the number of evaluations to complete a configuration or 0 if it is evaluated.
         :param current_configuration: configuration under evaluation
+        :param free_worker_capacity: number of idle workers or None if unknown
         :return: int min_tasks_per_configuration if Configuration was not measured at all
-                 or 1 if Configuration was not measured precisely or 0 if it finished
+                 or the estimated number of Tasks to reach the acceptable error if Configuration was not measured
+                 precisely (at least 1, at most free_worker_capacity) or 0 if it finished
         """
         tasks_data = current_configuration.get_tasks()
         db_current_solution_record = self.database.\
-            get_last_record_by_experiment_id("Experiment_state", self.experiment_id)["Current_solution"]
+            get_last_record_by_experiment_id("Experiment_state", self.experiment_id, ["Current_solution"])["Current_solution"]
 
         c_s_results = db_current_solution_record["Results"]
 
@@ -87,8 +89,9 @@ class AcceptableErrorBasedType(Repeater):
         elif len(tasks_data) >= self.max_tasks_per_configuration:
             return 0
         else:
-            # Calculating standard deviation
-            all_dim_std = current_configuration.get_standard_deviation()
+            # Standard deviation is maintained by the streaming statistics of the Configuration
+            statistics = current_configuration.get_statistics()
+            all_dim_std = [statistics[objective].standard_deviation for objective in self.objectives]
 
             # The number of Degrees of Freedom generally equals the number of observations (Tasks) minus
             # the number of estimated parameters.
@@ -155,8 +158,41 @@ class AcceptableErrorBasedType(Repeater):
                     thresholds.append(acceptable_error)
 
             # Simple implementation of possible multi-dim Repeater decision-making:
-            # If any of resulting dimensions are not accurate - just terminate.
-            for threshold, error in zip(thresholds, relative_errors):
+            # If any of resulting dimensions are not accurate - estimate the number of Tasks, needed for all of them.
+            needed_numbers_of_tasks = []
+            for threshold, error, avg, dim_std in zip(thresholds, relative_errors, c_c_results_l, all_dim_std):
                 if error > threshold:
-                    return 1
-            return 0
+                    needed_numbers_of_tasks.append(
+                        self._estimate_number_of_tasks(len(tasks_data), threshold, avg, dim_std))
+            if not needed_numbers_of_tasks:
+                return 0
+            number_of_tasks = min(max(needed_numbers_of_tasks) - len(tasks_data),
+                                  self.max_tasks_per_configuration - len(tasks_data))
+            if free_worker_capacity is not None:
+                number_of_tasks = min(number_of_tasks, free_worker_capacity)
+            return max(number_of_tasks, 1)
+
+    def _estimate_number_of_tasks(self, number_of_tasks: int, threshold: float, avg: float, dim_std: float) -> int:
+        """
+        Estimates the total number of Tasks, after which the relative error of a dimension will not exceed the
+        threshold, assuming that the mean and the standard deviation of the results stay the same.
+        The same error model as in `evaluate` is used: the absolute error combines the singular measurement error
+        and the Student-t confidence interval of the mean.
+        :param number_of_tasks: number of already performed Tasks
+        :param threshold: acceptable relative error (in percents)
+        :param avg: current mean of the dimension
+        :param dim_std: current sample standard deviation of the dimension
+        :return: int estimated total number of Tasks, not greater than max_tasks_per_configuration
+        """
+        # the largest confidence interval of the mean that keeps the relative error under the threshold
+        acceptable_conf_interval_mm = pow(threshold * avg / 100, 2) - pow(self.confidence_levels, 2)
+        if acceptable_conf_interval_mm <= 0 or not isfinite(dim_std):
+            # the threshold could not be reached by repetitions
+            return self.max_tasks_per_configuration
+        estimated_number_of_tasks = number_of_tasks + 1
+        while estimated_number_of_tasks < self.max_tasks_per_configuration:
+            student_coefficient = t.ppf(self.confidence_levels, df=estimated_number_of_tasks - 1)
+            if pow(student_coefficient * dim_std, 2) / estimated_number_of_tasks <= acceptable_conf_interval_mm:
+                break
+            estimated_number_of_tasks += 1
+        return estimated_number_of_tasks
@@ -19,10 +19,11 @@ class QuantityBasedType(Repeater):
         feature_name = list(self.repeater_configuration["Instance"].keys())[0]
         self.max_tasks_per_configuration = self.repeater_configuration["Instance"][feature_name]["MaxTasksPerConfiguration"]
 
-    def evaluate(self, current_configuration: Configuration):
+    def evaluate(self, current_configuration: Configuration, free_worker_capacity: int = None):
         """
         Return max_tasks_per_configuration to measure default Configuration or 0.
         :param current_configuration: instance of Configuration class.
+        :param free_worker_capacity: not used, all the Tasks are sent at once.
         :return: max_tasks_per_configuration or 0
         """
 
@@ -17,11 +17,13 @@ class Repeater(ABC):
                                 os.getenv("BRISE_DATABASE_PASS"))
 
     @abstractmethod
-    def evaluate(self, current_configuration: Configuration):
+    def evaluate(self, current_configuration: Configuration, free_worker_capacity: int = None):
         """
         Main logic of Repeater should be overridden in this method.
         Later, this method will be called in `evaluation_by_type` method.
 
-        This method should return the number of repetitions to be performed for `current_configuration`
+        This method should return the number of repetitions to be performed for `current_configuration`.
+        `free_worker_capacity` is the number of idle workers (None if unknown), it could be used to limit the number
+        of repetitions, sent at once
         :return: None
         """
@@ -1,6 +1,9 @@
 import json
 import logging
 import os
+from typing import Union
+
+import pika.exceptions
 
 from core_entities.configuration import Configuration
 from repeater.results_check.outliers_detection.outliers_detector_selector import (
@@ -11,6 +14,7 @@ from tools.front_API import API
 from tools.mongo_dao import MongoDB
 from tools.rabbitmq_common_tools import RabbitMQConnection, publish
 from tools.reflective_class_import import reflective_class_import
+from WorkerServiceClient.worker_registry import WorkerRegistry
 
 logging.getLogger("pika").propagate = False
 
@@ -37,7 +41,8 @@ class RepeaterOrchestration:
 
             self.experiment_description = None
             while self.experiment_description is None:
-                self.experiment_description = self.database.get_last_record_by_experiment_id("Experiment_description", experiment_id)
+                self.experiment_description = self.database.get_last_record_by_experiment_id(
+                    "Experiment_description", experiment_id, {"ExperimentObject": False})
         else:
             self.database = MongoDB("test", 0, "test", "user", "pass")
             self.experiment = experiment
@@ -108,7 +113,8 @@ class RepeaterOrchestration:
             raise TypeError("Repeater evaluation Type was not selected!")
         else:
             if not current_configuration.status['evaluated'] or current_configuration.results:
-                number_of_measurements = self._type.evaluate(current_configuration=current_configuration)
+                number_of_measurements = self._type.evaluate(current_configuration=current_configuration,
+                                                             free_worker_capacity=self.get_free_worker_capacity())
                 current_configuration.status['evaluated'] = True
                 if number_of_measurements == 0:
                     current_configuration.status['measured'] = True
@@ -116,6 +122,27 @@ class RepeaterOrchestration:
             else:
                 return 0
 
+    def get_free_worker_capacity(self) -> Union[int, None]:
+        """
+        Estimates the number of idle workers by the Worker heartbeats (see WorkerRegistry) or, if they are unknown,
+        as a difference between the number of workers (consumers of the task queue) and the number of Tasks,
+        waiting in the queue.
+        :return: int number of idle workers (at least 1) or None if it is unknown
+        """
+        if os.environ.get('TEST_MODE') == 'UNIT_TEST':
+            return None
+        idle_slots = WorkerRegistry().get_number_of_idle_slots()
+        if idle_slots is not None:
+            return max(idle_slots, 1)  # known locally from the Worker heartbeats
+        try:
+            # a separate channel is used, since a failed passive declaration closes the channel
+            with self.connection_thread.connection.channel() as channel:
+                task_queue = channel.queue_declare(queue="task_queue", durable=True, passive=True)
+        except pika.exceptions.AMQPError as error:
+            self.logger.warning(f"Unable to get the worker capacity: {error}")
+            return None
+        return max(task_queue.method.consumer_count - task_queue.method.message_count, 1)
+
     def measure_configurations(self, channel, method, properties, body):
         """
         Callback function for the result of measuring
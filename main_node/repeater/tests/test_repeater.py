@@ -1,9 +1,13 @@
 import json
 import os
 
+import pandas as pd
+import pytest
+
 from core_entities.configuration import Configuration
 from core_entities.experiment import Experiment
 from core_entities.search_space import SearchSpace
+from repeater.acceptable_error_based import AcceptableErrorBasedType
 from repeater.repeater_selector import RepeaterOrchestration
 from tools.restore_db import RestoreDB
 
@@ -76,6 +80,35 @@ def test_5(get_energy_configurations, get_energy_tasks, get_energy_experiment_an
     assert needed_tasks_count == 0
 
 
+def test_6(get_energy_configurations, get_energy_tasks, get_energy_experiment_and_search_space):
+    # Streaming aggregation of Tasks results, received through several messages.
+    # Expected result: results and standard deviation match the aggregation over all not-outlier Tasks.
+    experiment = Experiment(*get_energy_experiment_and_search_space)
+    Configuration.set_task_config(experiment.description["Context"]["TaskConfiguration"])
+    configuration = Configuration(get_energy_configurations[1]["Params"], Configuration.Type.PREDICTED,
+                                  experiment.unique_id)
+    for task in get_energy_tasks[:10]:
+        configuration.add_task(task)
+        configuration = Configuration.from_json(configuration.to_json())
+    ok_tasks = [task["result"] for task in get_energy_tasks[:10] if task["ResultValidityCheckMark"] == "OK"]
+    expected = pd.DataFrame(ok_tasks, columns=list(experiment.get_objectives().keys()))
+    assert configuration.results == pytest.approx(dict(expected.mean()))
+    assert configuration.get_standard_deviation() == pytest.approx(expected.std().to_list())
+    assert configuration.get_statistics()["energy"].count == len(ok_tasks)
+
+
+def test_7(get_energy_experiment_and_search_space):
+    # Estimation of the number of repetitions to reach the acceptable error.
+    # Expected result: the noisier the results, the more Tasks are needed, but not more than MaxTasksPerConfiguration.
+    experiment = Experiment(*get_energy_experiment_and_search_space)
+    repeater = AcceptableErrorBasedType(experiment.description, experiment.unique_id, experiment)
+    max_tasks = repeater.max_tasks_per_configuration
+    low_noise = repeater._estimate_number_of_tasks(3, 5.0, 200.0, 2.0)
+    high_noise = repeater._estimate_number_of_tasks(3, 5.0, 200.0, 10.0)
+    assert 3 < low_noise < high_noise <= max_tasks
+    assert repeater._estimate_number_of_tasks(3, 5.0, 200.0, 1000.0) == max_tasks
+
+
 def measure_task(configurations_sample: list, tasks_sample: list, experiment_description: dict,
                  search_space: SearchSpace, measured_tasks: int,
                  config_type: Configuration.Type, config_status: dict):
@@ -1,18 +1,16 @@
-import os
+from core_entities.experiment import Experiment
 from stop_condition.stop_condition import StopCondition
 
 
 class BadConfigurationBasedType(StopCondition):
+    TRIGGERING_EVENTS = frozenset({Experiment.Event.BAD_CONFIGURATION})
 
     def __init__(self, stop_condition_parameters: dict, experiment_description: dict, experiment_id: str):
         super().__init__(stop_condition_parameters, experiment_description, experiment_id)
         self.threshold = stop_condition_parameters["Parameters"]["MaxBadConfigurations"]
-        if os.environ.get('TEST_MODE') != 'UNIT_TEST':
-            self.start_threads()
 
-    def is_finish(self):
-        bad_configurations_number = \
-            self.database.get_last_record_by_experiment_id("Experiment_state", self.experiment_id)["Number_of_bad_configs"]
+    def is_finish(self, experiment: Experiment):
+        bad_configurations_number = experiment.get_bad_configuration_number()
         if bad_configurations_number >= self.threshold:
             self.decision = True
         self.logger.debug(f"Currently {bad_configurations_number} bad Configurations in Experiment.")
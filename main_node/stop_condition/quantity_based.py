@@ -1,4 +1,4 @@
-import os
+from core_entities.experiment import Experiment
 from stop_condition.stop_condition import StopCondition
 
 
@@ -7,12 +7,9 @@ class QuantityBasedType(StopCondition):
     def __init__(self, stop_condition_parameters: dict, experiment_description: dict, experiment_id: str):
         super().__init__(stop_condition_parameters, experiment_description, experiment_id)
         self.max_configs = stop_condition_parameters["Parameters"]["MaxConfigs"]
-        if os.environ.get('TEST_MODE') != 'UNIT_TEST':
-            self.start_threads()
 
-    def is_finish(self):
-        numb_of_measured_configurations = \
-            self.database.get_last_record_by_experiment_id("Experiment_state", self.experiment_id)["Number_of_measured_configs"]
+    def is_finish(self, experiment: Experiment):
+        numb_of_measured_configurations = experiment.get_number_of_measured_configurations()
         if numb_of_measured_configurations >= self.max_configs:
             self.decision = True
         self.logger.debug(f"Number of measured configurations - {numb_of_measured_configurations}. Maximum - {self.max_configs}")
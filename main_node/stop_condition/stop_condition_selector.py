@@ -1,39 +1,22 @@
 import logging
-import os
 
 from core_entities.experiment import Experiment
-from tools.mongo_dao import MongoDB
+from stop_condition.stop_condition_validator import StopConditionValidator
 from tools.reflective_class_import import reflective_class_import
 
 
-def launch_stop_condition_threads(experiment_id: str, experiment: Experiment = None):
+def build_stop_condition_validator(experiment_id: str, experiment: Experiment) -> StopConditionValidator:
     """
+    Builds Stop Conditions and the Stop Condition Validator, which evaluates them on Experiment state changes.
     :param experiment_id: the unique ID of the Experiment
-    :param experiment: Experiment class instance, (!)used only in tests
-    :return: activated stop condition entities
+    :param experiment: Experiment class instance
+    :return: Stop Condition Validator with the activated Stop Conditions, it should be stopped with the Experiment
     """
     logger = logging.getLogger(__name__)
-    if os.environ.get('TEST_MODE') != 'UNIT_TEST':
-        database = MongoDB(os.getenv("BRISE_DATABASE_HOST"),
-                           os.getenv("BRISE_DATABASE_PORT"),
-                           os.getenv("BRISE_DATABASE_NAME"),
-                           os.getenv("BRISE_DATABASE_USER"),
-                           os.getenv("BRISE_DATABASE_PASS"))
-
-        experiment_description = None
-        while experiment_description is None:
-            experiment_description = database.get_last_record_by_experiment_id("Experiment_description", experiment_id)
-    else:
-        database = MongoDB("test", 0, "test", "user", "pass")
-        test_experiment = experiment
-        experiment_description = test_experiment.description
+    experiment_description = experiment.description
 
     parameters = experiment_description["StopCondition"]
 
-    stop_condition_validator_class = reflective_class_import(class_name="StopConditionValidator", folder_path="stop_condition")
-    stop_condition_validator_class(experiment_id, experiment_description)
-    logger.debug("Assigned Stop Condition validator.")
-
     activated_scs = []
     for sc in parameters["Instance"]:
         sc_name = parameters["Instance"][sc]["Name"]
@@ -45,4 +28,8 @@ def launch_stop_condition_threads(experiment_id: str, experiment: Experiment = N
             logger.debug(f"Assigned {sc_name} Stop Condition of type {sc_type}.")
         else:
             logger.warning(f"{sc_name} is not used in StopConditionTriggerLogic definition and will be ignored!")
-    return activated_scs
+
+    stop_condition_validator_class = reflective_class_import(class_name="StopConditionValidator", folder_path="stop_condition")
+    stop_condition_validator = stop_condition_validator_class(experiment, experiment_description, activated_scs)
+    logger.debug("Assigned Stop Condition validator.")
+    return stop_condition_validator
@@ -1,140 +1,127 @@
-import datetime
-import json
 import logging
 import os
 import re
 import threading
-import time
+from typing import Iterable, List, Set
 
 import numexpr as ne
-from tools.mongo_dao import MongoDB
-from tools.rabbitmq_common_tools import RabbitMQConnection, publish
+from core_entities.experiment import Experiment
+from stop_condition.stop_condition import StopCondition
+from tools.rabbitmq_common_tools import publish
 
 
 class StopConditionValidator:
     """
     Main idea is to create executable boolean math expression from the different stop conditions
     using user-defined pattern (StopConditionLogic in experiment description)
-    and then execute it with numexpr (math-only functions analogue of eval)
-    """
-    def __init__(self, experiment_id: str, experiment_description: dict):
-        self.database = MongoDB(os.getenv("BRISE_DATABASE_HOST"),
-                                os.getenv("BRISE_DATABASE_PORT"),
-                                os.getenv("BRISE_DATABASE_NAME"),
-                                os.getenv("BRISE_DATABASE_USER"),
-                                os.getenv("BRISE_DATABASE_PASS"))
+    and then execute it with numexpr (math-only functions analogue of eval).
 
-        self.experiment_id = experiment_id
+    Validator evaluates all Stop Conditions of the Experiment in-process. It subscribes to the Experiment state changes,
+    re-evaluates only the Stop Conditions affected by the occurred events and applies the expression immediately.
+    Time-dependent Stop Conditions are evaluated by timer.
+    """
+    def __init__(self, experiment: Experiment, experiment_description: dict, stop_conditions: Iterable[StopCondition]):
+        self.experiment = experiment
+        self.experiment_id = experiment.unique_id
         self.logger = logging.getLogger(__name__)
         self.active = True
         self.expression = experiment_description["StopCondition"]["StopConditionTriggerLogic"]["Expression"]
         self.stop_condition_states = {}
+        self.stop_conditions: List[StopCondition] = list(stop_conditions)
+        # Experiment state changes and timers are reported from different threads
+        self._lock = threading.RLock()
+        self._timers: List[threading.Timer] = []
 
         for sc_key in experiment_description["StopCondition"]["Instance"]:
             if re.search(experiment_description["StopCondition"]["Instance"][sc_key]["Name"], self.expression):
                 self.stop_condition_states[experiment_description["StopCondition"]["Instance"][sc_key]["Name"]] = False
 
         self.expression = self.expression.replace("or", "|").replace("and", "&")
-        self.repetition_interval = datetime.timedelta(**{
-            experiment_description["StopCondition"]["StopConditionTriggerLogic"]["InspectionParameters"]["TimeUnit"]:
-            experiment_description["StopCondition"]["StopConditionTriggerLogic"]["InspectionParameters"]["RepetitionPeriod"]}).total_seconds()
 
         if os.environ.get('TEST_MODE') != 'UNIT_TEST':
-            self.connection_thread = EventServiceConnection(self)
-            self.connection_thread.start()
-            self.processing_thread = threading.Thread(target=self.self_evaluation, args=())
-            self.channel = self.connection_thread.channel
-            self.processing_thread.start()
+            self.experiment.subscribe(self.on_experiment_state_change)
+            for stop_condition in self.stop_conditions:
+                self._schedule_evaluation(stop_condition)
 
-    def self_evaluation(self):
+    def on_experiment_state_change(self, experiment: Experiment, events: Set[Experiment.Event]) -> None:
         """
-        This function performs Search Space filling check periodically according to user-defined repetition interval.
+        Callback for the Experiment state changes.
+        :param experiment: the Experiment, that changed the state.
+        :param events: set of occurred Experiment.Event.
         """
-        counter = 0
-        listen_interval = self.repetition_interval/10
-        while self.active:
-            time.sleep(listen_interval)
-            counter = counter + 1
-            if counter % 10 == 0:
-                counter = 0
-                last_experiment_state = self.database.get_last_record_by_experiment_id("Experiment_state", self.experiment_id)
-                if last_experiment_state is not None:
-                    numb_of_measured_configurations = last_experiment_state["Number_of_measured_configs"]
-                else:
-                    numb_of_measured_configurations = 0
-                    self.logger.warning(f"No Experiment state is yet available for the experiment {self.experiment_id}")
-                if numb_of_measured_configurations > 0:
-                    search_space_size = \
-                        self.database.get_last_record_by_experiment_id("Search_space", self.experiment_id)["Search_space_size"]
-                    if numb_of_measured_configurations >= search_space_size and self.active:
-                        self.active = False
-                        msg = "Entire Search Space was measured."
-                        self.logger.info(msg)
-                        publish(exchange='stop_experiment_exchange',
-                                routing_key=self.experiment_id,
-                                body=msg)
+        with self._lock:
+            if not self.active:
+                return
+            if Experiment.Event.FINISHED in events:
+                self.stop()
+                return
+            if Experiment.Event.CONFIGURATION_MEASURED in events and self._is_search_space_exhausted():
+                self._stop_experiment("Entire Search Space was measured.")
+                return
+            for stop_condition in self.stop_conditions:
+                if stop_condition.TRIGGERING_EVENTS & events:
+                    self._evaluate(stop_condition)
+            self.validate_conditions()
 
-    def validate_conditions(self, ch, method, properties, body):
+    def validate_conditions(self) -> bool:
         """
-        This function fills self.expression variable with validation results for corresponding
-        stop conditions (boolean type). Then it just evaluates this expression.
-        :param ch: pika.Channel
-        :param method:  pika.spec.Basic.GetOk
-        :param properties: pika.spec.BasicProperties
-        :param body: json pair of stop_condition_id: stop_condition_decision
+        This function evaluates self.expression with the current decisions of the Stop Conditions.
+        The Experiment is stopped, if the expression is satisfied.
         :return: result of SC validation according to user-defined pattern.
         """
-        dictionary_dump = json.loads(body.decode())
-        if dictionary_dump["experiment_id"] == self.experiment_id:
-            self.stop_condition_states[dictionary_dump["stop_condition_type"]] = dictionary_dump["decision"]
-            result = ne.evaluate(self.expression, local_dict=self.stop_condition_states)
-            if result and self.active:
-                self.active = False
-                msg = "Stop Condition(s) was reached."
-                self.logger.info(msg)
-                dictionary_dump = {"experiment_id": self.experiment_id}
-                body = json.dumps(dictionary_dump)
-                publish(exchange='stop_experiment_exchange',
-                        routing_key=self.experiment_id,
-                        body=msg)
+        with self._lock:
+            # Stop Conditions make sense only after the first (default) Configuration was measured
+            if not self.active or not self.experiment.measured_configurations:
+                return False
+            result = bool(ne.evaluate(self.expression, local_dict=self.stop_condition_states))
+            if result:
+                self._stop_experiment("Stop Condition(s) was reached.")
+            return result
 
-    def stop_thread(self, ch, method, properties, body):
+    def stop(self) -> None:
         """
-        This function stops Stop Condition microservice.
-        :param ch: pika.Channel
-        :param method:  pika.spec.Basic.GetOk
-        :param properties: pika.spec.BasicProperties
-        :param body: empty
+        This function stops Stop Condition Validator (in case of BRISE Experiment termination).
         """
-        self.connection_thread.stop()
-        self.active = False
+        with self._lock:
+            self.active = False
+            for timer in self._timers:
+                timer.cancel()
+            self._timers.clear()
+            self.experiment.unsubscribe(self.on_experiment_state_change)
 
+    def _evaluate(self, stop_condition: StopCondition) -> None:
+        previous_decision = stop_condition.decision
+        stop_condition.is_finish(self.experiment)
+        self.stop_condition_states[stop_condition.stop_condition_type] = stop_condition.decision
+        if previous_decision != stop_condition.decision:
+            self.logger.info(f"{stop_condition.__class__.__name__} Stop Condition decision: "
+                             f"{'stop' if stop_condition.decision else 'continue'} running Experiment.")
 
-class EventServiceConnection(RabbitMQConnection):
-    """
-    This class is responsible for listening 2 queues.
-    1. `check_stop_condition_expression_exchange` queue for triggering StopConditionTriggerLogic expression evaluation logic.
-    2. `stop_components` for shutting down Stop Condition Validator (in case of BRISE Experiment termination).
-    """
+    def _schedule_evaluation(self, stop_condition: StopCondition) -> None:
+        seconds = stop_condition.get_seconds_until_evaluation()
+        if seconds is not None:
+            timer = threading.Timer(seconds, self._on_timer, args=(stop_condition,))
+            timer.daemon = True
+            self._timers.append(timer)
+            timer.start()
 
-    def __init__(self, stop_condition_validator: StopConditionValidator):
-        """
-        The function for initializing consumer thread
-        :param stop_condition_validator: instance of StopConditionValidator class
-        """
-        self.stop_condition_validator: StopConditionValidator = stop_condition_validator
-        self.experiment_id = self.stop_condition_validator.experiment_id
-        super().__init__(stop_condition_validator)
+    def _on_timer(self, stop_condition: StopCondition) -> None:
+        with self._lock:
+            self._timers = [timer for timer in self._timers if timer.is_alive()
+                            and timer is not threading.current_thread()]
+            if not self.active:
+                return
+            self._evaluate(stop_condition)
+            if not stop_condition.decision:
+                self._schedule_evaluation(stop_condition)
+            self.validate_conditions()
 
-    def bind_and_consume(self):
-        self.termination_result = self.channel.queue_declare(queue='', exclusive=True)
-        self.termination_queue_name = self.termination_result.method.queue
-        self.channel.queue_bind(exchange='experiment_termination_exchange',
-                                queue=self.termination_queue_name,
-                                routing_key=self.experiment_id)
+    def _is_search_space_exhausted(self) -> bool:
+        return self.experiment.get_number_of_measured_configurations() >= self.experiment.search_space.size
 
-        self.channel.basic_consume(queue='check_stop_condition_expression_exchange' + self.experiment_id,
-                                   auto_ack=True,
-                                   on_message_callback=self.stop_condition_validator.validate_conditions)
-        self.channel.basic_consume(queue=self.termination_queue_name, auto_ack=True,
-                                   on_message_callback=self.stop_condition_validator.stop_thread)
+    def _stop_experiment(self, msg: str) -> None:
+        self.logger.info(msg)
+        self.stop()
+        publish(exchange='stop_experiment_exchange',
+                routing_key=self.experiment_id,
+                body=msg)
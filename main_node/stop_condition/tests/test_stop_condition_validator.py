@@ -0,0 +1,126 @@
+import threading
+
+import pytest
+
+from core_entities.configuration import Configuration
+from core_entities.experiment import Experiment
+from stop_condition import stop_condition_validator
+from stop_condition.bad_configuration_based import BadConfigurationBasedType
+from stop_condition.guaranteed import GuaranteedType
+from stop_condition.quantity_based import QuantityBasedType
+from stop_condition.stop_condition_validator import StopConditionValidator
+from stop_condition.time_based import TimeBased
+
+
+class StopMessages(list):
+    """
+    Messages, published by the Validator to stop the Experiment.
+    """
+    def __init__(self):
+        super().__init__()
+        self.received = threading.Event()
+
+    def publish(self, exchange, routing_key, body):
+        self.append((exchange, routing_key, body))
+        self.received.set()
+
+
+@pytest.fixture
+def stop_messages(monkeypatch):
+    messages = StopMessages()
+    monkeypatch.setattr(stop_condition_validator, "publish", messages.publish)
+    yield messages
+
+
+def get_experiment(experiment_and_search_space, number_of_measured_configurations: int) -> Experiment:
+    experiment = Experiment(*experiment_and_search_space)
+    for threads in range(1, number_of_measured_configurations + 1):
+        experiment.measured_configurations.append(
+            Configuration({"frequency": 2900.0, "threads": threads}, Configuration.Type.TEST, experiment.unique_id))
+    return experiment
+
+
+def get_validator(experiment: Experiment, expression: str, *stop_conditions) -> StopConditionValidator:
+    description = {"StopCondition": {
+        "Instance": {sc.stop_condition_type: {"Name": sc.stop_condition_type} for sc in stop_conditions},
+        "StopConditionTriggerLogic": {"Expression": expression}}}
+    return StopConditionValidator(experiment, description, stop_conditions)
+
+
+def count_evaluations(stop_condition, evaluations: list):
+    is_finish = stop_condition.is_finish
+
+    def spy(experiment):
+        evaluations.append(stop_condition.stop_condition_type)
+        return is_finish(experiment)
+
+    stop_condition.is_finish = spy
+
+
+def test_0_event_routing(get_energy_experiment_and_search_space, stop_messages):
+    # Test #0. Report different Experiment events to the Validator
+    # Expected result: only the Stop Conditions, triggered by the occurred events, are evaluated from the Experiment
+    experiment = get_experiment(get_energy_experiment_and_search_space, 2)
+    quantity = QuantityBasedType({"Name": "QB", "Parameters": {"MaxConfigs": 3}}, experiment.description,
+                                 experiment.unique_id)
+    guaranteed = GuaranteedType({"Name": "G"}, experiment.description, experiment.unique_id)
+    bad = BadConfigurationBasedType({"Name": "BCB", "Parameters": {"MaxBadConfigurations": 1}},
+                                    experiment.description, experiment.unique_id)
+    validator = get_validator(experiment, "QB or G or BCB", quantity, guaranteed, bad)
+    evaluations = []
+    for stop_condition in (quantity, guaranteed, bad):
+        count_evaluations(stop_condition, evaluations)
+
+    validator.on_experiment_state_change(experiment, {Experiment.Event.CONFIGURATION_MEASURED})
+    assert evaluations == ["QB"]
+    validator.on_experiment_state_change(experiment, {Experiment.Event.SOLUTION_UPDATED,
+                                                      Experiment.Event.MODEL_STATE_UPDATED})
+    assert evaluations == ["QB", "G"]
+    assert stop_messages == []
+
+    experiment.bad_configurations_number = 1
+    validator.on_experiment_state_change(experiment, {Experiment.Event.BAD_CONFIGURATION})
+    assert evaluations == ["QB", "G", "BCB"]
+    assert validator.stop_condition_states == {"QB": False, "G": False, "BCB": True}
+    assert stop_messages == [("stop_experiment_exchange", experiment.unique_id, "Stop Condition(s) was reached.")]
+
+    validator.on_experiment_state_change(experiment, {Experiment.Event.CONFIGURATION_MEASURED})
+    assert evaluations == ["QB", "G", "BCB"]
+
+
+def test_1_time_based_timer(get_energy_experiment_and_search_space, stop_messages):
+    # Test #1. Schedule the evaluation of the Time Based Stop Condition
+    # Expected result: the Experiment is stopped by timer, without any Experiment event
+    experiment = get_experiment(get_energy_experiment_and_search_space, 1)
+    time_based = TimeBased({"Name": "TB", "Parameters": {"TimeUnit": "seconds", "MaxRunTime": 0.2}},
+                           experiment.description, experiment.unique_id)
+    validator = get_validator(experiment, "TB", time_based)
+    assert 0 < time_based.get_seconds_until_evaluation() <= 0.2
+    validator._schedule_evaluation(time_based)
+    validator.on_experiment_state_change(experiment, {Experiment.Event.CONFIGURATION_MEASURED})
+    assert stop_messages == []
+
+    assert stop_messages.received.wait(5)
+    assert time_based.decision
+    assert not validator.active
+    assert stop_messages == [("stop_experiment_exchange", experiment.unique_id, "Stop Condition(s) was reached.")]
+
+
+def test_2_trigger_logic(get_energy_experiment_and_search_space, stop_messages):
+    # Test #2. Evaluate the StopConditionTriggerLogic expression with different decisions of the Stop Conditions
+    # Expected result: the Experiment is stopped only if the expression is satisfied and a Configuration is measured
+    experiment = get_experiment(get_energy_experiment_and_search_space, 0)
+    stop_conditions = [QuantityBasedType({"Name": name, "Parameters": {"MaxConfigs": 1}}, experiment.description,
+                                         experiment.unique_id) for name in ("A", "B", "C")]
+    validator = get_validator(experiment, "(A and B) or C", *stop_conditions)
+    validator.stop_condition_states.update({"A": True, "B": True, "C": True})
+    assert not validator.validate_conditions()
+
+    experiment.measured_configurations.append(
+        Configuration({"frequency": 2900.0, "threads": 1}, Configuration.Type.TEST, experiment.unique_id))
+    for decisions, expected in (((True, False, False), False), ((False, True, False), False),
+                                ((False, False, True), True), ((True, True, False), True)):
+        validator.active = True
+        validator.stop_condition_states.update(zip("ABC", decisions))
+        assert validator.validate_conditions() == expected
+    assert len(stop_messages) == 2
@@ -1,10 +1,12 @@
-import os
 import datetime
 
+from core_entities.experiment import Experiment
 from stop_condition.stop_condition import StopCondition
 
 
 class TimeBased(StopCondition):
+    # depends only on the elapsed time, evaluated by timer
+    TRIGGERING_EVENTS = frozenset()
 
     def __init__(self, stop_condition_parameters: dict, experiment_description: dict, experiment_id: str):
         super().__init__(stop_condition_parameters, experiment_description, experiment_id)
@@ -14,11 +16,12 @@ class TimeBased(StopCondition):
         temp_msg = f"Timeout set to {self.interval} seconds."
         self.logger.info(temp_msg)
         self.time_started = datetime.datetime.now()
-        if os.environ.get('TEST_MODE') != 'UNIT_TEST':
-            self.start_threads()
 
-    def is_finish(self):
+    def get_seconds_until_evaluation(self) -> float:
+        return max(self.interval - (datetime.datetime.now() - self.time_started).total_seconds(), 0)
+
+    def is_finish(self, experiment: Experiment):
         seconds_elapsed = (datetime.datetime.now() - self.time_started).total_seconds()
-        if seconds_elapsed > self.interval:
+        if seconds_elapsed >= self.interval:
             self.decision = True
         self.logger.debug(f"{seconds_elapsed} out of {self.interval} seconds elapsed.")
@@ -1,17 +1,15 @@
-import os
+from core_entities.experiment import Experiment
 from stop_condition.stop_condition import StopCondition
 
 
 class ValidationBasedType(StopCondition):
+    TRIGGERING_EVENTS = frozenset({Experiment.Event.MODEL_STATE_UPDATED})
 
     def __init__(self, stop_condition_parameters: dict, experiment_description: dict, experiment_id: str):
         super().__init__(stop_condition_parameters, experiment_description, experiment_id)
-        if os.environ.get('TEST_MODE') != 'UNIT_TEST':
-            self.start_threads()
 
-    def is_finish(self):
-        last_model_is_valid = \
-            self.database.get_last_record_by_experiment_id("Experiment_state", self.experiment_id)["is_model_valid"]
+    def is_finish(self, experiment: Experiment):
+        last_model_is_valid = experiment.get_model_state()
         if last_model_is_valid:
             self.decision = True
         self.logger.debug(f"Last model was{'' if last_model_is_valid else ' not'} valid.")
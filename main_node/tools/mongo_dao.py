@@ -1,15 +1,233 @@
+import atexit
+import json
 import logging
-from typing import Mapping, Union
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Mapping, Set, Tuple, Union
 
+import bson.errors
 import pymongo
+import pymongo.errors
 from tools.singleton import Singleton
 
 
+# list of fields to retrieve or mapping field: include/exclude flag, as accepted by pymongo
+Projection = Union[List[str], Mapping[str, bool]]
+
+
+class _WriteBehindQueue(threading.Thread):
+    """
+    Background writer of the DAO. Write operations are queued and periodically sent to the database in bulk,
+    so the calling threads do not wait for the database. Pending updates of the same document (same collection and
+    query) are coalesced into a single update, unless an insert into the collection was queued after them.
+    Operations within one collection are applied in the order of their submission.
+    Batches, interrupted by a lost connection, are retried. Persistent failures are raised by the next `flush`.
+    Readers wait only for the operations of the collection they read (see `wait`).
+    """
+    DUPLICATE_KEY_ERROR = 11000
+
+    def __init__(self, database, prepare_collection: Callable[[str], None] = None, flush_interval: float = 0.1,
+                 max_attempts: int = 3):
+        """
+        :param database: pymongo database object.
+        :param prepare_collection: optional function, which is called with the collection name before every write.
+        :param flush_interval: maximal delay (seconds) between queueing an operation and sending it to the database.
+        :param max_attempts: number of attempts to write a batch of a collection, if the connection is lost.
+        """
+        super().__init__(name="MongoDB write-behind", daemon=True)
+        self.logger = logging.getLogger(__name__)
+        self.database = database
+        self.prepare_collection = prepare_collection
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        # collection name -> list of operations, operation is a list ["insert", record] or
+        # ["update", query, fields_to_set, fields_to_set_on_insert, upsert]
+        self._pending: Dict[str, List[list]] = OrderedDict()
+        # collection name -> {(query key, upsert): pending update operation}, operations that could be coalesced
+        self._coalescible: Dict[str, Dict[tuple, list]] = {}
+        # collections, which operations are being written by the writer or by a reading thread
+        self._writing_collections: Set[str] = set()
+        # the first persistent write error since the last flush
+        self._error: Union[Exception, None] = None
+        self._is_flush_requested = False
+        self._is_stopped = False
+        self._condition = threading.Condition()
+
+    def insert(self, collection_name: str, records: List[Mapping]) -> None:
+        with self._condition:
+            operations = self._pending.setdefault(collection_name, [])
+            operations.extend(["insert", dict(record)] for record in records)
+            # updates, queued before the insert, could not be moved after it anymore
+            self._coalescible.pop(collection_name, None)
+            self._condition.notify_all()
+        self._flush_if_stopped()
+
+    def update(self, collection_name: str, query: Mapping, new_val: Mapping, on_insert: Mapping = None,
+               upsert: bool = False) -> None:
+        key = (json.dumps(query, sort_keys=True, default=str), upsert)
+        with self._condition:
+            coalescible = self._coalescible.setdefault(collection_name, {})
+            if key in coalescible:
+                operation = coalescible[key]
+                operation[2].update(new_val)
+                operation[3].update(on_insert or {})
+            else:
+                operation = ["update", dict(query), dict(new_val), dict(on_insert or {}), upsert]
+                coalescible[key] = operation
+                self._pending.setdefault(collection_name, []).append(operation)
+            self._condition.notify_all()
+        self._flush_if_stopped()
+
+    def _flush_if_stopped(self) -> None:
+        # after the writer has been stopped, operations are written synchronously
+        if not self.is_alive():
+            self.flush()
+
+    def wait(self, collection_name: str) -> None:
+        """
+        Blocks until the queued operations of the collection are written to the database (read-your-writes).
+        Pending operations of the collection are written by the calling thread, so it does not wait for the
+        operations of other collections. Write errors are not raised (see `flush`).
+        :param collection_name: name of the collection.
+        """
+        with self._condition:
+            while collection_name in self._writing_collections:
+                self._condition.wait(self.flush_interval)
+            if collection_name not in self._pending:
+                return
+            batch = self._take_pending([collection_name])
+        self._write(batch)
+
+    def flush(self) -> None:
+        """
+        Blocks until all queued operations are written to the database.
+        Raises the first persistent write error, which happened since the previous flush.
+        """
+        with self._condition:
+            self._is_flush_requested = True
+            self._condition.notify_all()
+            while self._pending or self._writing_collections:
+                batch = self._take_pending() if not self.is_alive() else None
+                if batch:
+                    # the writer is not running (e.g. interpreter shutdown), write in the calling thread
+                    self._write(batch)
+                else:
+                    self._condition.wait(self.flush_interval)
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def stop(self) -> None:
+        try:
+            self.flush()
+        finally:
+            with self._condition:
+                self._is_stopped = True
+                self._condition.notify_all()
+
+    def run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._get_free_collections() and not (self._is_stopped and not self._pending):
+                    self._condition.wait(self.flush_interval)
+                if self._is_stopped and not self._pending:
+                    return
+                # let concurrent updates of the same documents to accumulate
+                self._condition.wait_for(lambda: self._is_stopped or self._is_flush_requested,
+                                         timeout=self.flush_interval)
+                collection_names = self._get_free_collections()
+            # collections are taken one by one, the others could be written meanwhile by the reading threads
+            for collection_name in collection_names:
+                with self._condition:
+                    if collection_name not in self._get_free_collections():
+                        continue
+                    batch = self._take_pending([collection_name])
+                self._write(batch)
+
+    def _get_free_collections(self) -> List[str]:
+        # collections with pending operations, which are not being written by another thread
+        return [name for name in self._pending if name not in self._writing_collections]
+
+    def _take_pending(self, collection_names: List[str] = None) -> Dict[str, List[list]]:
+        # should be called with the acquired condition, the taken collections are marked as being written
+        batch = OrderedDict()
+        for collection_name in collection_names or self._get_free_collections():
+            batch[collection_name] = self._pending.pop(collection_name)
+            self._coalescible.pop(collection_name, None)
+        self._writing_collections.update(batch)
+        if not self._pending:
+            self._is_flush_requested = False
+        return batch
+
+    def _write(self, batch: Dict[str, List[list]]) -> None:
+        for collection_name, operations in batch.items():
+            try:
+                if self.prepare_collection is not None:
+                    self.prepare_collection(collection_name)
+                self._bulk_write(self.database[collection_name], [self._to_request(op) for op in operations])
+                self.logger.debug(f"Written to mongo {collection_name}: {len(operations)} operation(s).")
+            except (pymongo.errors.PyMongoError, bson.errors.BSONError) as error:
+                self.logger.error(f"Unable to write {len(operations)} operation(s) to {collection_name}: {error}")
+                with self._condition:
+                    if self._error is None:
+                        self._error = error
+            finally:
+                with self._condition:
+                    self._writing_collections.discard(collection_name)
+                    self._condition.notify_all()
+
+    def _bulk_write(self, collection, requests: List[Union[pymongo.InsertOne, pymongo.UpdateOne]]) -> None:
+        position = 0
+        attempt = 1
+        while position < len(requests):
+            try:
+                collection.bulk_write(requests[position:], ordered=True)
+                return
+            except pymongo.errors.BulkWriteError as error:
+                write_errors = error.details.get("writeErrors")
+                if attempt == 1 or not write_errors or write_errors[0]["code"] != self.DUPLICATE_KEY_ERROR \
+                        or not isinstance(requests[position + write_errors[0]["index"]], pymongo.InsertOne):
+                    raise error
+                # the record was inserted by the interrupted attempt (it keeps its "_id"), continue after it
+                position += write_errors[0]["index"] + 1
+            except pymongo.errors.ConnectionFailure as error:
+                if attempt == self.max_attempts:
+                    raise error
+                self.logger.warning(f"Unable to write to {collection.name}: {error}. Retrying.")
+                time.sleep(self.flush_interval * attempt)
+                attempt += 1
+
+    @staticmethod
+    def _to_request(operation: list) -> Union[pymongo.InsertOne, pymongo.UpdateOne]:
+        if operation[0] == "insert":
+            return pymongo.InsertOne(operation[1])
+        _, query, fields_to_set, fields_to_set_on_insert, upsert = operation
+        update = {"$set": fields_to_set}
+        fields_to_set_on_insert = {k: v for k, v in fields_to_set_on_insert.items() if k not in fields_to_set}
+        if fields_to_set_on_insert:
+            update["$setOnInsert"] = fields_to_set_on_insert
+        return pymongo.UpdateOne(query, update, upsert=upsert)
+
+
 class MongoDB(metaclass=Singleton):
     """
     This class plays a role of the Data Access Object (DAO) for MongoDB.
     It contains main CRUD operations (Create, Read, Update and Delete), used by BRISE to operate with a database
     """
+    # records of all collections are queried by the experiment ID, the most recent record first
+    _EXPERIMENT_INDEX = [("Exp_unique_ID", pymongo.ASCENDING), ("_id", pymongo.DESCENDING)]
+    # collection name -> list of indexes, each index is a list of (field, direction) pairs
+    INDEXES: Dict[str, List[List[Tuple[str, int]]]] = {
+        "Experiment_description": [_EXPERIMENT_INDEX, [("Exp_ID", pymongo.ASCENDING)]],
+        "Experiment_state": [_EXPERIMENT_INDEX],
+        "Search_space": [_EXPERIMENT_INDEX],
+        "Configuration": [_EXPERIMENT_INDEX, [("Configuration_ID", pymongo.ASCENDING)]],
+        "Task": [_EXPERIMENT_INDEX, [("Configuration_ID", pymongo.ASCENDING)]],
+        "Parameter_control_info": [_EXPERIMENT_INDEX],
+        "Transfer_learning_info": [_EXPERIMENT_INDEX]
+    }
+
     def __init__(self, mongo_host: str, mongo_port: int, database_name: str, user: str, passwd: str):
         self.logger = logging.getLogger(__name__)
         # if os.environ.get('TEST_MODE') != 'UNIT_TEST':
@@ -19,56 +237,131 @@ class MongoDB(metaclass=Singleton):
                                           )
         self.database = self.client[database_name]
         self.logger.info(f"New DB connection: {database_name} {user}")
+        # collections, which indexes are already ensured
+        self._indexed_collections: Set[str] = set()
+        for collection_name in self.database.list_collection_names():
+            self.ensure_indexes(collection_name)
+        self._write_queue = _WriteBehindQueue(self.database, prepare_collection=self.ensure_indexes)
+        self._write_queue.start()
+        atexit.register(self.close)
         # else:
         #     # if test mode - initialize connection to a database mock
         #     from tools.mongo_db_mock import MongoDB_mock
         #     mock_database = MongoDB_mock()
         #     self.database = mock_database.collections
 
-    def write_one_record(self, collection_name: str, record: Mapping) -> None:
+    def ensure_indexes(self, collection_name: str) -> None:
+        """
+        Creates (if needed) and verifies the indexes of the collection, required by the queries of BRISE.
+        Creating an index creates the collection, therefore it is done for the existing collections on connection
+        and for the other collections by the background writer, before the first write to them.
+        :param collection_name: name of the collection.
+        """
+        if collection_name not in self.INDEXES or collection_name in self._indexed_collections:
+            return
+        self._indexed_collections.add(collection_name)
+        indexes = self.INDEXES[collection_name]
         collection = self.database[collection_name]
-        x = collection.insert_one(record)
-        self.logger.debug("Written to mongo. Id: " + str(x.inserted_id))
+        try:
+            for index in indexes:
+                collection.create_index(index)
+            existing_indexes = [list(map(tuple, info["key"])) for info in collection.index_information().values()]
+            missing_indexes = [index for index in indexes if index not in existing_indexes]
+            if missing_indexes:
+                self.logger.warning(f"Indexes {missing_indexes} are missing in {collection_name}.")
+        except pymongo.errors.PyMongoError as error:
+            self.logger.warning(f"Unable to create indexes for {collection_name}: {error}")
+
+    def write_one_record(self, collection_name: str, record: Mapping) -> None:
+        self._write_queue.insert(collection_name, [record])
 
     def write_many_records(self, collection_name: str, records: list) -> None:
-        collection = self.database[collection_name]
-        x = collection.insert_many(records)
-        self.logger.debug("Written to mongo. Id: " + str(x.inserted_ids))
+        self._write_queue.insert(collection_name, records)
 
-    def get_all_records(self, collection_name: str) -> list:
-        result = []
+    def get_all_records(self, collection_name: str, projection: Projection = None) -> list:
+        """
+        :param collection_name: name of the collection.
+        :param projection: optional list of fields to retrieve (or mapping of fields to include/exclude),
+               e.g. to avoid loading pickled objects.
+        :return: list of records in the order of insertion.
+        """
+        self._write_queue.wait(collection_name)
         collection = self.database[collection_name]
-        for record in collection.find():
-            result.append(dict(record))
-        return result
+        return [dict(record) for record in collection.find({}, projection, sort=[("_id", pymongo.ASCENDING)])]
 
-    def get_last_record(self, collection_name: str) -> Union[Mapping, None]:
+    def get_last_record(self, collection_name: str, projection: Projection = None) -> Union[Mapping, None]:
+        self._write_queue.wait(collection_name)
         collection = self.database[collection_name]
-        if collection.estimated_document_count() > 0:
-            for record in collection.find().skip(collection.estimated_document_count() - 1):
-                return dict(record)
-        else:
+        record = collection.find_one({}, projection, sort=[("_id", pymongo.DESCENDING)])
+        if record is None:
             self.logger.warning("Unable to get last record from an empty collection")
             return None
+        return dict(record)
 
-    def get_records_by_experiment_id(self, collection_name: str, exp_id: str) -> list:
-        result = []
+    def get_records_by_experiment_id(self, collection_name: str, exp_id: str, projection: Projection = None) -> list:
+        """
+        :param collection_name: name of the collection.
+        :param exp_id: unique ID of the experiment.
+        :param projection: optional list of fields to retrieve (or mapping of fields to include/exclude),
+               e.g. to avoid loading pickled objects.
+        :return: list of the experiment records in the order of insertion.
+        """
+        self._write_queue.wait(collection_name)
         collection = self.database[collection_name]
-        for record in collection.find({"Exp_unique_ID": exp_id}):
-            result.append(dict(record))
-        return result
+        return [dict(record) for record in
+                collection.find({"Exp_unique_ID": exp_id}, projection, sort=[("_id", pymongo.ASCENDING)])]
 
-    def get_last_record_by_experiment_id(self, collection_name: str, exp_id: str) -> Union[Mapping, None]:
+    def count_records_by_experiment_id(self, collection_name: str, exp_id: str) -> int:
+        self._write_queue.wait(collection_name)
+        return self.database[collection_name].count_documents({"Exp_unique_ID": exp_id})
+
+    def get_last_record_by_experiment_id(self, collection_name: str, exp_id: str,
+                                         projection: Projection = None) -> Union[Mapping, None]:
+        """
+        :param collection_name: name of the collection.
+        :param exp_id: unique ID of the experiment.
+        :param projection: optional list of fields to retrieve (or mapping of fields to include/exclude),
+               e.g. to avoid loading pickled objects.
+        :return: the most recently inserted record of the experiment or None.
+        """
+        self._write_queue.wait(collection_name)
         collection = self.database[collection_name]
-        records = collection.find({"Exp_unique_ID": exp_id})
-        for r in records:
-            return dict(r)
+        record = collection.find_one({"Exp_unique_ID": exp_id}, projection, sort=[("_id", pymongo.DESCENDING)])
+        return dict(record) if record is not None else None
 
     def update_record(self, collection_name: str, query: Mapping, new_val: Mapping) -> None:
-        collection = self.database[collection_name]
-        new_values = {"$set": new_val}
-        collection.update_one(query, new_values)
+        self._write_queue.update(collection_name, query, new_val)
+
+    def upsert_record(self, collection_name: str, query: Mapping, new_val: Mapping, on_insert: Mapping = None) -> None:
+        """
+        Updates the record, or creates it if it does not exist yet. Replaces the find-then-update pattern.
+        :param collection_name: name of the collection.
+        :param query: query, which identifies the record.
+        :param new_val: fields to set.
+        :param on_insert: fields to set only if the record is created.
+        """
+        self._write_queue.update(collection_name, query, new_val, on_insert, upsert=True)
+
+    def flush(self) -> None:
+        """
+        Checkpoint: blocks until all queued write operations are applied to the database.
+        Raises the first persistent write error, which happened since the previous checkpoint.
+        """
+        self._write_queue.flush()
+
+    def close(self) -> None:
+        """
+        Flushes all queued write operations and stops the background writer.
+        Raises the first persistent write error, which happened since the previous checkpoint.
+        """
+        if self._write_queue.is_alive():
+            try:
+                self._write_queue.stop()
+            finally:
+                self._write_queue.join()
 
     def cleanup_database(self):
+        self.flush()
         for collection_name in self.database.list_collection_names():
             self.database.drop_collection(collection_name)
+        self._indexed_collections.clear()
@@ -1,7 +1,11 @@
 import logging
 import os
 import pika
+import pika.exceptions
 import threading
+from typing import Dict
+
+from tools.singleton import Singleton
 
 
 class RabbitMQConnection(threading.Thread):
@@ -45,6 +49,120 @@ class RabbitMQConnection(threading.Thread):
             self.logger.info(f"{self.module} is shutting down.")
             if self.connection.is_open:
                 self.connection.close()
+            release_publisher_connection()
+
+
+class RabbitMQPublisher(metaclass=Singleton):
+    """
+    Thread-safe publisher of messages to Event Service.
+    pika connections can not be shared between threads, therefore every publishing thread lazily opens its own
+    long-lived connection and channel, which are reused for all further messages of this thread.
+    Broken connections are re-established automatically. If publisher confirms are enabled
+    (``BRISE_EVENT_SERVICE_PUBLISHER_CONFIRMS=true``), every message is published synchronously and is retried
+    when the broker rejects it.
+    """
+    RECOVERABLE_ERRORS = (pika.exceptions.AMQPConnectionError, pika.exceptions.ConnectionClosed,
+                          pika.exceptions.StreamLostError, pika.exceptions.ChannelClosed,
+                          pika.exceptions.NackError)
+
+    def __init__(self, max_attempts: int = 3):
+        """
+        :param max_attempts: number of attempts to publish a message, reconnecting between them.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.host = os.getenv("BRISE_EVENT_SERVICE_HOST")
+        self.port = int(os.getenv("BRISE_EVENT_SERVICE_AMQP_PORT"))
+        self.conn_params = pika.ConnectionParameters(self.host, self.port)
+        self.confirm_delivery = os.getenv("BRISE_EVENT_SERVICE_PUBLISHER_CONFIRMS", "false").lower() == "true"
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+        # incremented by every shutdown, the connections opened before are closed by their threads on the next use
+        self._generation = 0
+        # owning thread -> connection, all opened connections are kept to be able to close them on shutdown
+        self._connections: Dict[threading.Thread, pika.BlockingConnection] = {}
+        self._connections_lock = threading.Lock()
+
+    def _get_channel(self) -> pika.adapters.blocking_connection.BlockingChannel:
+        channel = getattr(self._local, "channel", None)
+        if channel is None or not channel.is_open or self._local.generation != self._generation:
+            self.release_thread_connection()
+            with self._connections_lock:
+                generation = self._generation
+            connection = pika.BlockingConnection(self.conn_params)
+            channel = connection.channel()
+            if self.confirm_delivery:
+                channel.confirm_delivery()
+            self._local.connection = connection
+            self._local.channel = channel
+            self._local.generation = generation
+            with self._connections_lock:
+                self._connections[threading.current_thread()] = connection
+        return channel
+
+    def publish(self, exchange: str, routing_key: str, body, properties: pika.BasicProperties = None) -> None:
+        """
+        Publish the message to Event Service, reusing the connection of the calling thread.
+        :param exchange: target exchange
+        :param routing_key: defines experiment ID of this message
+        :param body: the body of the message
+        :param properties: optional properties of the message
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            channel = None
+            try:
+                channel = self._get_channel()
+                channel.basic_publish(exchange=exchange, routing_key=routing_key, body=body, properties=properties)
+                return
+            except pika.exceptions.ChannelWrongStateError as err:
+                if channel is not None and not channel.is_open:
+                    self.logger.warning("Attempt to send a message after closing the connection")
+                    self.release_thread_connection()
+                    return
+                raise err
+            except self.RECOVERABLE_ERRORS as err:
+                self.release_thread_connection()
+                if attempt == self.max_attempts:
+                    self.logger.error(f"Unable to publish a message to {exchange} after {attempt} attempts: {err}")
+                    raise err
+                self.logger.warning(f"Unable to publish a message to {exchange}: {err}. Reconnecting.")
+
+    def release_thread_connection(self) -> None:
+        """
+        Close the connection, opened by the calling thread (if any).
+        """
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        self._local.channel = None
+        if connection is not None:
+            with self._connections_lock:
+                if self._connections.get(threading.current_thread()) is connection:
+                    del self._connections[threading.current_thread()]
+            self._close(connection)
+
+    def shutdown(self) -> None:
+        """
+        Release the connections, opened by the publishing threads.
+        pika connections could be closed only by their threads, therefore only the connection of the calling thread
+        and the connections of already finished threads are closed here. The running threads close their connections
+        on the next publishing (and open new ones) or when they release them.
+        """
+        self.release_thread_connection()
+        with self._connections_lock:
+            self._generation += 1
+            finished = [thread for thread in self._connections if not thread.is_alive()]
+            connections = [self._connections.pop(thread) for thread in finished]
+            pending = len(self._connections)
+        for connection in connections:
+            self._close(connection)
+        self.logger.info(f"Publisher closed connection(s) of {len(connections)} finished thread(s), "
+                         f"{pending} connection(s) will be closed by their threads.")
+
+    def _close(self, connection: pika.BlockingConnection) -> None:
+        try:
+            if connection.is_open:
+                connection.close()
+        except pika.exceptions.AMQPError as err:
+            self.logger.debug(f"Error while closing publisher connection: {err}")
 
 
 def publish(exchange: str, routing_key: str, body):
@@ -54,14 +172,20 @@ def publish(exchange: str, routing_key: str, body):
     :param routing_key: defines experiment ID of this message
     :param body: the body of the message
     """
-    host = os.getenv("BRISE_EVENT_SERVICE_HOST")
-    port = int(os.getenv("BRISE_EVENT_SERVICE_AMQP_PORT"))
-    conn_params = pika.ConnectionParameters(host, port)
-    channel = pika.BlockingConnection(conn_params).channel()
-    try:
-        channel.basic_publish(exchange=exchange, routing_key=routing_key, body=body)
-    except pika.exceptions.ChannelWrongStateError as err:
-        if not channel.is_open:
-            logging.getLogger(exchange).warning("Attempt to send a message after closing the connection")
-        else:
-            raise err
+    RabbitMQPublisher().publish(exchange=exchange, routing_key=routing_key, body=body)
+
+
+def release_publisher_connection():
+    """
+    Close the publisher connection of the calling thread, e.g. before the thread terminates.
+    """
+    if RabbitMQPublisher._instance is not None:
+        RabbitMQPublisher().release_thread_connection()
+
+
+def shutdown_publisher():
+    """
+    Release the publisher connections (see `RabbitMQPublisher.shutdown`).
+    """
+    if RabbitMQPublisher._instance is not None:
+        RabbitMQPublisher().shutdown()
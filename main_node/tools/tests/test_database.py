@@ -1,14 +1,18 @@
 import os
 import pickle
+import time
 from collections import OrderedDict
 from typing import Tuple
 
+import pymongo.errors
+import pytest
+
 from core_entities.configuration import Configuration
 from core_entities.experiment import Experiment
 from core_entities.search_space import SearchSpace
 from core_entities.search_space import get_search_space_record
 from tools.initial_config import load_experiment_setup
-from tools.mongo_dao import MongoDB
+from tools.mongo_dao import MongoDB, _WriteBehindQueue
 
 database = MongoDB(os.getenv("BRISE_DATABASE_HOST"),
                                 os.getenv("BRISE_DATABASE_PORT"),
@@ -105,9 +109,98 @@ class TestDatabase:
         assert task['task id'] == written_record["Task_ID"]
         assert task == written_record["Task"]
 
+    def test_5_read_last_record_with_projection(self):
+        # Test #5. Write several records of the same experiment and read the last one with a projection
+        # Expected result: the most recently written record is returned, only the requested fields are retrieved
+        database.write_one_record("Experiment_state", {"Exp_unique_ID": "LastRecordID", "Iteration": 1, "Blob": b"1"})
+        database.write_one_record("Experiment_state", {"Exp_unique_ID": "LastRecordID", "Iteration": 2, "Blob": b"2"})
+        written_record = database.get_last_record_by_experiment_id("Experiment_state", "LastRecordID", ["Iteration"])
+        assert written_record["Iteration"] == 2
+        assert "Blob" not in written_record
+        assert database.count_records_by_experiment_id("Experiment_state", "LastRecordID") == 2
+        assert database.get_last_record_by_experiment_id("Experiment_state", "UnknownID") is None
+
+    def test_6_experiment_state_counters(self):
+        # Test #6. Add measured Configurations to the Experiment and read the Experiment state counters
+        # Expected result: counters used by Stop Conditions are updated on every added Configuration
+        experiment, _ = self.initialize_experiment()
+        fields = ["Number_of_configs_without_improvement", "Number_of_transferred_configs", "Is_default_improved"]
+        measured = {'enabled': True, 'evaluated': True, 'measured': True}
+        c1 = Configuration(OrderedDict({"frequency": 2900.0, "threads": 32}), Configuration.Type.DEFAULT, experiment.unique_id)
+        c1.results, c1.status = {"energy": 10.0}, dict(measured)
+        experiment.default_configuration = c1
+        c2 = Configuration(OrderedDict({"frequency": 2200.0, "threads": 8}), Configuration.Type.TRANSFERRED, experiment.unique_id)
+        c2.results, c2.status = {"energy": 20.0}, dict(measured)
+        experiment.add_configuration(c2)
+        state = database.get_last_record_by_experiment_id("Experiment_state", experiment.unique_id, fields)
+        assert [state[field] for field in fields] == [2, 1, False]
+        c3 = Configuration(OrderedDict({"frequency": 1600.0, "threads": 16}), Configuration.Type.FROM_SELECTOR, experiment.unique_id)
+        c3.results, c3.status = {"energy": 5.0}, dict(measured)
+        experiment.add_configuration(c3)
+        state = database.get_last_record_by_experiment_id("Experiment_state", experiment.unique_id, fields)
+        assert [state[field] for field in fields] == [1, 1, True]
+
+    def test_7_retry_interrupted_writes(self):
+        # Test #7. The connection is lost in the middle of a bulk write, then the write fails persistently
+        # Expected result: the interrupted batch is completed without duplicates, the persistent error is raised by flush
+        collection = FlakyCollection(database.database["Write_behind_test"], failures=[2])
+        queue = _WriteBehindQueue({"Write_behind_test": collection}, flush_interval=0.01)
+        queue.start()
+        queue.insert("Write_behind_test", [{"Exp_unique_ID": "Retry", "Iteration": i} for i in range(3)])
+        queue.update("Write_behind_test", {"Exp_unique_ID": "Retry", "Iteration": 0}, {"Updated": True})
+        queue.flush()
+        records = list(database.database["Write_behind_test"].find({"Exp_unique_ID": "Retry"}))
+        assert sorted(record["Iteration"] for record in records) == [0, 1, 2]
+        assert [record.get("Updated") for record in records] == [True, None, None]
+
+        collection.failures = [0] * queue.max_attempts
+        queue.insert("Write_behind_test", [{"Exp_unique_ID": "Retry", "Iteration": 3}])
+        with pytest.raises(pymongo.errors.AutoReconnect):
+            queue.flush()
+        queue.flush()
+        queue.stop()
+
+    def test_8_read_waits_only_for_its_collection(self):
+        # Test #8. Read a collection, while the writes to another collection could not be completed
+        # Expected result: the read returns without waiting for the other collection
+        blocked = FlakyCollection(database.database["Write_behind_blocked"], failures=[])
+        blocked.is_blocked = True
+        queue = _WriteBehindQueue({"Write_behind_blocked": blocked, "Task": database.database["Task"]},
+                                  flush_interval=0.01)
+        queue.start()
+        queue.insert("Write_behind_blocked", [{"Exp_unique_ID": "Blocked"}])
+        queue.insert("Task", [{"Exp_unique_ID": "NotBlocked"}])
+        queue.wait("Task")
+        assert database.database["Task"].count_documents({"Exp_unique_ID": "NotBlocked"}) == 1
+        blocked.is_blocked = False
+        queue.stop()
+        assert database.database["Write_behind_blocked"].count_documents({"Exp_unique_ID": "Blocked"}) == 1
+
     @staticmethod
     def initialize_experiment() -> Tuple[Experiment, SearchSpace]:
         experiment_description, search_space = load_experiment_setup(experiment_description_file)
         experiment = Experiment(experiment_description, search_space)
         Configuration.set_task_config(experiment.description["Context"]["TaskConfiguration"])
         return experiment, search_space
+
+
+class FlakyCollection:
+    """
+    Wrapper of a collection, which loses the connection after the given number of written operations of a bulk write,
+    or is blocked (does not write the first batch) until it is released.
+    """
+    def __init__(self, collection, failures: list):
+        self.collection = collection
+        self.name = collection.name
+        self.failures = failures
+        self.is_blocked = False
+
+    def bulk_write(self, requests, ordered=True):
+        while self.is_blocked:
+            time.sleep(0.01)
+        if self.failures:
+            written = self.failures.pop(0)
+            if written:
+                self.collection.bulk_write(requests[:written], ordered=ordered)
+            raise pymongo.errors.AutoReconnect("connection lost")
+        return self.collection.bulk_write(requests, ordered=ordered)
@@ -0,0 +1,169 @@
+import threading
+
+import pika.exceptions
+import pytest
+
+from tools import rabbitmq_common_tools
+from tools.rabbitmq_common_tools import RabbitMQPublisher
+
+
+class FakeChannel:
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.published = []
+        self.errors = []
+
+    @property
+    def is_open(self):
+        return self.connection.is_open
+
+    def confirm_delivery(self):
+        pass
+
+    def basic_publish(self, exchange, routing_key, body, properties=None):
+        if self.errors:
+            error = self.errors.pop(0)
+            if isinstance(error, pika.exceptions.ChannelWrongStateError):
+                self.connection.is_open = False  # the connection was closed while publishing
+            raise error
+        self.published.append((exchange, routing_key, body))
+
+
+class FakeConnection:
+    opened = []
+
+    def __init__(self, parameters):
+        self.is_open = True
+        self.owner = threading.current_thread()
+        self.closed_by = None
+        self._channel = FakeChannel(self)
+        FakeConnection.opened.append(self)
+
+    def channel(self):
+        return self._channel
+
+    def close(self):
+        self.is_open = False
+        self.closed_by = threading.current_thread()
+
+
+@pytest.fixture
+def publisher(monkeypatch):
+    monkeypatch.setenv("BRISE_EVENT_SERVICE_HOST", "localhost")
+    monkeypatch.setenv("BRISE_EVENT_SERVICE_AMQP_PORT", "5672")
+    monkeypatch.setattr(rabbitmq_common_tools.pika, "BlockingConnection", FakeConnection)
+    FakeConnection.opened = []
+    RabbitMQPublisher._instance = None
+    yield RabbitMQPublisher()
+    RabbitMQPublisher._instance = None
+
+
+def run_in_thread(function):
+    thread = threading.Thread(target=function)
+    thread.start()
+    thread.join()
+    return thread
+
+
+def test_0_connection_per_thread(publisher):
+    # Test #0. Publish several messages from the main thread and from another thread
+    # Expected result: every thread reuses its own connection
+    publisher.publish("exchange", "key", "first")
+    publisher.publish("exchange", "key", "second")
+    run_in_thread(lambda: publisher.publish("exchange", "key", "third"))
+    assert len(FakeConnection.opened) == 2
+    main_connection, thread_connection = FakeConnection.opened
+    assert [message[2] for message in main_connection.channel().published] == ["first", "second"]
+    assert [message[2] for message in thread_connection.channel().published] == ["third"]
+
+
+def test_1_shutdown_closes_connections_in_their_threads(publisher):
+    # Test #1. Shutdown the publisher from the main thread, while another publishing thread is running
+    # Expected result: the connections of the caller and of a finished thread are closed at once,
+    # the connection of the running thread is closed by this thread on its next publishing
+    published, shutdown_done, finished = threading.Event(), threading.Event(), threading.Event()
+
+    def running():
+        publisher.publish("exchange", "key", "before")
+        published.set()
+        shutdown_done.wait(5)
+        publisher.publish("exchange", "key", "after")
+        finished.set()
+
+    run_in_thread(lambda: publisher.publish("exchange", "key", "finished thread"))
+    running_thread = threading.Thread(target=running)
+    running_thread.start()
+    publisher.publish("exchange", "key", "main")
+    assert published.wait(5)
+    finished_connection, running_connection, main_connection = FakeConnection.opened
+
+    publisher.shutdown()
+    assert main_connection.closed_by is threading.current_thread()
+    assert finished_connection.closed_by is threading.current_thread()
+    assert running_connection.is_open
+
+    shutdown_done.set()
+    assert finished.wait(5)
+    running_thread.join()
+    assert running_connection.closed_by is running_thread
+    assert FakeConnection.opened[-1].channel().published == [("exchange", "key", "after")]
+    assert FakeConnection.opened[-1].is_open
+
+
+def test_2_publish_after_closing_the_channel(publisher, caplog):
+    # Test #2. The channel is closed while publishing
+    # Expected result: the message is dropped with a warning, as before the connection pooling
+    channel = publisher._get_channel()
+    channel.errors.append(pika.exceptions.ChannelWrongStateError("Channel is closed."))
+    publisher.publish("exchange", "key", "message")
+    assert "Attempt to send a message after closing the connection" in caplog.text
+    assert channel.published == []
+    assert len(FakeConnection.opened) == 1
+
+
+def test_3_reconnect_on_connection_errors(publisher):
+    # Test #3. The connection is lost while publishing
+    # Expected result: the message is published through a new connection, persistent errors are raised
+    publisher.publish("exchange", "key", "first")
+    FakeConnection.opened[0].channel().errors.append(pika.exceptions.StreamLostError("lost"))
+    publisher.publish("exchange", "key", "second")
+    assert len(FakeConnection.opened) == 2
+    assert not FakeConnection.opened[0].is_open
+    assert FakeConnection.opened[1].channel().published == [("exchange", "key", "second")]
+
+    original_channel = FakeConnection.channel
+
+    def failing_channel(connection):
+        channel = original_channel(connection)
+        channel.errors.append(pika.exceptions.StreamLostError("lost"))
+        return channel
+
+    FakeConnection.channel = failing_channel
+    try:
+        publisher._local.channel = None
+        with pytest.raises(pika.exceptions.StreamLostError):
+            publisher.publish("exchange", "key", "third")
+    finally:
+        FakeConnection.channel = original_channel
+    assert len(FakeConnection.opened) == 2 + publisher.max_attempts
+
+
+def test_4_single_instance_from_several_threads(publisher):
+    # Test #4. Request the publisher from several threads at once
+    # Expected result: all threads get the same instance
+    RabbitMQPublisher._instance = None
+    barrier = threading.Barrier(8)
+    instances = []
+
+    def create():
+        barrier.wait()
+        instances.append(RabbitMQPublisher())
+
+    threads = [threading.Thread(target=create) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(instances) == 8
+    assert all(instance is instances[0] for instance in instances)
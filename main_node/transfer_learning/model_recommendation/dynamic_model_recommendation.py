@@ -40,8 +40,8 @@ class DynamicModelRecommendation(ModelRecommendation):
         :return: a mapping of region to model to be used by predictor
         """
         if not self.was_model_recommended:
-            current_iteration = (self.database.get_last_record_by_experiment_id("Experiment_state", self.experiment_id)[
-                "Number_of_measured_configs"])
+            current_iteration = (self.database.get_last_record_by_experiment_id(
+                "Experiment_state", self.experiment_id, ["Number_of_measured_configs"])["Number_of_measured_configs"])
 
             if self.recommendation_granularity_value != np.inf:
                 if current_iteration % self.recommendation_granularity_value != 0:
@@ -139,8 +139,8 @@ class DynamicModelRecommendation(ModelRecommendation):
                 return None
             else:
                 mapping_region_model = {}
-                search_space: SearchSpace = pickle.loads(self.database.get_last_record_by_experiment_id
-                                                         ("Search_space", self.experiment_id)["SearchspaceObject"])
+                search_space: SearchSpace = pickle.loads(self.database.get_last_record_by_experiment_id(
+                    "Search_space", self.experiment_id, ["SearchspaceObject"])["SearchspaceObject"])
 
                 models_types = []
                 for i in self.experiment_description["ConfigurationSelection"]["Predictor"].items():
@@ -23,7 +23,8 @@ class OldNewRatioDecorator(MultiTaskLearningDecorator):
         return transferred_configurations
 
     def _filter_configurations(self, configurations: List[Configuration]) -> List[Configuration]:
-        measured_configurations = self.database.get_records_by_experiment_id("Configuration", self.experiment_id)
-        number_of_configs_to_transfer = round(len(measured_configurations) * self.old_new_configs_ratio)
+        number_of_measured_configurations = \
+            self.database.count_records_by_experiment_id("Configuration", self.experiment_id)
+        number_of_configs_to_transfer = round(number_of_measured_configurations * self.old_new_configs_ratio)
         configs_to_transfer = configurations[:number_of_configs_to_transfer]
         return configs_to_transfer
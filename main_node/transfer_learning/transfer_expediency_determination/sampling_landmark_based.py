@@ -48,12 +48,12 @@ class SamplingLandmarkBased(TransferExpediencyAnalyser):
                 clustering_key])
 
     def analyse_experiments_similarity(self) -> Union[List, None]:
-        if self.database.get_last_record_by_experiment_id("Experiment_state", self.experiment_id) is None:
+        experiment_state = self.database.get_last_record_by_experiment_id(
+            "Experiment_state", self.experiment_id, ["Number_of_measured_configs"])
+        if experiment_state is None:
             return None
         # get similar experiments
-        number_of_measured_configurations = \
-            self.database.get_last_record_by_experiment_id("Experiment_state", self.experiment_id)[
-                "Number_of_measured_configs"]
+        number_of_measured_configurations = experiment_state["Number_of_measured_configs"]
         if number_of_measured_configurations < self.min_number_of_samples:
             return None
         elif len(self.similar_experiments) > 0:
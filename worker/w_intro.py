@@ -1,14 +1,19 @@
+import collections
 import ctypes
+import functools
 import json
 import logging
 import os
 import threading
+import time
+import uuid
 
 import pika
 import pika.exceptions
 from worker_tools.reflective_worker_method_import import (
     get_worker_methods_as_dict
 )
+from worker_tools.task_slot import TaskSlot
 
 logging.basicConfig()
 
@@ -17,20 +22,38 @@ class WorkerMainThread(threading.Thread):
     """
     This class runs main worker process in a separate thread,
     connected to the `task_queue` as a consumer and sends messages when a task starts  to `taken_task_event_queue`
-    and sends a result of task to `task_result_exchange` and `finished_task_event_queue`
+    and sends a result of task to `task_result_exchange` and `finished_task_event_queue`.
+    Tasks are executed concurrently in several slots (see TaskSlot), every slot consumes the `task_queue`
+    through its own channel with `prefetch_count=1`, therefore the number of consumers of the queue
+    is the number of slots, which the main node schedules against.
+    The worker periodically broadcasts a heartbeat with the number of slots, the number of busy slots (in-flight)
+    and the average duration of its recent tasks to `worker_heartbeat_sender`.
     """
-    def __init__(self, host, port):
+    def __init__(self, host, port, number_of_slots: int = None):
         """
         :param host: ip address of rabbitmq service
         :param port: port of rabbitmq main-service
+        :param number_of_slots: number of concurrently executed tasks,
+        by default `BRISE_WORKER_SLOTS` or the number of cores.
         """
         super(WorkerMainThread, self).__init__()
         self.connection = pika.BlockingConnection(pika.ConnectionParameters(host, port))
-
-        self.channel = self.connection.channel()
-        self.channel.basic_qos(prefetch_count=1)  # prefetch_count is a parameter that limited number of taken task
-        self.channel.basic_consume(queue='task_queue',
-                                   on_message_callback=self.run_task)
+        self.number_of_slots = number_of_slots or int(os.getenv("BRISE_WORKER_SLOTS", "0")) or os.cpu_count() or 1
+        self.slots = []
+        for index in range(self.number_of_slots):
+            slot = TaskSlot(index)
+            channel = self.connection.channel()
+            channel.basic_qos(prefetch_count=1)  # prefetch_count is a parameter that limited number of taken task
+            channel.basic_consume(queue='task_queue',
+                                  on_message_callback=functools.partial(self.run_task, slot))
+            slot.start()
+            self.slots.append(slot)
+        self.worker_id = f"{os.uname()[1]}-{uuid.uuid4().hex[:8]}"
+        self.heartbeat_interval = float(os.getenv("BRISE_WORKER_HEARTBEAT_INTERVAL", "2"))
+        self.heartbeat_channel = self.connection.channel()
+        self._last_heartbeat_time = None
+        self.in_flight = 0
+        self.recent_task_durations = collections.deque(maxlen=20)
         self.task_dict = {}
         # Generate object with available executable methods
         self.worker_methods = get_worker_methods_as_dict()
@@ -58,56 +81,107 @@ class WorkerMainThread(threading.Thread):
         if res > 1:
             ctypes.pythonapi.PyThreadState_SetAsyncExc(thread_id, 0)
         self.connection.close()
+        for slot in self.slots:
+            slot.stop()
 
-    def run_task(self, ch, method, properties, body):
-        task: dict = json.loads(body)
-        global CURRENT_TASK_ID
-        CURRENT_TASK_ID = task["task_id"]
-        self.logger.info(f"Got task: {task['task_name']} ID: {task['task_id']}.")
+    def terminate_task(self, task_id: str) -> None:
+        """
+        Terminate the task in the slot, which executes it. Other slots are not affected.
+        :param task_id: ID of the task to terminate.
+        """
+        for slot in self.slots:
+            if slot.terminate_task(task_id):
+                return
 
-        if 'task_name' not in task.keys():
-            self.logger.error(f"No task name provided in {task}")
+    def run_task(self, slot, ch, method, properties, body):
+        """
+        Pass a task or a micro-batch of tasks (a common task description with the list of `tasks`) to the slot,
+        the results of a batch are sent back by one message.
+        """
+        message: dict = json.loads(body)
+        if "tasks" in message:
+            common_description = {key: value for key, value in message.items() if key != "tasks"}
+            tasks = [{**common_description, **task} for task in message["tasks"]]
         else:
+            tasks = [message]
+        for task in tasks:
+            self.logger.info(f"Got task: {task.get('task_name')} ID: {task.get('task_id')} in slot {slot.index}.")
+            if 'task_name' not in task.keys():
+                self.logger.error(f"No task name provided in {task}")
+                return
             if not task['task_name'] in self.worker_methods:
                 # if worker don't have method
                 self.logger.error(f'Task {task["task_name"]} is not supported. '
                                   f'Supported Tasks are: {list(self.worker_methods.keys())}.')
-            else:
-                # pointer to method execution
-                w_method = self.worker_methods[task["task_name"]]
-
-                # Execute task
-                try:
-                    result_from_worker = w_method(task)
-                    if result_from_worker is None:
-                        self.logger.warning(f"{w_method} did not return any results.")
-                        result_from_worker = {}
-                except Exception as e:
-                    self.logger.error(f"Task execution failed with: {e}", exc_info=True)
-                    result_from_worker = {}
-                # format a result according to result structure
-                for key in task["result_structure"]:
-                    if key not in result_from_worker:
-                        result_from_worker[key] = None
-                res = {
-                    'id_measurement': task["id_measurement"],
-                    'task_result': {
-                        'task id': task["task_id"],
-                        'worker': f"{os.uname()[1]}",
-                        'result': result_from_worker
-                    }
-                }
-                self.channel.basic_publish(exchange='task_result_exchange',
-                                           routing_key=task["experiment_id"],
-                                           body=json.dumps(res))
-                self.channel.basic_publish(exchange='',
-                                           routing_key='finished_task_event_queue',
-                                           body=json.dumps(res))
-                ch.basic_ack(delivery_tag=method.delivery_tag)  # acknowledge that task was finished
+                return
+        start_time = time.perf_counter()
+        self.in_flight += 1  # number of busy slots
+
+        def report(results):
+            # called from the slot thread, while the channel could be used only from the connection thread
+            duration = time.perf_counter() - start_time
+            self.connection.add_callback_threadsafe(
+                functools.partial(self.send_results, ch, method, message, tasks, results, duration))
+
+        slot.submit(tasks, report)
+
+    def send_results(self, ch, method, message: dict, tasks: list, results: list, duration: float):
+        self.in_flight -= 1
+        self.recent_task_durations.append(duration / len(tasks))
+        task_results = [self.format_result(task, result) for task, result in zip(tasks, results)]
+        res = {'id_measurement': message["id_measurement"]}
+        if "tasks" in message:
+            res['task_results'] = task_results
+        else:
+            res['task_result'] = task_results[0]
+        # the execution time is used by the main node to choose the size of micro-batches
+        res['duration'] = duration
+        ch.basic_publish(exchange='task_result_exchange',
+                         routing_key=message["experiment_id"],
+                         body=json.dumps(res))
+        ch.basic_publish(exchange='',
+                         routing_key='finished_task_event_queue',
+                         body=json.dumps(res))
+        ch.basic_ack(delivery_tag=method.delivery_tag)  # acknowledge that task was finished
+
+    def send_heartbeat(self):
+        heartbeat = {
+            'worker_id': self.worker_id,
+            'slots': self.number_of_slots,
+            'in_flight': self.in_flight,
+            'task_duration': sum(self.recent_task_durations) / len(self.recent_task_durations)
+            if self.recent_task_durations else None,
+            'interval': self.heartbeat_interval
+        }
+        self.heartbeat_channel.basic_publish(exchange='worker_heartbeat_sender',
+                                             routing_key='',
+                                             body=json.dumps(heartbeat))
+        self._last_heartbeat_time = time.monotonic()
+
+    @staticmethod
+    def format_result(task: dict, result_from_worker: dict) -> dict:
+        """
+        :param task: task description.
+        :param result_from_worker: result of the task execution (empty if the execution failed).
+        :return: task result in the result structure.
+        """
+        for key in task["result_structure"]:
+            if key not in result_from_worker:
+                result_from_worker[key] = None
+        return {
+            'task id': task["task_id"],
+            'worker': f"{os.uname()[1]}",
+            'result': result_from_worker
+        }
 
     def run(self):
         try:
-            self.channel.start_consuming()
+            # callbacks of all slot channels, as well as the results of the slots, are processed here
+            while self.connection.is_open:
+                if self._last_heartbeat_time is None or \
+                        time.monotonic() - self._last_heartbeat_time >= self.heartbeat_interval:
+                    self.send_heartbeat()
+                self.connection.process_data_events(time_limit=min(self.heartbeat_interval, 1))
 
         except pika.exceptions.AMQPError:
             pass  # in case of termination task
@@ -120,14 +194,16 @@ class WorkerTerminationThread(threading.Thread):
     """
     This class runs worker termination functionality in a separate thread,
     create a dynamic queue, bind the queue to `task_termination_sender`
-    and consumes this queue and terminate worker process according to termination message
+    and consumes this queue and terminate the task according to termination message
     """
-    def __init__(self, host, port):
+    def __init__(self, host, port, worker_thread: WorkerMainThread):
         """
         :param host: ip address of rabbitmq service
         :param port: port of rabbitmq main-service
+        :param worker_thread: worker, which slots execute the tasks
         """
         super(WorkerTerminationThread, self).__init__()
+        self.worker_thread = worker_thread
         self.connection = pika.BlockingConnection(pika.ConnectionParameters(host, port))
 
         self.channel = self.connection.channel()
@@ -162,29 +238,27 @@ class WorkerTerminationThread(threading.Thread):
             ctypes.pythonapi.PyThreadState_SetAsyncExc(thread_id, 0)
 
     def terminate_task(self, ch, method, properties, body):
-        global CURRENT_TASK_ID
         task_id = json.loads(body.decode())
-        if CURRENT_TASK_ID == task_id:
-            self.connection.close()
-            self.raise_exception()  # cash termination thread
+        # only the slot of the task is restarted, the task is reported with the empty result
+        self.worker_thread.terminate_task(task_id)
 
     def run(self):
         while self.channel._consumer_infos:
             self.channel.connection.process_data_events(time_limit=1)  # 1 second
 
 
-CURRENT_TASK_ID = ""
-
 # Basic functionality
-while True:
-    w_thread = WorkerMainThread(os.getenv("BRISE_EVENT_SERVICE_HOST"), os.getenv("BRISE_EVENT_SERVICE_AMQP_PORT"))
-    t_thread = WorkerTerminationThread(os.getenv("BRISE_EVENT_SERVICE_HOST"),
-                                       os.getenv("BRISE_EVENT_SERVICE_AMQP_PORT"))
-    try:
-        w_thread.start()
-        t_thread.start()
-        t_thread.join()
-    finally:
-        # in case of termination thread was crashed or finished crash worker thread and restart
-        w_thread.raise_exception()
-        w_thread.join()
+# the guard is required, since the slot processes are spawned and import the main module
+if __name__ == "__main__":
+    while True:
+        w_thread = WorkerMainThread(os.getenv("BRISE_EVENT_SERVICE_HOST"), os.getenv("BRISE_EVENT_SERVICE_AMQP_PORT"))
+        t_thread = WorkerTerminationThread(os.getenv("BRISE_EVENT_SERVICE_HOST"),
+                                           os.getenv("BRISE_EVENT_SERVICE_AMQP_PORT"), w_thread)
+        try:
+            w_thread.start()
+            t_thread.start()
+            t_thread.join()
+        finally:
+            # in case of termination thread was crashed or finished crash worker thread and restart
+            w_thread.raise_exception()
+            w_thread.join()
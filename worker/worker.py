@@ -8,7 +8,7 @@ def test(task: dict):
 
 def energy_consumption(task: dict):
     from random import choice
-    from worker_tools.splitter import Splitter
+    from worker_tools.scenario_cache import ScenarioCache
 
     frequency_parameter_mapping = {
         "Context.SearchSpace.frequency.twelve_hundred_hertz": "1200.0",
@@ -40,10 +40,10 @@ def energy_consumption(task: dict):
 
     try:
         logging.info(task['parameters']['frequency'])
-        data = Splitter("scenarios/energy_consumption/" + task['Scenario']['ws_file'])
-        data.search(frequency_parameter_mapping[task['parameters']['frequency']],
-                    threads_parameter_mapping[task['parameters']['threads']])
-        result = choice(data.new_data)
+        # the scenario file is parsed once per process and indexed by the frequency and the number of threads
+        data = ScenarioCache().get("scenarios/energy_consumption/" + task['Scenario']['ws_file'], ("FR", "TR"))
+        result = choice(data.get_rows((frequency_parameter_mapping[task['parameters']['frequency']],
+                                       threads_parameter_mapping[task['parameters']['threads']])))
         return {
             'energy': float(result["EN"]),
             'time': float(result['TIM'])
@@ -1,4 +1,6 @@
 __all__ = [
     "reflective_worker_method_import",
-    "splitter"
+    "scenario_cache",
+    "splitter",
+    "task_slot"
 ]
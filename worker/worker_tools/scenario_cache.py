@@ -0,0 +1,96 @@
+import csv
+import logging
+import mmap
+import os
+import threading
+from typing import Dict, List, Tuple
+
+from worker_tools.singleton import Singleton
+
+
+class ScenarioData:
+    """
+    Rows of a scenario CSV file, indexed by the values of the key columns.
+
+    The file is memory-mapped (read into memory, if it could not be mapped), so the slot processes of a worker share
+    its pages. The index keeps only the offsets of the lines, a line is parsed when it is requested.
+    Quoted values with line breaks are not supported.
+    """
+
+    def __init__(self, file_name: str, key_columns: Tuple[str, ...]):
+        """
+        :param file_name: path to the CSV file with a header.
+        :param key_columns: names of the columns, which values form the key of a row.
+        """
+        self.file_name = file_name
+        self.key_columns = tuple(key_columns)
+        with open(file_name, 'rb') as csv_file:
+            stat = os.fstat(csv_file.fileno())
+            self.version = (stat.st_mtime_ns, stat.st_size)
+            try:
+                self._buffer = mmap.mmap(csv_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                self._buffer = csv_file.read()  # e.g. an empty file could not be mapped
+        self._index: Dict[Tuple[str, ...], List[Tuple[int, int]]] = {}
+        self.header = []
+        self._build_index()
+
+    def _build_index(self) -> None:
+        lines = self._iterate_lines()
+        header = next(lines, None)
+        if header is None:
+            return
+        self.header = self._parse(*header)
+        key_positions = [self.header.index(column) for column in self.key_columns]
+        for start, end in lines:
+            values = self._parse(start, end)
+            if values:
+                key = tuple(values[position] for position in key_positions)
+                self._index.setdefault(key, []).append((start, end))
+
+    def _iterate_lines(self):
+        position = 0
+        size = len(self._buffer)
+        while position < size:
+            end = self._buffer.find(b"\n", position)
+            end = size if end == -1 else end
+            yield position, end
+            position = end + 1
+
+    def _parse(self, start: int, end: int) -> List[str]:
+        line = self._buffer[start:end].decode().rstrip("\r")
+        return next(csv.reader([line]), [])
+
+    def get_rows(self, key: Tuple[str, ...]) -> List[Dict[str, str]]:
+        """
+        :param key: values of the key columns (as they are written in the file).
+        :return: all rows with this key as mappings column name -> value, in the order of the file.
+        """
+        return [dict(zip(self.header, self._parse(start, end))) for start, end in self._index.get(tuple(key), [])]
+
+
+class ScenarioCache(metaclass=Singleton):
+    """
+    Process-wide cache of the scenario files: every file is loaded and indexed once, while it is not modified.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._data: Dict[Tuple[str, Tuple[str, ...]], ScenarioData] = {}
+        self._lock = threading.Lock()
+
+    def get(self, file_name: str, key_columns: Tuple[str, ...]) -> ScenarioData:
+        """
+        :param file_name: path to the scenario CSV file.
+        :param key_columns: names of the columns, which values form the key of a row.
+        :return: indexed data of the file.
+        """
+        cache_key = (os.path.abspath(file_name), tuple(key_columns))
+        stat = os.stat(file_name)
+        with self._lock:
+            data = self._data.get(cache_key)
+            if data is None or data.version != (stat.st_mtime_ns, stat.st_size):
+                self.logger.debug(f"Loading scenario {file_name}.")
+                data = ScenarioData(file_name, key_columns)
+                self._data[cache_key] = data
+            return data
@@ -1,3 +1,6 @@
+import threading
+
+
 class Singleton(type):
     """
             Meta class. Ensures that instances of it (regular class) has only one instance
@@ -10,8 +13,12 @@ class Singleton(type):
     def __init__(cls, name, bases, attrs, **kwargs):
         super().__init__(name, bases, attrs)
         cls._instance = None
+        cls._instance_lock = threading.Lock()
 
     def __call__(cls, *args, **kwargs):
         if cls._instance is None:
-            cls._instance = super().__call__(*args, **kwargs)
+            # the instance could be requested by several threads at once
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super().__call__(*args, **kwargs)
         return cls._instance
@@ -3,8 +3,6 @@ import logging
 
 
 class Splitter:
-    data = []
-    new_data = []
     param_list = {'app': "app4", 'flac': "cr_audio1.flac", 'wav': "cr_audio1.wav",
                   'enw8': "enwik8", 'enw9': "enwik9", 'game': "game1",
                   '01': "01", '02': "02", '03': "03", '04': "04", '05': "05", '06': "06", '07': "07",
@@ -15,7 +13,9 @@ class Splitter:
 
     def __init__(self, file_name):
         self.logger = logging.getLogger(__name__)
-        del self.data[:]
+        # rows are kept by the instance, since concurrently executed tasks use their own Splitters
+        self.data = []
+        self.new_data = []
         try:
             with open(file_name, 'r') as csv_file:
                 reader = csv.DictReader(csv_file)
@@ -0,0 +1,124 @@
+import logging
+import multiprocessing
+import queue
+import threading
+from typing import Callable, List
+
+from worker_tools.reflective_worker_method_import import get_worker_methods_as_dict
+
+
+def serve_tasks(connection) -> None:
+    """
+    Loop of a slot process: receives task descriptions from the pipe, executes them and sends back the results.
+    :param connection: end of the pipe in the slot process.
+    """
+    logging.basicConfig()
+    logger = logging.getLogger(__name__)
+    worker_methods = get_worker_methods_as_dict()
+    while True:
+        try:
+            task = connection.recv()
+        except EOFError:
+            return  # the worker was stopped
+        try:
+            result = worker_methods[task["task_name"]](task)
+            if result is None:
+                logger.warning(f"{task['task_name']} did not return any results.")
+                result = {}
+        except Exception as e:
+            logger.error(f"Task execution failed with: {e}", exc_info=True)
+            result = {}
+        connection.send(result)
+
+
+class TaskSlot(threading.Thread):
+    """
+    One slot of a worker: executes tasks one by one in a dedicated process.
+
+    Every slot has its own process, so a task, which crashes the process (or is terminated), affects only its slot:
+    the task is reported with the empty result and the process is restarted for the next task.
+    """
+
+    def __init__(self, index: int):
+        """
+        :param index: number of the slot in the worker.
+        """
+        super(TaskSlot, self).__init__(name=f"task-slot-{index}", daemon=True)
+        self.index = index
+        self.logger = logging.getLogger(__name__)
+        # the worker holds open connections and threads, which should not be forked
+        self._context = multiprocessing.get_context("spawn")
+        self._process = None
+        self._connection = None
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self.current_task_id = None
+
+    def submit(self, tasks: List[dict], callback: Callable[[List[dict]], None]) -> None:
+        """
+        Execute the tasks (a task or a micro-batch) in this slot.
+        :param tasks: task descriptions.
+        :param callback: called from the slot thread with the list of results, in the order of the tasks.
+        """
+        self._queue.put((tasks, callback))
+
+    def run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            tasks, callback = item
+            results = [self._execute(task) for task in tasks]
+            try:
+                callback(results)
+            except Exception as e:
+                # e.g. the connection of the worker was closed, the task will be redelivered by the broker
+                self.logger.error(f"Unable to report results of slot {self.index}: {e}")
+        self._stop_process()
+
+    def stop(self) -> None:
+        self._queue.put(None)
+
+    def terminate_task(self, task_id: str) -> bool:
+        """
+        Kill the process of this slot, if it executes the task.
+        :param task_id: ID of the task to terminate.
+        :return: whether the task was executed by this slot.
+        """
+        with self._lock:
+            if self.current_task_id != task_id or self._process is None:
+                return False
+            self.logger.warning(f"Terminating task {task_id} in slot {self.index}.")
+            self._process.kill()
+            return True
+
+    def _execute(self, task: dict) -> dict:
+        with self._lock:
+            if self._process is None or not self._process.is_alive():
+                self._start_process()
+            self.current_task_id = task["task_id"]
+        try:
+            self._connection.send(task)
+            return self._connection.recv()
+        except (EOFError, OSError):
+            self.logger.error(f"Slot {self.index} process stopped while executing task {task['task_id']}.")
+            with self._lock:
+                self._stop_process()
+            return {}
+        finally:
+            self.current_task_id = None
+
+    def _start_process(self) -> None:
+        self._connection, child_connection = self._context.Pipe()
+        self._process = self._context.Process(target=serve_tasks, args=(child_connection,), daemon=True)
+        self._process.start()
+        child_connection.close()
+
+    def _stop_process(self) -> None:
+        if self._process is not None:
+            self._connection.close()
+            self._process.join(timeout=1)
+            if self._process.is_alive():
+                self._process.kill()
+                self._process.join()
+            self._process = None
@@ -0,0 +1,68 @@
+import os
+import threading
+
+from worker_tools.scenario_cache import ScenarioCache
+from worker_tools.splitter import Splitter
+
+SCENARIO_FILE = os.path.join(os.path.dirname(__file__), "..", "..", "scenarios", "energy_consumption",
+                             "search_space_96", "results_01_full.csv")
+
+
+def test_0_rows_as_splitter():
+    # Test #0. Look up every (FR, TR) key of the energy consumption scenario in the index and by the Splitter
+    # Expected result: the indexed rows are the rows, found by the Splitter, in the same order
+    data = ScenarioCache().get(SCENARIO_FILE, ("FR", "TR"))
+    splitter = Splitter(SCENARIO_FILE)
+    keys = {(row["FR"], row["TR"]) for row in splitter.data}
+    assert len(keys) == 96
+    for fr, tr in keys:
+        rows = data.get_rows((fr, tr))
+        splitter.search(fr, tr)
+        assert rows == splitter.new_data
+    assert data.get_rows(("0.0", "0")) == []
+
+
+def test_1_reload_modified_file(tmp_path):
+    # Test #1. Get a scenario, then change its size and its modification time
+    # Expected result: the cached data is reused while the file is intact and reloaded after each change
+    file_name = str(tmp_path / "scenario.csv")
+    with open(file_name, "w") as csv_file:
+        csv_file.write("FR,TR,EN\n1200.0,16,10\n")
+    first = ScenarioCache().get(file_name, ("FR", "TR"))
+    assert ScenarioCache().get(file_name, ("FR", "TR")) is first
+
+    with open(file_name, "a") as csv_file:
+        csv_file.write("1200.0,16,20\n")
+    resized = ScenarioCache().get(file_name, ("FR", "TR"))
+    assert resized is not first
+    assert [row["EN"] for row in resized.get_rows(("1200.0", "16"))] == ["10", "20"]
+
+    with open(file_name, "w") as csv_file:
+        csv_file.write("FR,TR,EN\n1200.0,16,30\n1200.0,16,40\n")  # the same size
+    os.utime(file_name, ns=(resized.version[0] + 10 ** 9, resized.version[0] + 10 ** 9))
+    touched = ScenarioCache().get(file_name, ("FR", "TR"))
+    assert touched is not resized
+    assert [row["EN"] for row in touched.get_rows(("1200.0", "16"))] == ["30", "40"]
+
+
+def test_2_concurrent_tasks(tmp_path):
+    # Test #2. Get the same scenario from several threads at once, as the concurrently running tasks do
+    # Expected result: the file is indexed once, all threads get the same data
+    file_name = str(tmp_path / "scenario.csv")
+    with open(file_name, "w") as csv_file:
+        csv_file.write("FR,TR,EN\n" + "".join(f"{fr}.0,{tr},{fr * tr}\n" for fr in range(100) for tr in range(32)))
+    number_of_threads = 8
+    barrier = threading.Barrier(number_of_threads)
+    results = [None] * number_of_threads
+
+    def get(position):
+        barrier.wait()
+        results[position] = ScenarioCache().get(file_name, ("FR", "TR"))
+
+    threads = [threading.Thread(target=get, args=(position,)) for position in range(number_of_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(data is results[0] for data in results)
+    assert results[0].get_rows(("99.0", "31")) == [{"FR": "99.0", "TR": "31", "EN": "3069"}]
@@ -0,0 +1,102 @@
+import threading
+import time
+
+import pytest
+
+from worker_tools.task_slot import TaskSlot
+
+WORKER_MODULE = '''
+import os
+import time
+
+
+def double(task):
+    return {"result": task["parameters"]["x"] * 2}
+
+
+def crash(task):
+    os._exit(1)
+
+
+def sleep(task):
+    time.sleep(task["parameters"]["seconds"])
+    return {"result": 0}
+'''
+
+
+class Results:
+    """
+    Results, reported by a slot to its callback.
+    """
+    def __init__(self):
+        self.items = []
+        self.received = threading.Event()
+
+    def callback(self, results):
+        self.items.append(results)
+        self.received.set()
+
+
+@pytest.fixture
+def worker_directory(tmp_path, monkeypatch):
+    # slot processes load the tasks from the closest to "worker" module in the working directory
+    (tmp_path / "worker.py").write_text(WORKER_MODULE)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+
+
+def get_task(task_id: str, task_name: str, **parameters) -> dict:
+    return {"task_id": task_id, "task_name": task_name, "parameters": parameters}
+
+
+def wait_for_task(slot: TaskSlot, task_id: str) -> None:
+    deadline = time.time() + 30
+    while slot.current_task_id != task_id:
+        assert time.time() < deadline, f"Task {task_id} was not started."
+        time.sleep(0.01)
+
+
+def test_0_restart_after_killed_process(worker_directory):
+    # Test #0. Execute a task, which kills the process of the slot, then a regular task
+    # Expected result: the killed task gets the empty result, the process is restarted for the next task
+    slot = TaskSlot(0)
+    slot.start()
+    results = Results()
+    slot.submit([get_task("1", "double", x=2)], results.callback)
+    assert results.received.wait(30)
+    first_process = slot._process
+
+    results.received.clear()
+    slot.submit([get_task("2", "crash"), get_task("3", "double", x=5)], results.callback)
+    assert results.received.wait(30)
+    assert results.items == [[{"result": 4}], [{}, {"result": 10}]]
+    assert slot._process is not first_process and slot._process.is_alive()
+    slot.stop()
+    slot.join(10)
+
+
+def test_1_terminate_only_matching_slot(worker_directory):
+    # Test #1. Terminate the task of one slot, while both slots execute long tasks
+    # Expected result: only the slot of the task is affected, the other slot completes its task
+    slots = [TaskSlot(0), TaskSlot(1)]
+    results = [Results(), Results()]
+    for slot, task, slot_results in zip(slots, [get_task("a", "sleep", seconds=5), get_task("b", "sleep", seconds=60)],
+                                        results):
+        slot.start()
+        slot.submit([task], slot_results.callback)
+    wait_for_task(slots[0], "a")
+    wait_for_task(slots[1], "b")
+
+    assert not slots[0].terminate_task("b")
+    assert slots[1].terminate_task("b")
+    assert results[1].received.wait(10)
+    assert results[1].items == [[{}]]
+    assert slots[0]._process.is_alive()
+    assert not results[0].received.is_set()
+    assert results[0].received.wait(30)
+    assert results[0].items == [[{"result": 0}]]
+    assert not slots[0].terminate_task("a")
+    for slot in slots:
+        slot.stop()
+        slot.join(10)
@@ -82,13 +82,15 @@ class WorkerServiceThread(threading.Thread):
         :param channel: pika.Channel
         :param method:  pika.spec.Basic.GetOk
         :param properties: pika.spec.BasicProperties
-        :param body: task description in bytes format
+        :param body: task (or micro-batch of tasks) result in bytes format
         """
         task_response = json.loads(body.decode())
-        try:
-            del (self.task_dict[task_response["task_result"]["task id"]])
-        except KeyError:
-            self.logger.info("The old task was received")
+        task_results = task_response.get("task_results", [task_response.get("task_result")])
+        for task_result in task_results:
+            try:
+                del (self.task_dict[task_result["task id"]])
+            except (KeyError, TypeError):
+                self.logger.info("The old task was received")
 
     def run(self):
         """